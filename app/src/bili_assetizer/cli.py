@@ -404,6 +404,9 @@ def extract_ocr_cmd(
     force: bool = typer.Option(
         False, "--force", "-f", help="Overwrite existing OCR results"
     ),
+    workers: int = typer.Option(
+        None, "--workers", help="Parallel tesseract processes (default: CPU count)"
+    ),
 ) -> None:
     """Extract OCR text from selected frames using Tesseract."""
     settings = get_settings()
@@ -415,6 +418,7 @@ def extract_ocr_cmd(
         psm=psm,
         tesseract_cmd=tesseract_cmd,
         force=force,
+        workers=workers,
     )
 
     # Display result
@@ -568,6 +572,11 @@ def extract_cmd(
         "eng+chi_sim", "--lang", "-l", help="Tesseract language codes"
     ),
     psm: int = typer.Option(6, "--psm", help="Tesseract page segmentation mode"),
+    ocr_workers: int = typer.Option(
+        None,
+        "--ocr-workers",
+        help="Parallel tesseract processes (default: CPU count)",
+    ),
     transcript_provider: str = typer.Option(
         "tencent", "--transcript-provider", help="ASR provider"
     ),
@@ -606,6 +615,7 @@ def extract_cmd(
         top_buckets=top_buckets,
         ocr_lang=lang,
         ocr_psm=psm,
+        ocr_workers=ocr_workers,
         transcript_provider=transcript_provider,
         transcript_format=transcript_format,
         until_stage=until,
@@ -1,13 +1,20 @@
 """Clean service for deleting asset artifacts."""
 
+import os
 import shutil
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from .db import get_connection, check_evidence_schema
+from .db import get_connection
 
+# Upper bound on concurrent directory removals in clean_all_assets; keeps
+# the disk queue from being flooded on large wipes.
+MAX_REMOVE_WORKERS = min(8, (os.cpu_count() or 1) * 2)
 
-@dataclass
+
+@dataclass(slots=True)
 class CleanResult:
     """Result of a clean operation."""
 
@@ -25,13 +32,16 @@ def list_assets(assets_dir: Path) -> list[str]:
     Returns:
         List of asset IDs (directory names).
     """
-    if not assets_dir.exists():
+    try:
+        with os.scandir(assets_dir) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    return [
-        d.name for d in assets_dir.iterdir() if d.is_dir() and not d.name.startswith(".")
-    ]
-
 
 def validate_path_safety(target: Path, data_dir: Path) -> None:
     """Validate that target path is safe to delete.
@@ -43,30 +53,114 @@ def validate_path_safety(target: Path, data_dir: Path) -> None:
     Raises:
         ValueError: If the path is unsafe.
     """
-    # Resolve to absolute paths
-    target = target.resolve()
-    data_dir = data_dir.resolve()
+    _validate_within_root(target, os.path.realpath(data_dir))
+
+
+def _validate_within_root(target: Path, root: str) -> None:
+    """Validate target against an already resolved root directory.
+
+    Callers checking many targets resolve the root once and reuse it, so each
+    check costs a single realpath() plus string comparisons.
+
+    Args:
+        target: The path to validate.
+        root: The allowed parent directory, as returned by os.path.realpath.
+
+    Raises:
+        ValueError: If the path is unsafe.
+    """
+    resolved = os.path.realpath(target)
 
     # Check for empty path
-    if not str(target) or str(target) in ("", ".", ".."):
+    if resolved in ("", ".", ".."):
         raise ValueError("Target path cannot be empty")
 
     # Check for root paths
-    if target == target.root or target == Path(target.anchor):
+    if os.path.dirname(resolved) == resolved:
         raise ValueError("Cannot delete root directory")
 
-    # Check if target is within data_dir
+    # Check if target is within root
     try:
-        target.relative_to(data_dir)
+        inside = os.path.commonpath([resolved, root]) == root
     except ValueError:
-        raise ValueError(f"Target path {target} is outside data directory {data_dir}")
+        # Different drives on Windows
+        inside = False
+    if not inside:
+        raise ValueError(f"Target path {resolved} is outside data directory {root}")
+
+
+# Cleanup statements in foreign-key order (children before parents).
+# SQLite doesn't enforce FKs by default, but we follow the schema order.
+_ASSET_DELETE_STATEMENTS = (
+    """
+    DELETE FROM embeddings
+    WHERE chunk_id IN (SELECT chunk_id FROM chunks WHERE asset_id = ?)
+    """,
+    "DELETE FROM chunks WHERE asset_id = ?",
+    "DELETE FROM frames WHERE asset_id = ?",
+    "DELETE FROM segments WHERE asset_id = ?",
+    "DELETE FROM asset_versions WHERE asset_id = ?",
+    "DELETE FROM assets WHERE asset_id = ?",
+)
+
+
+def _has_evidence_table(conn: sqlite3.Connection) -> bool:
+    """Check for the lazily created evidence table on an open connection."""
+    cursor = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='evidence'"
+    )
+    return cursor.fetchone() is not None
+
 
+def _has_db_records(conn: sqlite3.Connection, asset_id: str) -> bool:
+    """Cheaply probe whether the database holds anything for asset_id.
 
-def _delete_asset_from_db(asset_id: str, db_path: Path) -> list[str]:
-    """Delete asset records from database.
+    Checks the assets row (every per-asset table is written alongside it at
+    ingest) and the separately indexed evidence rows.
 
     Args:
-        asset_id: The asset ID to delete.
+        conn: Open database connection.
+        asset_id: The asset ID to look up.
+
+    Returns:
+        True if records exist.
+    """
+    cursor = conn.execute(
+        "SELECT 1 FROM assets WHERE asset_id = ? LIMIT 1", (asset_id,)
+    )
+    if cursor.fetchone() is not None:
+        return True
+    if _has_evidence_table(conn):
+        cursor = conn.execute(
+            "SELECT 1 FROM evidence WHERE asset_id = ? LIMIT 1", (asset_id,)
+        )
+        return cursor.fetchone() is not None
+    return False
+
+
+def _delete_asset_rows(conn: sqlite3.Connection, asset_ids: list[str]) -> None:
+    """Delete records for asset_ids in one write transaction on conn.
+
+    Each statement is executed once per table via executemany.
+
+    Args:
+        conn: Open database connection.
+        asset_ids: The asset IDs to delete.
+    """
+    params = [(asset_id,) for asset_id in asset_ids]
+    conn.execute("BEGIN IMMEDIATE")
+    if _has_evidence_table(conn):
+        conn.executemany("DELETE FROM evidence WHERE asset_id = ?", params)
+    for statement in _ASSET_DELETE_STATEMENTS:
+        conn.executemany(statement, params)
+    conn.commit()
+
+
+def _delete_assets_from_db(asset_ids: list[str], db_path: Path) -> list[str]:
+    """Delete records for one or more assets from the database.
+
+    Args:
+        asset_ids: The asset IDs to delete.
         db_path: Path to the database file.
 
     Returns:
@@ -74,47 +168,47 @@ def _delete_asset_from_db(asset_id: str, db_path: Path) -> list[str]:
     """
     errors: list[str] = []
 
-    if not db_path.exists():
+    if not asset_ids or not db_path.exists():
         return errors
 
     try:
         with get_connection(db_path) as conn:
-            # 0. Delete evidence rows if evidence schema exists
-            if check_evidence_schema(db_path):
-                conn.execute("DELETE FROM evidence WHERE asset_id = ?", (asset_id,))
-
-            # Delete in order due to foreign key constraints
-            # Note: SQLite doesn't enforce FKs by default, but we follow the schema order
-
-            # 1. Delete embeddings for chunks of this asset
-            conn.execute(
-                """
-                DELETE FROM embeddings
-                WHERE chunk_id IN (SELECT chunk_id FROM chunks WHERE asset_id = ?)
-                """,
-                (asset_id,),
-            )
-
-            # 2. Delete chunks
-            conn.execute("DELETE FROM chunks WHERE asset_id = ?", (asset_id,))
+            _delete_asset_rows(conn, asset_ids)
+    except Exception as e:
+        errors.append(f"Database error for {', '.join(asset_ids)}: {e}")
 
-            # 3. Delete frames
-            conn.execute("DELETE FROM frames WHERE asset_id = ?", (asset_id,))
+    return errors
 
-            # 4. Delete segments
-            conn.execute("DELETE FROM segments WHERE asset_id = ?", (asset_id,))
 
-            # 5. Delete asset_versions
-            conn.execute("DELETE FROM asset_versions WHERE asset_id = ?", (asset_id,))
+def _try_rmtree(asset_path: Path) -> OSError | None:
+    """Remove an asset directory, returning the error instead of raising."""
+    try:
+        shutil.rmtree(asset_path)
+    except OSError as e:
+        return e
+    return None
 
-            # 6. Delete asset
-            conn.execute("DELETE FROM assets WHERE asset_id = ?", (asset_id,))
 
-            conn.commit()
-    except Exception as e:
-        errors.append(f"Database error for {asset_id}: {e}")
+def _record_removal(
+    asset_path: Path, error: OSError | None, db_ok: bool, result: CleanResult
+) -> None:
+    """Record the outcome of removing one asset directory in result.
 
-    return errors
+    Args:
+        asset_path: The asset directory that was removed.
+        error: The error raised during removal, if any.
+        db_ok: Whether the asset's database records were deleted cleanly.
+        result: CleanResult to update.
+    """
+    if error is None:
+        result.deleted_paths.append(str(asset_path))
+        result.deleted_count += 1
+    elif isinstance(error, FileNotFoundError):
+        # Asset directory doesn't exist, but we still cleaned DB
+        if db_ok:
+            result.deleted_count += 1
+    else:
+        result.errors.append(f"Failed to delete {asset_path}: {error}")
 
 
 def clean_asset(asset_id: str, assets_dir: Path, db_path: Path) -> CleanResult:
@@ -138,22 +232,27 @@ def clean_asset(asset_id: str, assets_dir: Path, db_path: Path) -> CleanResult:
         result.errors.append(str(e))
         return result
 
-    # Delete from database first
-    db_errors = _delete_asset_from_db(asset_id, db_path)
+    # Delete from database first, probing and deleting on one connection.
+    # Without a directory on disk, skip the write transaction unless the
+    # database actually holds records.
+    dir_exists = os.path.lexists(asset_path)
+    db_errors: list[str] = []
+    if db_path.exists():
+        try:
+            with get_connection(db_path) as conn:
+                if dir_exists or _has_db_records(conn, asset_id):
+                    _delete_asset_rows(conn, [asset_id])
+        except Exception as e:
+            db_errors.append(f"Database error for {asset_id}: {e}")
     result.errors.extend(db_errors)
 
     # Delete filesystem
-    if asset_path.exists():
-        try:
-            shutil.rmtree(asset_path)
-            result.deleted_paths.append(str(asset_path))
-            result.deleted_count = 1
-        except OSError as e:
-            result.errors.append(f"Failed to delete {asset_path}: {e}")
-    else:
+    if not dir_exists:
         # Asset directory doesn't exist, but we still cleaned DB
         if not db_errors:
             result.deleted_count = 1
+        return result
+    _record_removal(asset_path, _try_rmtree(asset_path), not db_errors, result)
 
     return result
 
@@ -163,6 +262,11 @@ def clean_all_assets(
 ) -> CleanResult:
     """Delete all assets (database records + filesystem).
 
+    Database records for every asset are deleted in one transaction before
+    any directory is removed. Directories are then removed by up to
+    MAX_REMOVE_WORKERS threads. No fsync/sync is issued for the removals;
+    the only forced flush is the database COMMIT.
+
     Args:
         assets_dir: Path to the assets directory.
         db_path: Path to the database file.
@@ -177,10 +281,32 @@ def clean_all_assets(
     if asset_ids is None:
         asset_ids = list_assets(assets_dir)
 
+    # Validate path safety against a root resolved once for all assets
+    root = os.path.realpath(assets_dir)
+    safe_ids: list[str] = []
     for asset_id in asset_ids:
-        single_result = clean_asset(asset_id, assets_dir, db_path)
-        result.deleted_count += single_result.deleted_count
-        result.deleted_paths.extend(single_result.deleted_paths)
-        result.errors.extend(single_result.errors)
+        try:
+            _validate_within_root(assets_dir / asset_id, root)
+        except ValueError as e:
+            result.errors.append(str(e))
+        else:
+            safe_ids.append(asset_id)
+
+    # Delete from database first
+    db_errors = _delete_assets_from_db(safe_ids, db_path)
+    result.errors.extend(db_errors)
+
+    # Delete filesystem; unlink/rmdir release the GIL, so trees are removed
+    # concurrently. Outcomes are recorded in input order.
+    asset_paths = [assets_dir / asset_id for asset_id in safe_ids]
+    workers = min(MAX_REMOVE_WORKERS, len(asset_paths))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            removal_errors = list(executor.map(_try_rmtree, asset_paths))
+    else:
+        removal_errors = [_try_rmtree(path) for path in asset_paths]
+
+    for asset_path, error in zip(asset_paths, removal_errors):
+        _record_removal(asset_path, error, not db_errors, result)
 
     return result
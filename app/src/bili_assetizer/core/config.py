@@ -1,12 +1,13 @@
 """Configuration management for bili-assetizer."""
 
+import functools
 import os
 from pathlib import Path
 from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings loaded from environment variables."""
 
@@ -19,44 +20,62 @@ class Settings:
     ai_model_vision: str = "gpt-4o"
     ai_model_embed: str = "text-embedding-3-small"
 
-    @property
-    def db_path(self) -> Path:
-        """Path to the SQLite database file."""
-        return self.data_dir / "bili_assetizer.db"
+    # Derived from data_dir once in __post_init__: the SQLite database file
+    # and the assets directory
+    db_path: Path = field(init=False, repr=False, compare=False)
+    assets_dir: Path = field(init=False, repr=False, compare=False)
 
-    @property
-    def assets_dir(self) -> Path:
-        """Path to the assets directory."""
-        return self.data_dir / "assets"
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "db_path", self.data_dir / "bili_assetizer.db")
+        object.__setattr__(self, "assets_dir", self.data_dir / "assets")
 
 
-def load_settings() -> Settings:
-    """Load settings from environment variables.
+# Environment variables read by load_settings, with their defaults
+_ENV_DEFAULTS: dict[str, str | None] = {
+    "DATA_DIR": "./data",
+    "FFMPEG_BIN": "ffmpeg",
+    "AI_API_KEY": None,
+    "AI_MODEL_TEXT": "gpt-4o",
+    "AI_MODEL_VISION": "gpt-4o",
+    "AI_MODEL_EMBED": "text-embedding-3-small",
+}
 
-    Looks for .env file in current directory and parents.
-    """
+
+@functools.cache
+def _load_dotenv_once() -> None:
+    """Load the .env file into the environment on first use only."""
     load_dotenv()
 
-    data_dir_str = os.getenv("DATA_DIR", "./data")
-    data_dir = Path(data_dir_str)
 
+@functools.lru_cache(maxsize=1)
+def _settings_from_env(env: tuple[str | None, ...]) -> Settings:
+    """Build Settings from environment values ordered as _ENV_DEFAULTS."""
+    data_dir, ffmpeg_bin, ai_api_key, model_text, model_vision, model_embed = env
     return Settings(
-        data_dir=data_dir,
-        ffmpeg_bin=os.getenv("FFMPEG_BIN", "ffmpeg"),
-        ai_api_key=os.getenv("AI_API_KEY"),
-        ai_model_text=os.getenv("AI_MODEL_TEXT", "gpt-4o"),
-        ai_model_vision=os.getenv("AI_MODEL_VISION", "gpt-4o"),
-        ai_model_embed=os.getenv("AI_MODEL_EMBED", "text-embedding-3-small"),
+        data_dir=Path(data_dir),
+        ffmpeg_bin=ffmpeg_bin,
+        ai_api_key=ai_api_key,
+        ai_model_text=model_text,
+        ai_model_vision=model_vision,
+        ai_model_embed=model_embed,
     )
 
 
-# Global settings instance (lazy loaded)
-_settings: Settings | None = None
+def load_settings() -> Settings:
+    """Load settings from environment variables.
+
+    Looks for .env file in current directory and parents. The result is
+    cached and rebuilt only when one of the relevant variables changes.
+    """
+    _load_dotenv_once()
+    env = tuple(os.getenv(key, default) for key, default in _ENV_DEFAULTS.items())
+    return _settings_from_env(env)
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = load_settings()
-    return _settings
+    """Get the global settings instance.
+
+    Loaded lazily on first use; call get_settings.cache_clear() to reload.
+    """
+    return load_settings()
@@ -1,5 +1,6 @@
 """SQLite database schema and connection management."""
 
+import functools
 import sqlite3
 from pathlib import Path
 from contextlib import contextmanager
@@ -113,19 +114,63 @@ CREATE TABLE IF NOT EXISTS generations (
     created_at TEXT NOT NULL DEFAULT (datetime('now'))
 );
 
--- Indexes for common queries
-CREATE INDEX IF NOT EXISTS idx_segments_asset ON segments(asset_id);
-CREATE INDEX IF NOT EXISTS idx_frames_asset ON frames(asset_id);
-CREATE INDEX IF NOT EXISTS idx_chunks_asset ON chunks(asset_id);
+-- Indexes for common queries. The per-asset content tables are read by
+-- (asset_id, version_id) in time/type order; the asset_id prefix also serves
+-- plain per-asset lookups and deletes.
+CREATE INDEX IF NOT EXISTS idx_segments_asset_ver ON segments(asset_id, version_id, start_ms);
+CREATE INDEX IF NOT EXISTS idx_frames_asset_ver ON frames(asset_id, version_id, timestamp_ms);
+CREATE INDEX IF NOT EXISTS idx_chunks_asset_ver ON chunks(asset_id, version_id, type);
 CREATE INDEX IF NOT EXISTS idx_asset_versions_asset ON asset_versions(asset_id);
+
+-- Superseded single-column indexes from older databases
+DROP INDEX IF EXISTS idx_segments_asset;
+DROP INDEX IF EXISTS idx_frames_asset;
+DROP INDEX IF EXISTS idx_chunks_asset;
 """
 
 
+# Per-connection tuning applied by get_connection and init_db. WAL makes
+# NORMAL sync safe: commits append to the WAL without an fsync pair, and
+# readers no longer block the writer.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply CONNECTION_PRAGMAS to a freshly opened connection."""
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
+def _executescript_atomic(conn: sqlite3.Connection, script: str) -> None:
+    """Run a DDL script as one transaction.
+
+    executescript() otherwise autocommits each statement, paying a journal
+    sync per CREATE.
+    """
+    conn.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+
+
 def get_db_path() -> Path:
     """Get the database file path."""
     return get_settings().db_path
 
 
+def _ensure_parent(db_path: Path) -> None:
+    """Create the database's parent directory if it does not exist yet.
+
+    Checks first so the common case costs one stat instead of a failed
+    mkdir followed by a stat.
+    """
+    parent = db_path.parent
+    if not parent.is_dir():
+        parent.mkdir(parents=True, exist_ok=True)
+
+
 def init_db(db_path: Path | None = None) -> None:
     """Initialize the database schema.
 
@@ -135,17 +180,54 @@ def init_db(db_path: Path | None = None) -> None:
     if db_path is None:
         db_path = get_db_path()
 
-    # Ensure parent directory exists
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent(db_path)
 
     conn = sqlite3.connect(db_path)
     try:
-        conn.executescript(SCHEMA)
-        conn.commit()
+        _init_db_on(conn)
     finally:
         conn.close()
 
 
+def _init_db_on(conn: sqlite3.Connection) -> None:
+    """Initialize the database schema on an already open connection.
+
+    Args:
+        conn: Connection to the database to initialize.
+    """
+    # journal_mode is persistent, so later connections inherit WAL
+    conn.execute("PRAGMA journal_mode=WAL")
+    _apply_pragmas(conn)
+    _executescript_atomic(conn, SCHEMA)
+
+
+@functools.cache
+def schema_columns() -> dict[str, frozenset[str]]:
+    """Column names of every table in SCHEMA, introspected once per process.
+
+    Built from an in-memory database initialized with the same DDL, using a
+    single sqlite_master/pragma_table_info join. The returned mapping is
+    shared between callers and must not be mutated.
+    """
+    conn = sqlite3.connect(":memory:")
+    try:
+        _init_db_on(conn)
+        rows = conn.execute(
+            """
+            SELECT m.name, c.name
+            FROM sqlite_master AS m JOIN pragma_table_info(m.name) AS c
+            WHERE m.type = 'table'
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+
+    columns: dict[str, set[str]] = {}
+    for table, column in rows:
+        columns.setdefault(table, set()).add(column)
+    return {table: frozenset(names) for table, names in columns.items()}
+
+
 @contextmanager
 def get_connection(db_path: Path | None = None) -> Generator[sqlite3.Connection, None, None]:
     """Get a database connection as a context manager.
@@ -162,6 +244,7 @@ def get_connection(db_path: Path | None = None) -> Generator[sqlite3.Connection,
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     try:
+        _apply_pragmas(conn)
         yield conn
     finally:
         conn.close()
@@ -205,14 +288,12 @@ def init_evidence_schema(db_path: Path | None = None) -> list[str]:
     if db_path is None:
         db_path = get_db_path()
 
-    # Ensure parent directory exists
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent(db_path)
 
     try:
         conn = sqlite3.connect(db_path)
         try:
-            conn.executescript(EVIDENCE_SCHEMA)
-            conn.commit()
+            _executescript_atomic(conn, EVIDENCE_SCHEMA)
         finally:
             conn.close()
     except sqlite3.Error as e:
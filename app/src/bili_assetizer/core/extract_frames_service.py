@@ -1,10 +1,17 @@
 """Service for extracting keyframes from video assets."""
 
+import functools
 import hashlib
 import json
-import re
+import os
+import stat
+import struct
 import subprocess
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import BinaryIO
 
 from .manifest_utils import load_manifest, save_manifest
 from .models import (
@@ -15,6 +22,9 @@ from .models import (
     StageStatus,
 )
 
+# json.dumps builds a new JSONEncoder per call when given options; reuse one
+_JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 def _validate_source_video(asset_dir: Path, manifest: Manifest) -> tuple[Path | None, list[str]]:
     """Validate that source video exists and is ready.
@@ -54,11 +64,14 @@ def _validate_source_video(asset_dir: Path, manifest: Manifest) -> tuple[Path |
 
     video_path = asset_dir / source_stage.video_path
 
-    if not video_path.exists():
+    # One stat answers both "exists" and "is a regular file"
+    try:
+        is_file = stat.S_ISREG(os.stat(video_path).st_mode)
+    except OSError:
         errors.append(f"Source video file not found: {video_path}")
         return None, errors
 
-    if not video_path.is_file():
+    if not is_file:
         errors.append(f"Source video path is not a file: {video_path}")
         return None, errors
 
@@ -73,9 +86,44 @@ def _validate_source_video(asset_dir: Path, manifest: Manifest) -> tuple[Path |
     return video_path, errors
 
 
+@functools.lru_cache(maxsize=256)
+def _probe_duration(
+    video_path: str, mtime_ns: int, size: int, ffprobe_bin: str
+) -> str:
+    """Run ffprobe and return its raw duration output, memoized per file version.
+
+    mtime_ns and size only take part in the cache key, so a rewritten file is
+    probed again. Failures raise and are therefore never cached.
+
+    Unlike manifest.json, which several stages rewrite in place, the source
+    video is written once by extract-source and only replaced by
+    extract-source --force, which recreates the whole source directory from
+    a download or local copy. A replacement with the same byte size inside
+    the same timestamp tick as the previous probe is not a realistic case
+    there, so the (path, mtime_ns, size) key is safe for this cache.
+    """
+    result = subprocess.run(
+        [
+            ffprobe_bin,
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            video_path,
+        ],
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
 def _get_video_duration(video_path: Path, ffprobe_bin: str = "ffprobe") -> tuple[float | None, list[str]]:
     """Get video duration using ffprobe.
 
+    The probe is cached per (path, mtime, size), so re-extracting frames from
+    an unchanged video with different params does not spawn ffprobe again.
+
     Args:
         video_path: Path to video file
         ffprobe_bin: Path to ffprobe binary
@@ -86,21 +134,11 @@ def _get_video_duration(video_path: Path, ffprobe_bin: str = "ffprobe") -> tuple
     errors = []
 
     try:
-        result = subprocess.run(
-            [
-                ffprobe_bin,
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                str(video_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            check=True,
+        st = os.stat(video_path)
+        duration_str = _probe_duration(
+            str(video_path), st.st_mtime_ns, st.st_size, ffprobe_bin
         )
 
-        duration_str = result.stdout.strip()
         if not duration_str:
             errors.append("ffprobe returned empty duration")
             return None, errors
@@ -119,32 +157,81 @@ def _get_video_duration(video_path: Path, ffprobe_bin: str = "ffprobe") -> tuple
         return None, errors
 
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _read_png_frames(stream: BinaryIO) -> Iterator[bytes]:
+    """Yield PNG images from a stream of concatenated PNGs (ffmpeg image2pipe).
+
+    Walks the chunk headers of each image rather than searching for the
+    IEND marker, so compressed pixel data can never be mistaken for a
+    boundary.
+
+    Args:
+        stream: Binary stream, e.g. ffmpeg's stdout
+
+    Yields:
+        Complete PNG images in stream order
+
+    Raises:
+        ValueError: If the stream is not a sequence of complete PNG images
+    """
+    while True:
+        signature = stream.read(8)
+        if not signature:
+            return
+        if signature != _PNG_SIGNATURE:
+            raise ValueError("missing PNG signature in ffmpeg output")
+
+        parts = [signature]
+        while True:
+            header = stream.read(8)
+            if len(header) < 8:
+                raise ValueError("truncated PNG stream")
+            (length,) = struct.unpack_from(">I", header)
+            # Chunk data followed by its CRC
+            body = stream.read(length + 4)
+            if len(body) < length + 4:
+                raise ValueError("truncated PNG stream")
+            parts.append(header)
+            parts.append(body)
+            if header[4:] == b"IEND":
+                break
+
+        yield b"".join(parts)
+
+
 def _extract_frames_ffmpeg(
     video_path: Path,
-    output_dir: Path,
     params: dict,
+    frames_dir: Path,
     ffmpeg_bin: str = "ffmpeg",
-) -> list[str]:
-    """Extract frames using ffmpeg.
+) -> tuple[list[dict], list[str]]:
+    """Extract frames using ffmpeg, deduplicating PNG images from its stdout.
+
+    Frames are piped (image2pipe) instead of written to disk and each one is
+    hashed and, if new, written as soon as it arrives, so only one encoded
+    frame is held in memory at a time. With max_frames set, ffmpeg is
+    stopped as soon as that many distinct frames have arrived: every later
+    frame is either a duplicate of one of them or past the cap.
 
     Args:
         video_path: Path to source video
-        output_dir: Directory to write frames
-        params: Extraction parameters (interval_sec, scene_thresh)
+        params: Extraction parameters (interval_sec, max_frames, scene_thresh)
+        frames_dir: Directory to write unique frame images to
         ffmpeg_bin: Path to ffmpeg binary
 
     Returns:
-        List of error messages (empty if successful)
+        Tuple of (frame metadata list, errors)
     """
     errors = []
+    frames: list[dict] = []
 
     try:
-        # Ensure output directory exists
-        output_dir.mkdir(parents=True, exist_ok=True)
-
         # Build filter chain
         interval_sec = params.get("interval_sec", 3.0)
         scene_thresh = params.get("scene_thresh")
+        max_frames = params.get("max_frames")
 
         # Build filter based on extraction mode
         filter_parts = []
@@ -162,12 +249,10 @@ def _extract_frames_ffmpeg(
 
         vf_filter = ",".join(filter_parts)
 
-        # Output path pattern
-        output_pattern = str(output_dir / "frame_%06d.png")
-
         # Build ffmpeg command
         cmd = [
             ffmpeg_bin,
+            "-nostdin",
             "-i", str(video_path),
             "-vf", vf_filter,
         ]
@@ -177,139 +262,157 @@ def _extract_frames_ffmpeg(
             cmd.extend(["-vsync", "vfr"])
 
         cmd.extend([
-            "-f", "image2",
-            "-y",  # Overwrite output files
-            output_pattern,
+            "-f", "image2pipe",
+            "-vcodec", "png",
+            "-",  # Write frames to stdout
         ])
 
-        # Run ffmpeg
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600,  # 10 minute timeout for long videos
-            check=True,
-        )
+        # stderr goes to a file so a chatty ffmpeg cannot block on a full pipe
+        # while we are reading stdout
+        with tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=stderr_file
+            )
+            timed_out = threading.Event()
+
+            def _kill_on_timeout() -> None:
+                timed_out.set()
+                proc.kill()
+
+            # 10 minute timeout for long videos
+            timer = threading.Timer(600, _kill_on_timeout)
+            timer.start()
+            stopped_early = False
+            stream_error: ValueError | None = None
+            write_errors: list[str] = []
+            try:
+                try:
+                    frames, write_errors = _deduplicate_frames(
+                        frame_images=_read_png_frames(proc.stdout),
+                        frames_dir=frames_dir,
+                        interval_sec=interval_sec,
+                        scene_thresh=scene_thresh,
+                        max_unique=max_frames,
+                    )
+                except ValueError as e:
+                    # A killed or crashed ffmpeg cuts its output mid-frame, so
+                    # its exit status is checked before blaming the stream
+                    stream_error = e
+                else:
+                    stopped_early = bool(max_frames) and (
+                        sum(not f["is_duplicate"] for f in frames) >= max_frames
+                    )
+            except BaseException:
+                proc.kill()
+                raise
+            finally:
+                timer.cancel()
+                if stopped_early:
+                    proc.kill()
+                proc.stdout.close()
+                returncode = proc.wait()
+
+            if timed_out.is_set():
+                errors.append("ffmpeg timed out during frame extraction")
+            elif returncode != 0 and not stopped_early:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", errors="replace")
+                errors.append(f"Frame extraction failed: {stderr}")
+            elif stream_error is not None:
+                errors.append(f"Frame extraction failed: {stream_error}")
+            else:
+                errors.extend(write_errors)
 
-    except subprocess.TimeoutExpired:
-        errors.append("ffmpeg timed out during frame extraction")
-    except subprocess.CalledProcessError as e:
-        errors.append(f"Frame extraction failed: {e.stderr}")
     except OSError as e:
         errors.append(f"Failed to run ffmpeg: {e}")
 
-    return errors
-
-
-def _compute_frame_hash(image_path: Path) -> str:
-    """Compute MD5 hash of frame image.
-
-    Args:
-        image_path: Path to frame image
-
-    Returns:
-        MD5 hash as hex string
-    """
-    hasher = hashlib.md5()
-    with open(image_path, "rb") as f:
-        # Read in chunks to handle large files
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+    if errors:
+        return [], errors
+    return frames, errors
 
 
-def _extract_frame_number(frame_path: Path) -> int | None:
-    """Extract the original frame number from filename.
+def _compute_frame_hash(image_data: bytes) -> str:
+    """Compute a 128-bit BLAKE2b hash of frame image.
 
-    Filenames are expected in format: frame_NNNNNN.png
+    BLAKE2b outpaces MD5 in software and keeps the same 32-character hex
+    width in frames_passA.jsonl.
 
     Args:
-        frame_path: Path to frame file
+        image_data: Encoded frame image
 
     Returns:
-        Frame number (1-indexed) or None if cannot parse
+        Hash as hex string
     """
-    match = re.match(r"frame_(\d+)\.png$", frame_path.name)
-    if match:
-        return int(match.group(1))
-    return None
+    return hashlib.blake2b(image_data, digest_size=16).hexdigest()
 
 
 def _deduplicate_frames(
+    frame_images: Iterable[bytes],
     frames_dir: Path,
     interval_sec: float,
     scene_thresh: float | None = None,
+    max_unique: int | None = None,
 ) -> tuple[list[dict], list[str]]:
-    """Deduplicate frames by MD5 hash, delete duplicates from disk.
+    """Deduplicate frames by content hash, writing only unique frames to disk.
 
-    Computes ts_ms from the original filename (frame_000003.png -> frame 3)
-    to ensure correct timestamps even after deduplication.
+    Frames are consumed one at a time, so a lazy iterable keeps just the
+    current image in memory. Frame N of the ffmpeg output is saved as
+    frame_NNNNNN.png and its ts_ms is computed from N, so timestamps stay
+    correct after deduplication.
 
     Args:
-        frames_dir: Directory containing frame images
+        frame_images: PNG images in ffmpeg output order
+        frames_dir: Directory to write unique frame images to
         interval_sec: Seconds between frames (for uniform sampling)
         scene_thresh: Scene detection threshold (None means uniform sampling)
+        max_unique: Stop reading once this many unique frames are written
 
     Returns:
-        Tuple of (frame metadata list, deletion errors)
+        Tuple of (frame metadata list, write errors)
     """
-    deletion_errors: list[str] = []
-
-    # Collect all frame files
-    frame_files = sorted(frames_dir.glob("frame_*.png"))
-
-    if not frame_files:
-        return [], []
+    write_errors: list[str] = []
 
     # Track seen hashes and frame metadata
     seen_hashes: dict[str, str] = {}  # hash -> frame_id
     frames: list[dict] = []
 
-    for idx, frame_path in enumerate(frame_files, start=1):
+    for idx, image_data in enumerate(frame_images, start=1):
         frame_id = f"KF_{idx:06d}"
-
-        # Extract original frame number from filename for timestamp calculation
-        original_frame_num = _extract_frame_number(frame_path)
+        frame_hash = _compute_frame_hash(image_data)
 
         # Compute timestamp from original frame number
         # For uniform sampling: ts_ms = (frame_num - 1) * interval_sec * 1000
         # For scene detection: ts_ms is unknown (set to None)
         if scene_thresh is not None:
             ts_ms = None  # Scene detection doesn't have predictable timestamps
-        elif original_frame_num is not None:
-            ts_ms = int((original_frame_num - 1) * interval_sec * 1000)
         else:
-            ts_ms = None
-
-        # Compute hash
-        frame_hash = _compute_frame_hash(frame_path)
+            ts_ms = int((idx - 1) * interval_sec * 1000)
 
         # Check if this hash was seen before
         if frame_hash in seen_hashes:
-            # Duplicate - mark it and delete the file
+            # Duplicate - record it without writing the image
             original_frame_id = seen_hashes[frame_hash]
             frames.append({
                 "frame_id": frame_id,
                 "ts_ms": ts_ms,
-                "path": None,  # File was deleted
+                "path": None,  # Never written
                 "hash": frame_hash,
                 "source": "scene" if scene_thresh is not None else "uniform",
                 "is_duplicate": True,
                 "duplicate_of": original_frame_id,
             })
 
-            # Delete duplicate file
+        else:
+            # Unique frame - write it
+            file_name = f"frame_{idx:06d}.png"
             try:
-                frame_path.unlink()
+                (frames_dir / file_name).write_bytes(image_data)
             except OSError as e:
-                deletion_errors.append(
-                    f"Failed to delete duplicate {frame_path.name}: {e}"
-                )
+                write_errors.append(f"Failed to write frame {file_name}: {e}")
+                continue
 
-        else:
-            # Unique frame - keep it
             seen_hashes[frame_hash] = frame_id
-            relative_path = f"{frames_dir.name}/{frame_path.name}"
+            relative_path = f"{frames_dir.name}/{file_name}"
 
             frames.append({
                 "frame_id": frame_id,
@@ -321,12 +424,17 @@ def _deduplicate_frames(
                 "duplicate_of": None,
             })
 
-    return frames, deletion_errors
+            if max_unique and len(seen_hashes) >= max_unique:
+                break
+
+    return frames, write_errors
 
 
 def _write_frames_jsonl(frames: list[dict], output_path: Path) -> list[str]:
     """Write frame metadata to JSONL file.
 
+    The whole payload is encoded up front and written with a single call.
+
     Args:
         frames: List of frame metadata dicts
         output_path: Path to output JSONL file
@@ -336,11 +444,11 @@ def _write_frames_jsonl(frames: list[dict], output_path: Path) -> list[str]:
     """
     errors = []
 
+    encode = _JSONL_ENCODER.encode
+    payload = "".join(f"{encode(frame)}\n" for frame in frames)
+
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            for frame in frames:
-                json_line = json.dumps(frame, ensure_ascii=False)
-                f.write(json_line + "\n")
+        output_path.write_text(payload, encoding="utf-8")
     except OSError as e:
         errors.append(f"Failed to write frames metadata: {e}")
 
@@ -368,7 +476,6 @@ def extract_frames(
     Returns:
         ExtractFramesResult with status and frame count
     """
-    errors = []
     asset_dir = assets_dir / asset_id
 
     # 1. Load manifest
@@ -452,11 +559,20 @@ def extract_frames(
                 errors=[f"Failed to remove existing frames directory: {e}"],
             )
 
-    # 7. Extract frames using ffmpeg
-    extraction_errors = _extract_frames_ffmpeg(
+    try:
+        frames_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        return ExtractFramesResult(
+            asset_id=asset_id,
+            status=StageStatus.FAILED,
+            errors=[f"Failed to create frames directory: {e}"],
+        )
+
+    # 7. Extract frames using ffmpeg, writing the unique ones as they arrive
+    frames, extraction_errors = _extract_frames_ffmpeg(
         video_path=video_path,
-        output_dir=frames_dir,
         params=current_params,
+        frames_dir=frames_dir,
     )
     if extraction_errors:
         return ExtractFramesResult(
@@ -465,15 +581,6 @@ def extract_frames(
             errors=extraction_errors,
         )
 
-    # 8. Deduplicate frames
-    frames, deletion_errors = _deduplicate_frames(
-        frames_dir=frames_dir,
-        interval_sec=interval_sec,
-        scene_thresh=scene_thresh,
-    )
-    # Log deletion errors but don't fail the operation
-    errors.extend(deletion_errors)
-
     if not frames:
         return ExtractFramesResult(
             asset_id=asset_id,
@@ -481,41 +588,7 @@ def extract_frames(
             errors=["No frames found after extraction"],
         )
 
-    # 9. Apply max_frames cap (count only unique frames)
-    unique_frames = [f for f in frames if not f["is_duplicate"]]
-    if max_frames and len(unique_frames) > max_frames:
-        # Sort unique frames by timestamp to keep earliest frames
-        # Use ts_ms if available, otherwise maintain frame_id order
-        unique_frames_sorted = sorted(
-            unique_frames,
-            key=lambda f: (f["ts_ms"] is None, f["ts_ms"] or 0, f["frame_id"]),
-        )
-        # Keep first max_frames unique frames, delete the rest
-        kept_frame_ids = {f["frame_id"] for f in unique_frames_sorted[:max_frames]}
-
-        # Filter frames list and delete excess files
-        filtered_frames = []
-        for frame in frames:
-            if frame["is_duplicate"]:
-                # Keep duplicate metadata if its original is kept
-                if frame["duplicate_of"] in kept_frame_ids:
-                    filtered_frames.append(frame)
-            elif frame["frame_id"] in kept_frame_ids:
-                # Keep this unique frame
-                filtered_frames.append(frame)
-            else:
-                # Delete this excess unique frame
-                if frame["path"]:
-                    frame_path = asset_dir / frame["path"]
-                    try:
-                        frame_path.unlink()
-                    except OSError:
-                        pass  # Best effort deletion
-
-        frames = filtered_frames
-        unique_frames = [f for f in frames if not f["is_duplicate"]]
-
-    # 10. Write frames metadata
+    # 8. Write frames metadata
     frames_file = "frames_passA.jsonl"
     write_errors = _write_frames_jsonl(frames, asset_dir / frames_file)
     if write_errors:
@@ -525,8 +598,9 @@ def extract_frames(
             errors=write_errors,
         )
 
-    # 11. Update manifest
-    frame_count = len(unique_frames)
+    # 9. Update manifest
+    # _deduplicate_frames already stopped at max_frames unique frames
+    frame_count = sum(not f["is_duplicate"] for f in frames)
     frames_stage = FramesStage(
         status=StageStatus.COMPLETED,
         frame_count=frame_count,
@@ -544,7 +618,7 @@ def extract_frames(
             errors=save_errors,
         )
 
-    # 12. Return success result
+    # 10. Return success result
     return ExtractFramesResult(
         asset_id=asset_id,
         status=StageStatus.COMPLETED,
@@ -1,10 +1,14 @@
 """Service for extracting OCR text from selected frames using Tesseract."""
 
 import json
+import math
+import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .manifest_utils import load_manifest, save_manifest
@@ -16,6 +20,14 @@ from .models import (
     StageStatus,
 )
 
+# Images passed to one tesseract process through a list file; each process
+# pays the engine and language-model start-up once for the whole batch.
+# Frames are spread over the workers, but a batch never drops below the
+# minimum so that start-up stays amortized for small selections.
+TESSERACT_BATCH_SIZE = 64
+TESSERACT_MIN_BATCH_SIZE = 8
+DEFAULT_OCR_WORKERS = os.cpu_count() or 1
+
 
 def _find_tesseract(tesseract_cmd: str | None) -> tuple[str | None, list[str]]:
     """Find tesseract executable.
@@ -121,6 +133,7 @@ def _run_tesseract(
     tesseract_path: str,
     lang: str,
     psm: int,
+    env: dict[str, str] | None = None,
 ) -> tuple[str, str | None]:
     """Run tesseract OCR in TSV mode on a single image.
 
@@ -129,6 +142,7 @@ def _run_tesseract(
         tesseract_path: Path to tesseract executable
         lang: Language code(s)
         psm: Page segmentation mode
+        env: Environment for the tesseract process (None inherits ours)
 
     Returns:
         Tuple of (tsv_text, error_message)
@@ -150,6 +164,7 @@ def _run_tesseract(
             encoding="utf-8",
             errors="replace",
             timeout=30,
+            env=env,
         )
 
         if result.returncode != 0:
@@ -167,6 +182,162 @@ def _run_tesseract(
         return "", f"OCR TSV failed: {e}"
 
 
+def _split_tsv_pages(tsv_text: str, page_count: int) -> list[str] | None:
+    """Split multi-page Tesseract TSV into one TSV text per page.
+
+    Rows are grouped by their page_num column and renumbered to page 1, so
+    each part matches what a single-image run would print. Returns None if
+    the output does not hold exactly page_count pages.
+    """
+    rows = tsv_text.splitlines()
+    header = rows[:1] if rows and rows[0].startswith("level\t") else []
+    pages: list[list[str]] = [list(header) for _ in range(page_count)]
+
+    for row in rows[len(header) :]:
+        if not row:
+            continue
+        parts = row.split("\t", 2)
+        page_num = _safe_int(parts[1]) if len(parts) == 3 else None
+        if page_num is None or not 1 <= page_num <= page_count:
+            return None
+        pages[page_num - 1].append(f"{parts[0]}\t1\t{parts[2]}")
+
+    if any(len(page) == len(header) for page in pages):
+        return None
+    return ["\n".join(page) for page in pages]
+
+
+def _run_tesseract_batch(
+    image_paths: list[Path],
+    tesseract_path: str,
+    lang: str,
+    psm: int,
+    env: dict[str, str] | None = None,
+) -> tuple[list[str], str | None]:
+    """Run tesseract OCR in TSV mode on several images in one process.
+
+    The image paths are written to a temporary list file, which tesseract
+    treats as a multi-page document.
+
+    Args:
+        image_paths: Paths to image files
+        tesseract_path: Path to tesseract executable
+        lang: Language code(s)
+        psm: Page segmentation mode
+        env: Environment for the tesseract process (None inherits ours)
+
+    Returns:
+        Tuple of (per-image TSV texts in input order, error_message)
+    """
+    try:
+        list_file = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", suffix=".txt", delete=False
+        )
+    except OSError as e:
+        return [], f"Failed to create tesseract image list: {e}"
+
+    list_path = Path(list_file.name)
+    try:
+        with list_file:
+            list_file.write("".join(f"{path.resolve()}\n" for path in image_paths))
+        result = subprocess.run(
+            [
+                tesseract_path,
+                str(list_path),
+                "stdout",
+                "-l",
+                lang,
+                "--psm",
+                str(psm),
+                "tsv",
+            ],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=30 * len(image_paths),
+            env=env,
+        )
+    except subprocess.TimeoutExpired:
+        return [], "OCR TSV batch timeout"
+    except OSError as e:
+        return [], f"OCR TSV batch failed: {e}"
+    finally:
+        list_path.unlink(missing_ok=True)
+
+    if result.returncode != 0:
+        stderr_text = result.stderr.strip() if result.stderr else ""
+        return [], f"Tesseract TSV batch error: {stderr_text}".rstrip()
+
+    pages = _split_tsv_pages(result.stdout or "", len(image_paths))
+    if pages is None:
+        return [], f"Tesseract TSV batch did not return {len(image_paths)} pages"
+    return pages, None
+
+
+def _ocr_batch(
+    batch: list[Path],
+    tesseract_path: str,
+    lang: str,
+    psm: int,
+    env: dict[str, str] | None = None,
+) -> list[tuple[Path, tuple[str, str | None]]]:
+    """OCR one batch of images, retrying image by image if the batch fails.
+
+    One unreadable image aborts a whole tesseract list run, so the retry
+    keeps errors attributed to the frame that caused them.
+    """
+    if len(batch) > 1:
+        pages, error = _run_tesseract_batch(batch, tesseract_path, lang, psm, env)
+        if not error:
+            return [(path, (page, None)) for path, page in zip(batch, pages)]
+    return [
+        (path, _run_tesseract(path, tesseract_path, lang, psm, env)) for path in batch
+    ]
+
+
+def _ocr_images(
+    image_paths: list[Path],
+    tesseract_path: str,
+    lang: str,
+    psm: int,
+    workers: int = DEFAULT_OCR_WORKERS,
+) -> dict[Path, tuple[str, str | None]]:
+    """OCR images in batches, running up to `workers` tesseract processes.
+
+    Tesseract does its work in a child process, so threads only wait on
+    subprocess pipes and the batches run truly in parallel. Parallel
+    processes are limited to one OpenMP thread each; otherwise every one of
+    them would spread over all cores and oversubscribe the machine.
+
+    Returns:
+        Mapping of image path to (tsv_text, error_message)
+    """
+    unique_paths = list(dict.fromkeys(image_paths))
+    batch_size = min(
+        TESSERACT_BATCH_SIZE,
+        max(TESSERACT_MIN_BATCH_SIZE, math.ceil(len(unique_paths) / workers)),
+    )
+    batches = [
+        unique_paths[start : start + batch_size]
+        for start in range(0, len(unique_paths), batch_size)
+    ]
+
+    parallel = workers > 1 and len(batches) > 1
+    env = {**os.environ, "OMP_THREAD_LIMIT": "1"} if parallel else None
+
+    def run(batch: list[Path]) -> list[tuple[Path, tuple[str, str | None]]]:
+        return _ocr_batch(batch, tesseract_path, lang, psm, env)
+
+    if parallel:
+        with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as executor:
+            results = list(executor.map(run, batches))
+    else:
+        results = [run(batch) for batch in batches]
+
+    return {path: output for batch_results in results for path, output in batch_results}
+
+
 def _safe_int(value: str | None) -> int | None:
     if value is None:
         return None
@@ -452,6 +623,7 @@ def extract_ocr(
     psm: int = 6,
     tesseract_cmd: str | None = None,
     force: bool = False,
+    workers: int | None = None,
 ) -> ExtractOcrResult:
     """Extract OCR text from selected frames using Tesseract.
 
@@ -462,6 +634,7 @@ def extract_ocr(
         psm: Page segmentation mode 0-13 (default: 6)
         tesseract_cmd: Path to tesseract executable (optional)
         force: Overwrite existing OCR results
+        workers: Parallel tesseract processes (default: CPU count)
 
     Returns:
         ExtractOcrResult with status and frame count
@@ -476,6 +649,13 @@ def extract_ocr(
             errors=[f"PSM must be 0-13, got: {psm}"],
         )
 
+    if workers is not None and workers < 1:
+        return ExtractOcrResult(
+            asset_id=asset_id,
+            status=StageStatus.FAILED,
+            errors=[f"OCR workers must be at least 1, got: {workers}"],
+        )
+
     # 2. Validate asset exists and load manifest
     if not asset_dir.exists():
         return ExtractOcrResult(
@@ -589,6 +769,15 @@ def extract_ocr(
         )
 
     # 8. Run OCR on each frame
+    image_paths = [
+        asset_dir / frame["dst_path"]
+        for frame in frames
+        if frame.get("dst_path") and (asset_dir / frame["dst_path"]).exists()
+    ]
+    tesseract_outputs = _ocr_images(
+        image_paths, tesseract_path, lang, psm, workers or DEFAULT_OCR_WORKERS
+    )
+
     ocr_results = []
     structured_results = []
     ocr_errors = []
@@ -603,7 +792,7 @@ def extract_ocr(
             continue
 
         image_path = asset_dir / dst_path
-        if not image_path.exists():
+        if image_path not in tesseract_outputs:
             ocr_errors.append(f"Image not found: {dst_path}")
             ocr_result = {
                 "frame_id": frame_id,
@@ -631,7 +820,7 @@ def extract_ocr(
             )
             continue
 
-        tsv_text, error = _run_tesseract(image_path, tesseract_path, lang, psm)
+        tsv_text, error = tesseract_outputs[image_path]
         words, lines = _parse_tsv(tsv_text)
         line_texts = [line.get("text", "") for line in lines if line.get("text")]
         text_raw = "\n".join(line_texts)
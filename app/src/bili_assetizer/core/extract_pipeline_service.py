@@ -247,6 +247,7 @@ def extract_pipeline(
                 psm=options.ocr_psm,
                 tesseract_cmd=None,
                 force=force,
+                workers=options.ocr_workers,
             )
         elif stage == "ocr_normalize":
             result = ocr_normalize(
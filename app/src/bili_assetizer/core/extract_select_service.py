@@ -1,6 +1,7 @@
 """Service for selecting representative frames from top timeline buckets."""
 
 import json
+import os
 import shutil
 from pathlib import Path
 
@@ -180,6 +181,19 @@ def _select_frames(
     return selected_bucket_info, selected_frames
 
 
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, falling back to a full copy.
+
+    Selected frames are never modified in place, so sharing the inode with
+    frames_passA avoids re-writing the image bytes. Filesystems without
+    hardlink support (or cross-device paths) fall back to shutil.copy2.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def _copy_selected_frames(
     asset_dir: Path,
     selected_frames: list[dict],
@@ -219,7 +233,7 @@ def _copy_selected_frames(
         frame["dst_path"] = f"{selected_dir}/{filename}"
 
         try:
-            shutil.copy2(src_full, dst_full)
+            _link_or_copy(src_full, dst_full)
         except OSError as e:
             errors.append(f"Failed to copy {src_path}: {e}")
 
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from .db import get_connection, init_evidence_schema, check_evidence_schema
+from .manifest_utils import atomic_write_text
 from .models import IndexResult, IndexStage, Manifest, StageStatus
 from .text_utils import segment_text
 
@@ -113,6 +114,10 @@ def index_asset(
         ocr_count = count
         errors.extend(index_errors)
 
+    # Refresh planner statistics so retrieval queries start from good plans
+    if transcript_count or ocr_count:
+        errors.extend(_refresh_evidence_stats(db_path))
+
     # Determine final status
     if transcript_count == 0 and ocr_count == 0:
         status = StageStatus.FAILED
@@ -134,8 +139,7 @@ def index_asset(
     manifest.updated_at = datetime.now(timezone.utc).isoformat()
 
     try:
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(manifest.to_dict(), f, indent=2, ensure_ascii=False)
+        atomic_write_text(manifest_path, manifest.to_json())
     except OSError as e:
         errors.append(f"Failed to update manifest: {e}")
 
@@ -238,6 +242,31 @@ def _clear_asset_evidence(db_path: Path, asset_id: str) -> list[str]:
     return errors
 
 
+def _refresh_evidence_stats(db_path: Path) -> list[str]:
+    """Update sqlite_stat1 for the evidence table and its indexes.
+
+    Uses an approximate ANALYZE (analysis_limit) so the cost stays bounded
+    as the evidence table grows.
+
+    Args:
+        db_path: Path to the SQLite database.
+
+    Returns:
+        List of errors encountered.
+    """
+    errors: list[str] = []
+
+    try:
+        with get_connection(db_path) as conn:
+            conn.execute("PRAGMA analysis_limit=400")
+            conn.execute("ANALYZE evidence")
+            conn.commit()
+    except sqlite3.Error as e:
+        errors.append(f"Failed to refresh evidence statistics: {e}")
+
+    return errors
+
+
 def _index_transcript(
     db_path: Path, asset_id: str, segments: list[dict]
 ) -> tuple[int, list[str]]:
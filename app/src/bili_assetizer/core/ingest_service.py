@@ -9,6 +9,7 @@ from typing import Any
 from .bilibili_client import BilibiliClient
 from .db import get_connection, init_db, check_db
 from .exceptions import BilibiliApiError, InvalidUrlError
+from .manifest_utils import atomic_write_text
 from .models import (
     AssetStatus,
     IngestResult,
@@ -143,13 +144,14 @@ def load_manifest(asset_dir: Path) -> Manifest | None:
 def save_manifest(asset_dir: Path, manifest: Manifest) -> None:
     """Save a manifest to an asset directory.
 
+    The file is replaced atomically, so concurrent readers never see a
+    partially written manifest.
+
     Args:
         asset_dir: Path to the asset directory.
         manifest: The Manifest object to save.
     """
-    manifest_path = asset_dir / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest.to_dict(), f, indent=2, ensure_ascii=False)
+    atomic_write_text(asset_dir / "manifest.json", manifest.to_json())
 
 
 def _save_json(path: Path, data: Any) -> None:
@@ -34,6 +34,42 @@ def load_manifest(asset_dir: Path) -> Manifest | None:
         return None
 
 
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write text to path atomically via a temp file in the same directory.
+
+    Readers see either the old file or the complete new one, never a torn
+    write, so no lock is needed around manifest reads.
+
+    Args:
+        path: Destination file
+        text: Content to write (UTF-8)
+
+    Raises:
+        OSError: If the temp file cannot be written or renamed. The temp
+            file is removed before the error propagates.
+    """
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        encoding="utf-8",
+        dir=path.parent,
+        suffix=".tmp",
+        delete=False,
+    ) as tmp_file:
+        tmp_path = Path(tmp_file.name)
+        try:
+            tmp_file.write(text)
+        except OSError:
+            tmp_file.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    try:
+        tmp_path.replace(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def save_manifest(asset_dir: Path, manifest: Manifest) -> list[str]:
     """Save manifest to asset directory atomically.
 
@@ -53,28 +89,8 @@ def save_manifest(asset_dir: Path, manifest: Manifest) -> list[str]:
     try:
         # Update timestamp
         manifest.updated_at = datetime.now(timezone.utc).isoformat()
-
-        # Write to temp file first, then rename for atomicity
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=asset_dir,
-            suffix=".tmp",
-            delete=False,
-        ) as tmp_file:
-            json.dump(manifest.to_dict(), tmp_file, indent=2, ensure_ascii=False)
-            tmp_path = Path(tmp_file.name)
-
-        # Atomic rename
-        tmp_path.replace(manifest_path)
-
+        atomic_write_text(manifest_path, manifest.to_json())
     except OSError as e:
         errors.append(f"Failed to save manifest: {e}")
-        # Clean up temp file if it exists
-        try:
-            if tmp_path.exists():
-                tmp_path.unlink()
-        except (OSError, UnboundLocalError):
-            pass
 
     return errors
@@ -1,5 +1,6 @@
 """Data models for bili-assetizer."""
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -137,6 +138,20 @@ class Manifest:
             result["stages"] = self.stages
         return result
 
+    def to_json(self, indent: int | None = 2) -> str:
+        """Serialize the manifest to a JSON string.
+
+        Encodes in one json.dumps call so callers can write the result with a
+        single write instead of json.dump's per-chunk writes.
+
+        Args:
+            indent: Indentation level, or None for compact output.
+
+        Returns:
+            JSON text for manifest.json.
+        """
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Manifest":
         return cls(
@@ -606,6 +621,7 @@ class PipelineOptions:
     top_buckets: int = 10
     ocr_lang: str = "eng+chi_sim"
     ocr_psm: int = 6
+    ocr_workers: int | None = None
     transcript_provider: str = "tencent"
     transcript_format: int = 0
     until_stage: str | None = None
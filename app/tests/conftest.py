@@ -1,12 +1,475 @@
 """Shared fixtures for bili-assetizer tests."""
 
+import copy
+import functools
+import io
 import json
+import shutil
+import sqlite3
+import subprocess
+from contextlib import closing
+from datetime import datetime, timezone
 from pathlib import Path
+
 import pytest
+from PIL import Image
+
+from bili_assetizer.core.config import get_settings
+from bili_assetizer.core.db import _init_db_on
+from bili_assetizer.core.extract_select_service import _link_or_copy
+from bili_assetizer.core.index_service import index_asset
+from bili_assetizer.core.models import (
+    AssetStatus,
+    Manifest,
+    ManifestPaths,
+    StageStatus,
+)
+
+
+# (index, ts_ms, hash, score) for the five synthetic frames shared by the
+# timeline, select and ocr fixtures.
+_TIMELINE_FRAMES = [
+    (1, 0, "h1", 0.10),
+    (2, 6000, "h2", 0.35),
+    (3, 18000, "h3", 0.65),
+    (4, 33000, "h4", 0.45),
+    (5, 39000, "h5", 0.55),
+]
+
+# (index, bucket_index, ocr_text) for the top 3 frames picked by select:
+# KF_000003 (0.65), KF_000005 (0.55), KF_000004 (0.45), sorted by timestamp.
+_SELECTED_FRAMES = [
+    (3, 1, "Hello World"),
+    (4, 2, "Test Text"),
+    (5, 2, "Sample Data"),
+]
+
+_OCR_LANG = "eng+chi_sim"
+
+# Completed-stage manifest entries keyed by stage name. Fixtures combine them
+# via _completed_stages() instead of rebuilding the dicts inline.
+_STAGE_TEMPLATES: dict[str, dict] = {
+    "source": {
+        "status": "completed",
+        "video_path": "source/video.mp4",
+        "updated_at": None,
+        "errors": [],
+    },
+    "frames": {
+        "status": "completed",
+        "frame_count": 5,
+        "frames_dir": "frames_passA",
+        "frames_file": "frames_passA.jsonl",
+        "params": {
+            "interval_sec": 3.0,
+            "max_frames": None,
+            "scene_thresh": None,
+        },
+        "updated_at": None,
+        "errors": [],
+    },
+    "timeline": {
+        "status": "completed",
+        "bucket_count": 3,
+        "timeline_file": "timeline.json",
+        "scores_file": "frame_scores.jsonl",
+        "params": {"bucket_sec": 15},
+        "updated_at": None,
+        "errors": [],
+    },
+    "select": {
+        "status": "completed",
+        "frame_count": 3,
+        "bucket_count": 2,
+        "selected_dir": "frames_selected",
+        "selected_file": "selected.json",
+        "params": {"top_buckets": 10, "max_frames": 30},
+        "updated_at": None,
+        "errors": [],
+    },
+    "ocr": {
+        "status": "completed",
+        "frame_count": 3,
+        "ocr_file": "frames_ocr.jsonl",
+        "structured_file": "frames_ocr_structured.jsonl",
+        "params": {"lang": _OCR_LANG, "psm": 6, "tsv": True},
+        "updated_at": None,
+        "errors": [],
+    },
+    "transcript": {
+        "status": "completed",
+        "segment_count": 3,
+        "transcript_file": "transcript.jsonl",
+        "audio_path": "audio/audio.m4a",
+        "params": {"provider": "tencent", "format": 0},
+        "updated_at": None,
+        "errors": [],
+    },
+}
+
+# Solid-color frames only need to be readable images; nothing inspects their
+# pixels or dimensions, so keep them tiny to make PNG encoding cheap.
+_SOLID_FRAME_SIZE = (16, 16)
+
+
+def _solid_png_bytes(level: int) -> bytes:
+    """Encode a solid gray frame as PNG bytes."""
+    buf = io.BytesIO()
+    Image.new("RGB", _SOLID_FRAME_SIZE, color=(level, level, level)).save(
+        buf, "PNG", compress_level=0
+    )
+    return buf.getvalue()
 
-from bili_assetizer.core.db import init_db
-from bili_assetizer.core.models import AssetStatus, Manifest, ManifestPaths
-import subprocess
+
+# Encoded once at import; fixtures write these bytes instead of re-running
+# the PNG encoder for every test.
+_SOLID_FRAME_PNGS = [_solid_png_bytes(50 * i) for i in range(1, 6)]
+
+
+def _completed_stages(*names: str, **overrides: dict) -> dict[str, dict]:
+    """Build a manifest stages dict from _STAGE_TEMPLATES.
+
+    Each named stage is copied, stamped with a shared updated_at, and updated
+    with any per-stage overrides passed as keyword arguments.
+    """
+    updated_at = datetime.now(timezone.utc).isoformat()
+    stages = {}
+    for name in names:
+        stage = copy.deepcopy(_STAGE_TEMPLATES[name])
+        stage.update(overrides.get(name, {}))
+        stage["updated_at"] = updated_at
+        stages[name] = stage
+    return stages
+
+
+# manifest.json of an asset whose timeline is done but select never ran; the
+# content is constant, so it is serialized once at import.
+_MISSING_SELECT_MANIFEST_JSON = Manifest(
+    asset_id="BV1noselect",
+    source_url="https://www.bilibili.com/video/BV1noselect",
+    status=AssetStatus.INGESTED,
+    fingerprint="test",
+    stages=_completed_stages("timeline"),
+).to_json(indent=None)
+
+
+# json.dumps() builds a fresh JSONEncoder whenever non-default options are
+# passed, so bind a single encoder for JSONL lines.
+_encode_json_line = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _make_asset_dirs(asset_dir: Path, *subdirs: str) -> None:
+    """Create asset_dir and the given subdirectories.
+
+    Each leaf is created with parents=True, so asset_dir itself is made by
+    the first subdirectory instead of a separate mkdir call.
+    """
+    if not subdirs:
+        asset_dir.mkdir(parents=True)
+    for subdir in subdirs:
+        (asset_dir / subdir).mkdir(parents=True, exist_ok=True)
+
+
+def _jsonl_text(records: list[dict]) -> str:
+    """Serialize records as JSONL text, one object per line."""
+    return "".join(_encode_json_line(record) + "\n" for record in records)
+
+
+def _write_asset_files(asset_dir: Path, files: dict[str, str]) -> None:
+    """Write pre-serialized file bodies relative to asset_dir."""
+    for name, body in files.items():
+        (asset_dir / name).write_text(body, encoding="utf-8")
+
+
+def _frame_record(i: int, ts_ms: int, frame_hash: str) -> dict:
+    """Build a frames_passA.jsonl record for frame index i."""
+    return {
+        "frame_id": f"KF_{i:06d}",
+        "ts_ms": ts_ms,
+        "path": f"frames_passA/frame_{i:06d}.png",
+        "hash": frame_hash,
+        "source": "uniform",
+        "is_duplicate": False,
+        "duplicate_of": None,
+    }
+
+
+def _timeline_frame_records() -> list[dict]:
+    """frames_passA.jsonl records for _TIMELINE_FRAMES."""
+    return [_frame_record(i, ts, h) for i, ts, h, _ in _TIMELINE_FRAMES]
+
+
+def _timeline_score_records() -> list[dict]:
+    """frame_scores.jsonl records for _TIMELINE_FRAMES."""
+    return [
+        {"frame_id": f"KF_{i:06d}", "ts_ms": ts, "score": score}
+        for i, ts, _, score in _TIMELINE_FRAMES
+    ]
+
+
+def _selected_frame_records() -> list[dict]:
+    """selected.json frame entries for _SELECTED_FRAMES."""
+    by_index = {i: (ts, score) for i, ts, _, score in _TIMELINE_FRAMES}
+    return [
+        {
+            "frame_id": f"KF_{i:06d}",
+            "ts_ms": by_index[i][0],
+            "score": by_index[i][1],
+            "src_path": f"frames_passA/frame_{i:06d}.png",
+            "dst_path": f"frames_selected/frame_{i:06d}.png",
+            "bucket_index": bucket_index,
+        }
+        for i, bucket_index, _ in _SELECTED_FRAMES
+    ]
+
+
+def _ocr_records() -> list[dict]:
+    """frames_ocr.jsonl records for _SELECTED_FRAMES."""
+    by_index = {i: ts for i, ts, _, _ in _TIMELINE_FRAMES}
+    return [
+        {
+            "frame_id": f"KF_{i:06d}",
+            "ts_ms": by_index[i],
+            "image_path": f"frames_selected/frame_{i:06d}.png",
+            "lang": _OCR_LANG,
+            "psm": 6,
+            "text": text,
+        }
+        for i, _, text in _SELECTED_FRAMES
+    ]
+
+
+def _ocr_structured_records() -> list[dict]:
+    """frames_ocr_structured.jsonl records for _SELECTED_FRAMES."""
+    records = []
+    for record in _ocr_records():
+        text = record.pop("text")
+        records.append(
+            {**record, "text_raw": text, "text_norm": text, "words": [], "lines": []}
+        )
+    return records
+
+
+# timeline.json body shared by the timeline/select/ocr fixtures.
+_TIMELINE = {
+    "bucket_sec": 15,
+    "buckets": [
+        {
+            "start_ms": 0,
+            "end_ms": 15000,
+            "score": 0.225,
+            "top_frame_ids": ["KF_000002", "KF_000001"],
+        },
+        {
+            "start_ms": 15000,
+            "end_ms": 30000,
+            "score": 0.65,
+            "top_frame_ids": ["KF_000003"],
+        },
+        {
+            "start_ms": 30000,
+            "end_ms": 45000,
+            "score": 0.50,
+            "top_frame_ids": ["KF_000005", "KF_000004"],
+        },
+    ],
+}
+
+_SELECTED_BUCKETS = [
+    {"start_ms": 15000, "end_ms": 30000, "score": 0.65, "bucket_index": 0},
+    {"start_ms": 30000, "end_ms": 45000, "score": 0.50, "bucket_index": 1},
+]
+
+_TRANSCRIPT_SEGMENTS_EN = [
+    {
+        "segment_id": "SEG_000001",
+        "start_ms": 0,
+        "end_ms": 28000,
+        "text": "Hello everyone, welcome to this tutorial about Python programming.",
+    },
+    {
+        "segment_id": "SEG_000002",
+        "start_ms": 28000,
+        "end_ms": 56000,
+        "text": "Today we will learn about data structures and algorithms.",
+    },
+    {
+        "segment_id": "SEG_000003",
+        "start_ms": 56000,
+        "end_ms": 84000,
+        "text": "Let's start with arrays and linked lists in Python.",
+    },
+]
+
+_TRANSCRIPT_OCR_RECORDS_EN = [
+    {
+        "frame_id": "KF_000001",
+        "ts_ms": 15000,
+        "image_path": "frames_selected/frame_000001.png",
+        "lang": "eng",
+        "psm": 6,
+        "text": "Python Tutorial Introduction",
+    },
+    {
+        "frame_id": "KF_000002",
+        "ts_ms": 42000,
+        "image_path": "frames_selected/frame_000002.png",
+        "lang": "eng",
+        "psm": 6,
+        "text": "Data Structures Overview",
+    },
+]
+
+_TRANSCRIPT_SEGMENTS_ZH = [
+    {
+        "segment_id": "SEG_000001",
+        "start_ms": 0,
+        "end_ms": 8000,
+        "text": "大家好，欢迎来到本期视频，今天我们来聊一聊处理器的性能。",
+    },
+    {
+        "segment_id": "SEG_000002",
+        "start_ms": 8000,
+        "end_ms": 16000,
+        "text": "英特尔最新的第十二代酷睿处理器采用了混合架构设计。",
+    },
+    {
+        "segment_id": "SEG_000003",
+        "start_ms": 16000,
+        "end_ms": 24000,
+        "text": "这款CPU在多核性能和单核性能上都有明显提升。",
+    },
+]
+
+_TRANSCRIPT_OCR_RECORDS_ZH = [
+    {
+        "frame_id": "KF_000001",
+        "ts_ms": 5000,
+        "image_path": "frames_selected/frame_000001.png",
+        "lang": "chi_sim",
+        "psm": 6,
+        "text": "处理器性能测试",
+    },
+    {
+        "frame_id": "KF_000002",
+        "ts_ms": 12000,
+        "image_path": "frames_selected/frame_000002.png",
+        "lang": "chi_sim",
+        "psm": 6,
+        "text": "英特尔酷睿i9",
+    },
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _pipeline_stage_files(stages: tuple[str, ...]) -> dict[str, str]:
+    """Serialized artifact bodies for the given completed pipeline stages.
+
+    Memoized per stage tuple, so each combination is encoded once per
+    session. Callers must not mutate the returned dict.
+    """
+    files = {}
+    if "frames" in stages:
+        files["frames_passA.jsonl"] = _jsonl_text(_timeline_frame_records())
+    if "timeline" in stages:
+        files["frame_scores.jsonl"] = _jsonl_text(_timeline_score_records())
+        files["timeline.json"] = json.dumps(_TIMELINE, indent=2)
+    if "select" in stages:
+        selected_data = {
+            "params": {"top_buckets": 10, "max_frames": 30},
+            "buckets": _SELECTED_BUCKETS,
+            "frames": _selected_frame_records(),
+        }
+        files["selected.json"] = json.dumps(selected_data, indent=2)
+    if "ocr" in stages:
+        files["frames_ocr.jsonl"] = _jsonl_text(_ocr_records())
+        files["frames_ocr_structured.jsonl"] = _jsonl_text(_ocr_structured_records())
+    return files
+
+
+def _write_manifest(asset_dir: Path, stages: dict[str, dict]) -> None:
+    """Write an ingested manifest for asset_dir with the given stages."""
+    asset_id = asset_dir.name
+    manifest = Manifest(
+        asset_id=asset_id,
+        source_url=f"https://www.bilibili.com/video/{asset_id}",
+        status=AssetStatus.INGESTED,
+        fingerprint="test_fingerprint",
+        stages=stages,
+    )
+    (asset_dir / "manifest.json").write_text(
+        manifest.to_json(indent=None), encoding="utf-8"
+    )
+
+
+def _build_pipeline_asset(
+    assets_dir: Path, asset_id: str, stages: tuple[str, ...]
+) -> Path:
+    """Materialize an asset with source plus the given stages completed.
+
+    Stages are a prefix of ("frames", "timeline", "select", "ocr"); each adds
+    its artifacts on top of the previous ones using the shared frame tables.
+    """
+    asset_dir = assets_dir / asset_id
+    subdirs = ["frames_passA"] + (["frames_selected"] if "select" in stages else [])
+    _make_asset_dirs(asset_dir, *subdirs)
+
+    frames_dir = asset_dir / "frames_passA"
+    for i, png in enumerate(_SOLID_FRAME_PNGS, start=1):
+        (frames_dir / f"frame_{i:06d}.png").write_bytes(png)
+
+    if "select" in stages:
+        for frame in _selected_frame_records():
+            _link_or_copy(asset_dir / frame["src_path"], asset_dir / frame["dst_path"])
+
+    _write_asset_files(asset_dir, _pipeline_stage_files(stages))
+    _write_manifest(asset_dir, _completed_stages("source", *stages))
+    return asset_dir
+
+
+def _clone_asset(template: Path, assets_dir: Path) -> Path:
+    """Clone a template asset into assets_dir.
+
+    Artifacts are hardlinked; manifest.json is copied because tests rewrite
+    it in place.
+    """
+    asset_dir = assets_dir / template.name
+    shutil.copytree(
+        template,
+        asset_dir,
+        ignore=shutil.ignore_patterns("manifest.json"),
+        copy_function=_link_or_copy,
+    )
+    shutil.copy2(template / "manifest.json", asset_dir / "manifest.json")
+    return asset_dir
+
+
+def _build_transcript_asset(
+    assets_dir: Path,
+    asset_id: str,
+    segments: list[dict],
+    ocr_records: list[dict],
+) -> Path:
+    """Materialize an asset with completed source and transcript stages."""
+    asset_dir = assets_dir / asset_id
+    asset_dir.mkdir()
+    _write_asset_files(
+        asset_dir,
+        {
+            "transcript.jsonl": _jsonl_text(segments),
+            "frames_ocr.jsonl": _jsonl_text(ocr_records),
+        },
+    )
+    _write_manifest(asset_dir, _completed_stages("source", "transcript"))
+    return asset_dir
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings_cache():
+    """Drop the cached global settings around each test."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
 
 
 @pytest.fixture(autouse=True)
@@ -48,10 +511,46 @@ def tmp_db_path(tmp_data_dir: Path) -> Path:
     return tmp_data_dir / "test.db"
 
 
+@pytest.fixture(scope="session")
+def _template_db():
+    """In-memory database holding the schema, built once per session."""
+    conn = sqlite3.connect(":memory:")
+    _init_db_on(conn)
+    yield conn
+    conn.close()
+
+
+def _seed_assets(db_path: Path, asset_ids: list[str]) -> None:
+    """Insert minimal assets rows in one unsynced transaction."""
+    rows = [(a, f"https://bilibili.com/video/{a}") for a in asset_ids]
+    with closing(sqlite3.connect(db_path)) as conn:
+        # Test data only: skip fsync on commit
+        conn.execute("PRAGMA synchronous=OFF")
+        with conn:
+            conn.executemany(
+                "INSERT INTO assets (asset_id, source_url) VALUES (?, ?)", rows
+            )
+
+
 @pytest.fixture
-def initialized_db(tmp_db_path: Path) -> Path:
-    """Database with schema initialized."""
-    init_db(tmp_db_path)
+def seed_assets():
+    """Helper inserting assets rows: seed_assets(db_path, asset_ids)."""
+    return _seed_assets
+
+
+@pytest.fixture
+def initialized_db(tmp_db_path: Path, _template_db: sqlite3.Connection) -> Path:
+    """Database with schema initialized.
+
+    Pages are copied from _template_db with the backup API instead of
+    replaying the DDL; journal mode is then switched to WAL to match init_db.
+    """
+    dst = sqlite3.connect(tmp_db_path)
+    try:
+        _template_db.backup(dst)
+        dst.execute("PRAGMA journal_mode=WAL")
+    finally:
+        dst.close()
     return tmp_db_path
 
 
@@ -64,7 +563,7 @@ def sample_asset(tmp_assets_dir: Path) -> tuple[str, Path]:
     """
     asset_id = "BV1test12345"
     asset_dir = tmp_assets_dir / asset_id
-    asset_dir.mkdir(parents=True)
+    _make_asset_dirs(asset_dir, "source_api")
 
     # Create manifest
     manifest = Manifest(
@@ -75,13 +574,12 @@ def sample_asset(tmp_assets_dir: Path) -> tuple[str, Path]:
         paths=ManifestPaths(),
     )
 
-    manifest_path = asset_dir / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest.to_dict(), f)
+    (asset_dir / "manifest.json").write_text(
+        manifest.to_json(indent=None), encoding="utf-8"
+    )
 
     # Create source_api directory with sample data
     source_api_dir = asset_dir / "source_api"
-    source_api_dir.mkdir(parents=True)
 
     # Create sample view.json
     view_data = {
@@ -143,9 +641,8 @@ def sample_asset(tmp_assets_dir: Path) -> tuple[str, Path]:
     return asset_id, asset_dir
 
 
-@pytest.fixture
-def sample_view_response() -> dict:
-    """Sample Bilibili view API response."""
+def _view_response() -> dict:
+    """Build a fresh sample Bilibili view API response."""
     return {
         "code": 0,
         "message": "0",
@@ -179,8 +676,13 @@ def sample_view_response() -> dict:
 
 
 @pytest.fixture
-def sample_playurl_response() -> dict:
-    """Sample Bilibili playurl API response."""
+def sample_view_response() -> dict:
+    """Sample Bilibili view API response."""
+    return _view_response()
+
+
+def _playurl_response() -> dict:
+    """Build a fresh sample Bilibili playurl API response."""
     return {
         "code": 0,
         "message": "0",
@@ -214,6 +716,12 @@ def sample_playurl_response() -> dict:
     }
 
 
+@pytest.fixture
+def sample_playurl_response() -> dict:
+    """Sample Bilibili playurl API response."""
+    return _playurl_response()
+
+
 @pytest.fixture
 def sample_video_file(tmp_path: Path) -> Path:
     """Create a dummy video file for testing."""
@@ -224,16 +732,22 @@ def sample_video_file(tmp_path: Path) -> Path:
 
 @pytest.fixture
 def sample_asset_with_provenance(
-    tmp_assets_dir: Path, sample_view_response: dict, sample_playurl_response: dict
+    request: pytest.FixtureRequest,
+    tmp_assets_dir: Path,
+    sample_view_response: dict,
+    sample_playurl_response: dict,
 ) -> Path:
-    """Create an asset with provenance files."""
+    """Create an asset with provenance files.
+
+    Parametrize indirectly with a stages dict to write the manifest with
+    those stages up front instead of rewriting it in the test.
+    """
     asset_id = "BV1vCzDBYEEa"
     asset_dir = tmp_assets_dir / asset_id
-    asset_dir.mkdir()
+    _make_asset_dirs(asset_dir, "source_api")
 
     # Create provenance
     source_api_dir = asset_dir / "source_api"
-    source_api_dir.mkdir()
     (source_api_dir / "view.json").write_text(json.dumps(sample_view_response))
     (source_api_dir / "playurl.json").write_text(json.dumps(sample_playurl_response))
 
@@ -243,10 +757,11 @@ def sample_asset_with_provenance(
         source_url=f"https://www.bilibili.com/video/{asset_id}",
         status=AssetStatus.INGESTED,
         fingerprint="test_fingerprint",
+        stages=getattr(request, "param", {}),
+    )
+    (asset_dir / "manifest.json").write_text(
+        manifest.to_json(indent=None), encoding="utf-8"
     )
-    manifest_path = asset_dir / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest.to_dict(), f)
 
     # Create metadata.json for testing
     metadata = {
@@ -262,14 +777,15 @@ def sample_asset_with_provenance(
     return asset_dir
 
 
-@pytest.fixture
-def tiny_test_video(tmp_path: Path) -> Path:
-    """Create a tiny test video that ffmpeg can process.
+@pytest.fixture(scope="session")
+def tiny_test_video(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a tiny test video that ffmpeg can process, once per session.
 
     Uses ffmpeg to generate a 3-second test pattern video.
     Falls back to a minimal fake video if ffmpeg not available.
+    Tests must treat the file as read-only.
     """
-    video_path = tmp_path / "test_video.mp4"
+    video_path = tmp_path_factory.mktemp("video") / "test_video.mp4"
 
     # Try to generate a real video with ffmpeg test pattern
     try:
@@ -300,32 +816,35 @@ def tiny_test_video(tmp_path: Path) -> Path:
     return video_path
 
 
-@pytest.fixture
-def sample_asset_with_source(
-    tmp_assets_dir: Path,
-    sample_view_response: dict,
-    sample_playurl_response: dict,
-    tiny_test_video: Path,
+@pytest.fixture(scope="session")
+def source_asset_template(
+    tmp_path_factory: pytest.TempPathFactory, tiny_test_video: Path
 ) -> Path:
-    """Create an asset with completed source stage and video file."""
-    import shutil
-    from datetime import datetime, timezone
+    """Build the provenance and source video tree of a source asset once.
 
-    asset_id = "BV1vCzDBYEEa"
-    asset_dir = tmp_assets_dir / asset_id
-    asset_dir.mkdir()
+    The manifest is left out because tests rewrite it in place; everything
+    else is hardlinked per test and must be treated as read-only.
+    """
+    asset_dir = tmp_path_factory.mktemp("source_asset") / "BV1vCzDBYEEa"
+    _make_asset_dirs(asset_dir, "source_api", "source")
 
     # Create provenance
     source_api_dir = asset_dir / "source_api"
-    source_api_dir.mkdir()
-    (source_api_dir / "view.json").write_text(json.dumps(sample_view_response))
-    (source_api_dir / "playurl.json").write_text(json.dumps(sample_playurl_response))
+    (source_api_dir / "view.json").write_text(json.dumps(_view_response()))
+    (source_api_dir / "playurl.json").write_text(json.dumps(_playurl_response()))
 
     # Create source directory with video
-    source_dir = asset_dir / "source"
-    source_dir.mkdir()
-    video_path = source_dir / "video.mp4"
-    shutil.copy2(tiny_test_video, video_path)
+    _link_or_copy(tiny_test_video, asset_dir / "source" / "video.mp4")
+
+    return asset_dir
+
+
+@pytest.fixture
+def sample_asset_with_source(tmp_assets_dir: Path, source_asset_template: Path) -> Path:
+    """Create an asset with completed source stage and video file."""
+    asset_id = source_asset_template.name
+    asset_dir = tmp_assets_dir / asset_id
+    shutil.copytree(source_asset_template, asset_dir, copy_function=_link_or_copy)
 
     # Create manifest with completed source stage
     manifest = Manifest(
@@ -333,43 +852,29 @@ def sample_asset_with_source(
         source_url=f"https://www.bilibili.com/video/{asset_id}",
         status=AssetStatus.INGESTED,
         fingerprint="test_fingerprint",
-        stages={
-            "source": {
-                "status": "completed",
-                "video_path": "source/video.mp4",
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            }
-        },
+        stages=_completed_stages("source"),
+    )
+    (asset_dir / "manifest.json").write_text(
+        manifest.to_json(indent=None), encoding="utf-8"
     )
-    manifest_path = asset_dir / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest.to_dict(), f)
 
     return asset_dir
 
 
-@pytest.fixture
-def sample_asset_with_frames(tmp_assets_dir: Path) -> Path:
-    """Create an asset with completed frames stage and synthetic images.
+@pytest.fixture(scope="session")
+def density_frames_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Render the info-density test frames once per session.
 
     Creates:
     - Solid gray image (low info density)
     - Gradient pattern (medium info density)
     - Checkerboard (high info density)
-    """
-    from datetime import datetime, timezone
-    from PIL import Image
 
-    asset_id = "BV1testframes"
-    asset_dir = tmp_assets_dir / asset_id
-    asset_dir.mkdir()
-
-    # Create frames directory
-    frames_dir = asset_dir / "frames_passA"
-    frames_dir.mkdir()
+    Per-test fixtures hardlink these files instead of redrawing them pixel by
+    pixel; tests must treat them as read-only.
+    """
+    frames_dir = tmp_path_factory.mktemp("density_frames")
 
-    # Create synthetic images with different info densities
     # 1. Solid gray (low info density)
     img_gray = Image.new("RGB", (320, 240), color=(128, 128, 128))
     img_gray.save(frames_dir / "frame_000001.png")
@@ -392,40 +897,37 @@ def sample_asset_with_frames(tmp_assets_dir: Path) -> Path:
                 img_checker.putpixel((x, y), (0, 0, 0))
     img_checker.save(frames_dir / "frame_000003.png")
 
+    return frames_dir
+
+
+@pytest.fixture
+def sample_asset_with_frames(
+    tmp_assets_dir: Path, density_frames_template: Path
+) -> Path:
+    """Create an asset with completed frames stage and synthetic images.
+
+    Frames are hardlinked from density_frames_template.
+    """
+
+    asset_id = "BV1testframes"
+    asset_dir = tmp_assets_dir / asset_id
+    _make_asset_dirs(asset_dir, "frames_passA")
+
+    frames_dir = asset_dir / "frames_passA"
+    for i in range(1, 4):
+        name = f"frame_{i:06d}.png"
+        _link_or_copy(density_frames_template / name, frames_dir / name)
+
     # Create frames metadata JSONL
     frames_metadata = [
-        {
-            "frame_id": "KF_000001",
-            "ts_ms": 0,
-            "path": "frames_passA/frame_000001.png",
-            "hash": "abc111",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000002",
-            "ts_ms": 3000,
-            "path": "frames_passA/frame_000002.png",
-            "hash": "abc222",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000003",
-            "ts_ms": 6000,
-            "path": "frames_passA/frame_000003.png",
-            "hash": "abc333",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
+        _frame_record(1, 0, "abc111"),
+        _frame_record(2, 3000, "abc222"),
+        _frame_record(3, 6000, "abc333"),
     ]
 
-    with open(asset_dir / "frames_passA.jsonl", "w", encoding="utf-8") as f:
-        for frame in frames_metadata:
-            f.write(json.dumps(frame) + "\n")
+    (asset_dir / "frames_passA.jsonl").write_text(
+        _jsonl_text(frames_metadata), encoding="utf-8"
+    )
 
     # Create manifest with completed frames stage
     manifest = Manifest(
@@ -433,31 +935,13 @@ def sample_asset_with_frames(tmp_assets_dir: Path) -> Path:
         source_url=f"https://www.bilibili.com/video/{asset_id}",
         status=AssetStatus.INGESTED,
         fingerprint="test_fingerprint",
-        stages={
-            "source": {
-                "status": "completed",
-                "video_path": "source/video.mp4",
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-            "frames": {
-                "status": "completed",
-                "frame_count": 3,
-                "frames_dir": "frames_passA",
-                "frames_file": "frames_passA.jsonl",
-                "params": {
-                    "interval_sec": 3.0,
-                    "max_frames": None,
-                    "scene_thresh": None,
-                },
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-        },
+        stages=_completed_stages(
+            "source", "frames", frames={"frame_count": 3}
+        ),
+    )
+    (asset_dir / "manifest.json").write_text(
+        manifest.to_json(indent=None), encoding="utf-8"
     )
-    manifest_path = asset_dir / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest.to_dict(), f)
 
     return asset_dir
 
@@ -476,162 +960,27 @@ def sample_asset_with_timeline(tmp_assets_dir: Path) -> Path:
     - Bucket 1 (15000-30000ms): KF_000003 (score 0.65)
     - Bucket 2 (30000-45000ms): KF_000004 (score 0.45), KF_000005 (score 0.55)
     """
-    from datetime import datetime, timezone
-    from PIL import Image
-
-    asset_id = "BV1testtimeline"
-    asset_dir = tmp_assets_dir / asset_id
-    asset_dir.mkdir()
-
-    # Create frames directory
-    frames_dir = asset_dir / "frames_passA"
-    frames_dir.mkdir()
-
-    # Create 5 synthetic images
-    for i in range(1, 6):
-        img = Image.new("RGB", (320, 240), color=(50 * i, 50 * i, 50 * i))
-        img.save(frames_dir / f"frame_00000{i}.png")
-
-    # Create frames metadata JSONL
-    frames_metadata = [
-        {
-            "frame_id": "KF_000001",
-            "ts_ms": 0,
-            "path": "frames_passA/frame_000001.png",
-            "hash": "h1",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000002",
-            "ts_ms": 6000,
-            "path": "frames_passA/frame_000002.png",
-            "hash": "h2",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000003",
-            "ts_ms": 18000,
-            "path": "frames_passA/frame_000003.png",
-            "hash": "h3",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000004",
-            "ts_ms": 33000,
-            "path": "frames_passA/frame_000004.png",
-            "hash": "h4",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000005",
-            "ts_ms": 39000,
-            "path": "frames_passA/frame_000005.png",
-            "hash": "h5",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-    ]
-
-    with open(asset_dir / "frames_passA.jsonl", "w", encoding="utf-8") as f:
-        for frame in frames_metadata:
-            f.write(json.dumps(frame) + "\n")
-
-    # Create frame_scores.jsonl
-    frame_scores = [
-        {"frame_id": "KF_000001", "ts_ms": 0, "score": 0.10},
-        {"frame_id": "KF_000002", "ts_ms": 6000, "score": 0.35},
-        {"frame_id": "KF_000003", "ts_ms": 18000, "score": 0.65},
-        {"frame_id": "KF_000004", "ts_ms": 33000, "score": 0.45},
-        {"frame_id": "KF_000005", "ts_ms": 39000, "score": 0.55},
-    ]
+    return _build_pipeline_asset(
+        tmp_assets_dir, "BV1testtimeline", ("frames", "timeline")
+    )
 
-    with open(asset_dir / "frame_scores.jsonl", "w", encoding="utf-8") as f:
-        for score in frame_scores:
-            f.write(json.dumps(score) + "\n")
-
-    # Create timeline.json with 3 buckets
-    timeline = {
-        "bucket_sec": 15,
-        "buckets": [
-            {
-                "start_ms": 0,
-                "end_ms": 15000,
-                "score": 0.225,
-                "top_frame_ids": ["KF_000002", "KF_000001"],
-            },
-            {
-                "start_ms": 15000,
-                "end_ms": 30000,
-                "score": 0.65,
-                "top_frame_ids": ["KF_000003"],
-            },
-            {
-                "start_ms": 30000,
-                "end_ms": 45000,
-                "score": 0.50,
-                "top_frame_ids": ["KF_000005", "KF_000004"],
-            },
-        ],
-    }
 
-    with open(asset_dir / "timeline.json", "w", encoding="utf-8") as f:
-        json.dump(timeline, f, indent=2)
+@pytest.fixture(scope="session")
+def select_asset_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the select-stage asset once per session.
 
-    # Create manifest with completed timeline stage
-    manifest = Manifest(
-        asset_id=asset_id,
-        source_url=f"https://www.bilibili.com/video/{asset_id}",
-        status=AssetStatus.INGESTED,
-        fingerprint="test_fingerprint",
-        stages={
-            "source": {
-                "status": "completed",
-                "video_path": "source/video.mp4",
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-            "frames": {
-                "status": "completed",
-                "frame_count": 5,
-                "frames_dir": "frames_passA",
-                "frames_file": "frames_passA.jsonl",
-                "params": {
-                    "interval_sec": 3.0,
-                    "max_frames": None,
-                    "scene_thresh": None,
-                },
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-            "timeline": {
-                "status": "completed",
-                "bucket_count": 3,
-                "timeline_file": "timeline.json",
-                "scores_file": "frame_scores.jsonl",
-                "params": {"bucket_sec": 15},
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-        },
+    Per-test fixtures clone it with _clone_asset; tests must not modify the
+    template itself.
+    """
+    return _build_pipeline_asset(
+        tmp_path_factory.mktemp("select_asset"),
+        "BV1testselect",
+        ("frames", "timeline", "select"),
     )
-    manifest_path = asset_dir / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest.to_dict(), f)
-
-    return asset_dir
 
 
 @pytest.fixture
-def sample_asset_with_select(tmp_assets_dir: Path) -> Path:
+def sample_asset_with_select(tmp_assets_dir: Path, select_asset_template: Path) -> Path:
     """Create an asset with completed select stage.
 
     Builds on sample_asset_with_timeline pattern and adds:
@@ -641,220 +990,17 @@ def sample_asset_with_select(tmp_assets_dir: Path) -> Path:
 
     Creates 3 selected frames from 5 total frames.
     """
-    from datetime import datetime, timezone
-    from PIL import Image
-    import shutil
-
-    asset_id = "BV1testselect"
-    asset_dir = tmp_assets_dir / asset_id
-    asset_dir.mkdir()
-
-    # Create frames_passA directory with source images
-    frames_dir = asset_dir / "frames_passA"
-    frames_dir.mkdir()
-
-    # Create 5 synthetic images
-    for i in range(1, 6):
-        img = Image.new("RGB", (320, 240), color=(50 * i, 50 * i, 50 * i))
-        img.save(frames_dir / f"frame_00000{i}.png")
-
-    # Create frames metadata JSONL
-    frames_metadata = [
-        {
-            "frame_id": "KF_000001",
-            "ts_ms": 0,
-            "path": "frames_passA/frame_000001.png",
-            "hash": "h1",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000002",
-            "ts_ms": 6000,
-            "path": "frames_passA/frame_000002.png",
-            "hash": "h2",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000003",
-            "ts_ms": 18000,
-            "path": "frames_passA/frame_000003.png",
-            "hash": "h3",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000004",
-            "ts_ms": 33000,
-            "path": "frames_passA/frame_000004.png",
-            "hash": "h4",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000005",
-            "ts_ms": 39000,
-            "path": "frames_passA/frame_000005.png",
-            "hash": "h5",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-    ]
+    return _clone_asset(select_asset_template, tmp_assets_dir)
 
-    with open(asset_dir / "frames_passA.jsonl", "w", encoding="utf-8") as f:
-        for frame in frames_metadata:
-            f.write(json.dumps(frame) + "\n")
-
-    # Create frame_scores.jsonl
-    frame_scores = [
-        {"frame_id": "KF_000001", "ts_ms": 0, "score": 0.10},
-        {"frame_id": "KF_000002", "ts_ms": 6000, "score": 0.35},
-        {"frame_id": "KF_000003", "ts_ms": 18000, "score": 0.65},
-        {"frame_id": "KF_000004", "ts_ms": 33000, "score": 0.45},
-        {"frame_id": "KF_000005", "ts_ms": 39000, "score": 0.55},
-    ]
-
-    with open(asset_dir / "frame_scores.jsonl", "w", encoding="utf-8") as f:
-        for score in frame_scores:
-            f.write(json.dumps(score) + "\n")
-
-    # Create timeline.json with 3 buckets
-    timeline = {
-        "bucket_sec": 15,
-        "buckets": [
-            {
-                "start_ms": 0,
-                "end_ms": 15000,
-                "score": 0.225,
-                "top_frame_ids": ["KF_000002", "KF_000001"],
-            },
-            {
-                "start_ms": 15000,
-                "end_ms": 30000,
-                "score": 0.65,
-                "top_frame_ids": ["KF_000003"],
-            },
-            {
-                "start_ms": 30000,
-                "end_ms": 45000,
-                "score": 0.50,
-                "top_frame_ids": ["KF_000005", "KF_000004"],
-            },
-        ],
-    }
-
-    with open(asset_dir / "timeline.json", "w", encoding="utf-8") as f:
-        json.dump(timeline, f, indent=2)
-
-    # Create frames_selected/ directory with copied frames
-    selected_dir = asset_dir / "frames_selected"
-    selected_dir.mkdir()
-
-    # Select top 3 frames: KF_000003 (0.65), KF_000005 (0.55), KF_000004 (0.45)
-    # Sorted by timestamp: KF_000003, KF_000004, KF_000005
-    selected_frames = [
-        {
-            "frame_id": "KF_000003",
-            "ts_ms": 18000,
-            "score": 0.65,
-            "src_path": "frames_passA/frame_000003.png",
-            "dst_path": "frames_selected/frame_000003.png",
-            "bucket_index": 1,
-        },
-        {
-            "frame_id": "KF_000004",
-            "ts_ms": 33000,
-            "score": 0.45,
-            "src_path": "frames_passA/frame_000004.png",
-            "dst_path": "frames_selected/frame_000004.png",
-            "bucket_index": 2,
-        },
-        {
-            "frame_id": "KF_000005",
-            "ts_ms": 39000,
-            "score": 0.55,
-            "src_path": "frames_passA/frame_000005.png",
-            "dst_path": "frames_selected/frame_000005.png",
-            "bucket_index": 2,
-        },
-    ]
 
-    # Copy selected frames
-    for frame in selected_frames:
-        src = asset_dir / frame["src_path"]
-        dst = asset_dir / frame["dst_path"]
-        shutil.copy2(src, dst)
-
-    # Create selected.json
-    selected_data = {
-        "params": {"top_buckets": 10, "max_frames": 30},
-        "buckets": [
-            {"start_ms": 15000, "end_ms": 30000, "score": 0.65, "bucket_index": 0},
-            {"start_ms": 30000, "end_ms": 45000, "score": 0.50, "bucket_index": 1},
-        ],
-        "frames": selected_frames,
-    }
-
-    with open(asset_dir / "selected.json", "w", encoding="utf-8") as f:
-        json.dump(selected_data, f, indent=2)
-
-    # Create manifest with completed select stage
-    manifest = Manifest(
-        asset_id=asset_id,
-        source_url=f"https://www.bilibili.com/video/{asset_id}",
-        status=AssetStatus.INGESTED,
-        fingerprint="test_fingerprint",
-        stages={
-            "source": {
-                "status": "completed",
-                "video_path": "source/video.mp4",
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-            "frames": {
-                "status": "completed",
-                "frame_count": 5,
-                "frames_dir": "frames_passA",
-                "frames_file": "frames_passA.jsonl",
-                "params": {
-                    "interval_sec": 3.0,
-                    "max_frames": None,
-                    "scene_thresh": None,
-                },
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-            "timeline": {
-                "status": "completed",
-                "bucket_count": 3,
-                "timeline_file": "timeline.json",
-                "scores_file": "frame_scores.jsonl",
-                "params": {"bucket_sec": 15},
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-            "select": {
-                "status": "completed",
-                "frame_count": 3,
-                "bucket_count": 2,
-                "selected_dir": "frames_selected",
-                "selected_file": "selected.json",
-                "params": {"top_buckets": 10, "max_frames": 30},
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-        },
+@pytest.fixture
+def sample_asset_without_select(tmp_assets_dir: Path) -> Path:
+    """Create an asset with a completed timeline stage but no select stage."""
+    asset_dir = tmp_assets_dir / "BV1noselect"
+    asset_dir.mkdir()
+    (asset_dir / "manifest.json").write_text(
+        _MISSING_SELECT_MANIFEST_JSON, encoding="utf-8"
     )
-    manifest_path = asset_dir / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest.to_dict(), f)
-
     return asset_dir
 
 
@@ -867,91 +1013,39 @@ def sample_asset_with_transcript(tmp_assets_dir: Path) -> Path:
     - frames_ocr.jsonl with 2 OCR records
     - Updated manifest with completed transcript stage
     """
-    from datetime import datetime, timezone
-
-    asset_id = "BV1testtranscript"
-    asset_dir = tmp_assets_dir / asset_id
-    asset_dir.mkdir()
-
-    # Create transcript.jsonl with known searchable content
-    transcript_segments = [
-        {
-            "segment_id": "SEG_000001",
-            "start_ms": 0,
-            "end_ms": 28000,
-            "text": "Hello everyone, welcome to this tutorial about Python programming.",
-        },
-        {
-            "segment_id": "SEG_000002",
-            "start_ms": 28000,
-            "end_ms": 56000,
-            "text": "Today we will learn about data structures and algorithms.",
-        },
-        {
-            "segment_id": "SEG_000003",
-            "start_ms": 56000,
-            "end_ms": 84000,
-            "text": "Let's start with arrays and linked lists in Python.",
-        },
-    ]
-
-    with open(asset_dir / "transcript.jsonl", "w", encoding="utf-8") as f:
-        for segment in transcript_segments:
-            f.write(json.dumps(segment, ensure_ascii=False) + "\n")
+    return _build_transcript_asset(
+        tmp_assets_dir,
+        "BV1testtranscript",
+        _TRANSCRIPT_SEGMENTS_EN,
+        _TRANSCRIPT_OCR_RECORDS_EN,
+    )
 
-    # Create frames_ocr.jsonl with OCR content
-    ocr_records = [
-        {
-            "frame_id": "KF_000001",
-            "ts_ms": 15000,
-            "image_path": "frames_selected/frame_000001.png",
-            "lang": "eng",
-            "psm": 6,
-            "text": "Python Tutorial Introduction",
-        },
-        {
-            "frame_id": "KF_000002",
-            "ts_ms": 42000,
-            "image_path": "frames_selected/frame_000002.png",
-            "lang": "eng",
-            "psm": 6,
-            "text": "Data Structures Overview",
-        },
-    ]
 
-    with open(asset_dir / "frames_ocr.jsonl", "w", encoding="utf-8") as f:
-        for record in ocr_records:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+@pytest.fixture(scope="session")
+def indexed_transcript_asset(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[Path, Path]:
+    """Index the English transcript asset into a fresh database once per session.
 
-    # Create manifest with completed transcript stage
-    manifest = Manifest(
-        asset_id=asset_id,
-        source_url=f"https://www.bilibili.com/video/{asset_id}",
-        status=AssetStatus.INGESTED,
-        fingerprint="test_fingerprint",
-        stages={
-            "source": {
-                "status": "completed",
-                "video_path": "source/video.mp4",
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-            "transcript": {
-                "status": "completed",
-                "segment_count": 3,
-                "transcript_file": "transcript.jsonl",
-                "audio_path": "audio/audio.m4a",
-                "params": {"provider": "tencent", "format": 0},
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-        },
+    Shared by the read-only evidence and query tests. Returns
+    (asset_dir, db_path); tests must treat both as read-only.
+    """
+    data_dir = tmp_path_factory.mktemp("indexed")
+    assets_dir = data_dir / "assets"
+    assets_dir.mkdir()
+    asset_dir = _build_transcript_asset(
+        assets_dir,
+        "BV1testtranscript",
+        _TRANSCRIPT_SEGMENTS_EN,
+        _TRANSCRIPT_OCR_RECORDS_EN,
     )
-    manifest_path = asset_dir / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest.to_dict(), f)
+    db_path = data_dir / "test.db"
 
-    return asset_dir
+    result = index_asset(
+        asset_id=asset_dir.name, assets_dir=assets_dir, db_path=db_path, force=False
+    )
+    assert result.status == StageStatus.COMPLETED, result.errors
+    return asset_dir, db_path
 
 
 @pytest.fixture
@@ -962,304 +1056,9 @@ def sample_asset_with_ocr(tmp_assets_dir: Path) -> Path:
     - frames_ocr.jsonl with OCR results
     - Updated manifest with completed ocr stage
     """
-    from datetime import datetime, timezone
-    from PIL import Image
-    import shutil
-
-    asset_id = "BV1testocr"
-    asset_dir = tmp_assets_dir / asset_id
-    asset_dir.mkdir()
-
-    # Create frames_passA directory with source images
-    frames_dir = asset_dir / "frames_passA"
-    frames_dir.mkdir()
-
-    # Create 5 synthetic images
-    for i in range(1, 6):
-        img = Image.new("RGB", (320, 240), color=(50 * i, 50 * i, 50 * i))
-        img.save(frames_dir / f"frame_00000{i}.png")
-
-    # Create frames metadata JSONL
-    frames_metadata = [
-        {
-            "frame_id": "KF_000001",
-            "ts_ms": 0,
-            "path": "frames_passA/frame_000001.png",
-            "hash": "h1",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000002",
-            "ts_ms": 6000,
-            "path": "frames_passA/frame_000002.png",
-            "hash": "h2",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000003",
-            "ts_ms": 18000,
-            "path": "frames_passA/frame_000003.png",
-            "hash": "h3",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000004",
-            "ts_ms": 33000,
-            "path": "frames_passA/frame_000004.png",
-            "hash": "h4",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-        {
-            "frame_id": "KF_000005",
-            "ts_ms": 39000,
-            "path": "frames_passA/frame_000005.png",
-            "hash": "h5",
-            "source": "uniform",
-            "is_duplicate": False,
-            "duplicate_of": None,
-        },
-    ]
-
-    with open(asset_dir / "frames_passA.jsonl", "w", encoding="utf-8") as f:
-        for frame in frames_metadata:
-            f.write(json.dumps(frame) + "\n")
-
-    # Create frame_scores.jsonl
-    frame_scores = [
-        {"frame_id": "KF_000001", "ts_ms": 0, "score": 0.10},
-        {"frame_id": "KF_000002", "ts_ms": 6000, "score": 0.35},
-        {"frame_id": "KF_000003", "ts_ms": 18000, "score": 0.65},
-        {"frame_id": "KF_000004", "ts_ms": 33000, "score": 0.45},
-        {"frame_id": "KF_000005", "ts_ms": 39000, "score": 0.55},
-    ]
-
-    with open(asset_dir / "frame_scores.jsonl", "w", encoding="utf-8") as f:
-        for score in frame_scores:
-            f.write(json.dumps(score) + "\n")
-
-    # Create timeline.json with 3 buckets
-    timeline = {
-        "bucket_sec": 15,
-        "buckets": [
-            {
-                "start_ms": 0,
-                "end_ms": 15000,
-                "score": 0.225,
-                "top_frame_ids": ["KF_000002", "KF_000001"],
-            },
-            {
-                "start_ms": 15000,
-                "end_ms": 30000,
-                "score": 0.65,
-                "top_frame_ids": ["KF_000003"],
-            },
-            {
-                "start_ms": 30000,
-                "end_ms": 45000,
-                "score": 0.50,
-                "top_frame_ids": ["KF_000005", "KF_000004"],
-            },
-        ],
-    }
-
-    with open(asset_dir / "timeline.json", "w", encoding="utf-8") as f:
-        json.dump(timeline, f, indent=2)
-
-    # Create frames_selected/ directory with copied frames
-    selected_dir = asset_dir / "frames_selected"
-    selected_dir.mkdir()
-
-    # Select top 3 frames
-    selected_frames = [
-        {
-            "frame_id": "KF_000003",
-            "ts_ms": 18000,
-            "score": 0.65,
-            "src_path": "frames_passA/frame_000003.png",
-            "dst_path": "frames_selected/frame_000003.png",
-            "bucket_index": 1,
-        },
-        {
-            "frame_id": "KF_000004",
-            "ts_ms": 33000,
-            "score": 0.45,
-            "src_path": "frames_passA/frame_000004.png",
-            "dst_path": "frames_selected/frame_000004.png",
-            "bucket_index": 2,
-        },
-        {
-            "frame_id": "KF_000005",
-            "ts_ms": 39000,
-            "score": 0.55,
-            "src_path": "frames_passA/frame_000005.png",
-            "dst_path": "frames_selected/frame_000005.png",
-            "bucket_index": 2,
-        },
-    ]
-
-    # Copy selected frames
-    for frame in selected_frames:
-        src = asset_dir / frame["src_path"]
-        dst = asset_dir / frame["dst_path"]
-        shutil.copy2(src, dst)
-
-    # Create selected.json
-    selected_data = {
-        "params": {"top_buckets": 10, "max_frames": 30},
-        "buckets": [
-            {"start_ms": 15000, "end_ms": 30000, "score": 0.65, "bucket_index": 0},
-            {"start_ms": 30000, "end_ms": 45000, "score": 0.50, "bucket_index": 1},
-        ],
-        "frames": selected_frames,
-    }
-
-    with open(asset_dir / "selected.json", "w", encoding="utf-8") as f:
-        json.dump(selected_data, f, indent=2)
-
-    # Create frames_ocr.jsonl
-    ocr_records = [
-        {
-            "frame_id": "KF_000003",
-            "ts_ms": 18000,
-            "image_path": "frames_selected/frame_000003.png",
-            "lang": "eng+chi_sim",
-            "psm": 6,
-            "text": "Hello World",
-        },
-        {
-            "frame_id": "KF_000004",
-            "ts_ms": 33000,
-            "image_path": "frames_selected/frame_000004.png",
-            "lang": "eng+chi_sim",
-            "psm": 6,
-            "text": "Test Text",
-        },
-        {
-            "frame_id": "KF_000005",
-            "ts_ms": 39000,
-            "image_path": "frames_selected/frame_000005.png",
-            "lang": "eng+chi_sim",
-            "psm": 6,
-            "text": "Sample Data",
-        },
-    ]
-
-    with open(asset_dir / "frames_ocr.jsonl", "w", encoding="utf-8") as f:
-        for record in ocr_records:
-            f.write(json.dumps(record) + "\n")
-
-    # Create frames_ocr_structured.jsonl
-    structured_records = [
-        {
-            "frame_id": "KF_000003",
-            "ts_ms": 18000,
-            "image_path": "frames_selected/frame_000003.png",
-            "lang": "eng+chi_sim",
-            "psm": 6,
-            "text_raw": "Hello World",
-            "text_norm": "Hello World",
-            "words": [],
-            "lines": [],
-        },
-        {
-            "frame_id": "KF_000004",
-            "ts_ms": 33000,
-            "image_path": "frames_selected/frame_000004.png",
-            "lang": "eng+chi_sim",
-            "psm": 6,
-            "text_raw": "Test Text",
-            "text_norm": "Test Text",
-            "words": [],
-            "lines": [],
-        },
-        {
-            "frame_id": "KF_000005",
-            "ts_ms": 39000,
-            "image_path": "frames_selected/frame_000005.png",
-            "lang": "eng+chi_sim",
-            "psm": 6,
-            "text_raw": "Sample Data",
-            "text_norm": "Sample Data",
-            "words": [],
-            "lines": [],
-        },
-    ]
-
-    with open(
-        asset_dir / "frames_ocr_structured.jsonl", "w", encoding="utf-8"
-    ) as f:
-        for record in structured_records:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
-
-    # Create manifest with completed ocr stage
-    manifest = Manifest(
-        asset_id=asset_id,
-        source_url=f"https://www.bilibili.com/video/{asset_id}",
-        status=AssetStatus.INGESTED,
-        fingerprint="test_fingerprint",
-        stages={
-            "source": {
-                "status": "completed",
-                "video_path": "source/video.mp4",
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-            "frames": {
-                "status": "completed",
-                "frame_count": 5,
-                "frames_dir": "frames_passA",
-                "frames_file": "frames_passA.jsonl",
-                "params": {
-                    "interval_sec": 3.0,
-                    "max_frames": None,
-                    "scene_thresh": None,
-                },
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-            "timeline": {
-                "status": "completed",
-                "bucket_count": 3,
-                "timeline_file": "timeline.json",
-                "scores_file": "frame_scores.jsonl",
-                "params": {"bucket_sec": 15},
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-            "select": {
-                "status": "completed",
-                "frame_count": 3,
-                "bucket_count": 2,
-                "selected_dir": "frames_selected",
-                "selected_file": "selected.json",
-                "params": {"top_buckets": 10, "max_frames": 30},
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-            "ocr": {
-                "status": "completed",
-                "frame_count": 3,
-                "ocr_file": "frames_ocr.jsonl",
-                "structured_file": "frames_ocr_structured.jsonl",
-                "params": {"lang": "eng+chi_sim", "psm": 6, "tsv": True},
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-        },
+    return _build_pipeline_asset(
+        tmp_assets_dir, "BV1testocr", ("frames", "timeline", "select", "ocr")
     )
-    manifest_path = asset_dir / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest.to_dict(), f)
-
-    return asset_dir
 
 
 @pytest.fixture
@@ -1271,88 +1070,9 @@ def sample_asset_with_chinese_transcript(tmp_assets_dir: Path) -> Path:
     - frames_ocr.jsonl with Chinese OCR records
     - Updated manifest with completed transcript stage
     """
-    from datetime import datetime, timezone
-
-    asset_id = "BV1testchinese"
-    asset_dir = tmp_assets_dir / asset_id
-    asset_dir.mkdir()
-
-    # Create transcript.jsonl with Chinese content
-    transcript_segments = [
-        {
-            "segment_id": "SEG_000001",
-            "start_ms": 0,
-            "end_ms": 8000,
-            "text": "大家好，欢迎来到本期视频，今天我们来聊一聊处理器的性能。",
-        },
-        {
-            "segment_id": "SEG_000002",
-            "start_ms": 8000,
-            "end_ms": 16000,
-            "text": "英特尔最新的第十二代酷睿处理器采用了混合架构设计。",
-        },
-        {
-            "segment_id": "SEG_000003",
-            "start_ms": 16000,
-            "end_ms": 24000,
-            "text": "这款CPU在多核性能和单核性能上都有明显提升。",
-        },
-    ]
-
-    with open(asset_dir / "transcript.jsonl", "w", encoding="utf-8") as f:
-        for segment in transcript_segments:
-            f.write(json.dumps(segment, ensure_ascii=False) + "\n")
-
-    # Create frames_ocr.jsonl with Chinese OCR content
-    ocr_records = [
-        {
-            "frame_id": "KF_000001",
-            "ts_ms": 5000,
-            "image_path": "frames_selected/frame_000001.png",
-            "lang": "chi_sim",
-            "psm": 6,
-            "text": "处理器性能测试",
-        },
-        {
-            "frame_id": "KF_000002",
-            "ts_ms": 12000,
-            "image_path": "frames_selected/frame_000002.png",
-            "lang": "chi_sim",
-            "psm": 6,
-            "text": "英特尔酷睿i9",
-        },
-    ]
-
-    with open(asset_dir / "frames_ocr.jsonl", "w", encoding="utf-8") as f:
-        for record in ocr_records:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
-
-    # Create manifest with completed transcript stage
-    manifest = Manifest(
-        asset_id=asset_id,
-        source_url=f"https://www.bilibili.com/video/{asset_id}",
-        status=AssetStatus.INGESTED,
-        fingerprint="test_fingerprint",
-        stages={
-            "source": {
-                "status": "completed",
-                "video_path": "source/video.mp4",
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-            "transcript": {
-                "status": "completed",
-                "segment_count": 3,
-                "transcript_file": "transcript.jsonl",
-                "audio_path": "audio/audio.m4a",
-                "params": {"provider": "tencent", "format": 0},
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "errors": [],
-            },
-        },
+    return _build_transcript_asset(
+        tmp_assets_dir,
+        "BV1testchinese",
+        _TRANSCRIPT_SEGMENTS_ZH,
+        _TRANSCRIPT_OCR_RECORDS_ZH,
     )
-    manifest_path = asset_dir / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest.to_dict(), f)
-
-    return asset_dir
@@ -1,6 +1,7 @@
 """Tests for Bilibili HTTP client."""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 import httpx
 
@@ -53,178 +54,180 @@ class TestBilibiliClientContextManager:
 class TestGetVideoView:
     """Tests for get_video_view method."""
 
+    @pytest.mark.parametrize(
+        "check",
+        [
+            pytest.param(
+                lambda result, url, params, response: result == response,
+                id="returns_response",
+            ),
+            pytest.param(
+                lambda result, url, params, response: "/x/web-interface/view" in url,
+                id="uses_correct_endpoint",
+            ),
+            pytest.param(
+                lambda result, url, params, response: params["bvid"] == "BV1vCzDBYEEa",
+                id="passes_bvid_param",
+            ),
+        ],
+    )
     @patch.object(BilibiliClient, "_request_with_retry")
-    def test_success(self, mock_request, sample_view_response):
-        """Returns response on success."""
+    def test_get_video_view(self, mock_request, sample_view_response, check):
+        """Requests the view endpoint and returns its response."""
         mock_request.return_value = sample_view_response
 
         with BilibiliClient() as client:
             result = client.get_video_view("BV1vCzDBYEEa")
 
-        assert result == sample_view_response
         mock_request.assert_called_once()
-        call_args = mock_request.call_args
-        assert "BV1vCzDBYEEa" in str(call_args)
-
-    @patch.object(BilibiliClient, "_request_with_retry")
-    def test_uses_correct_endpoint(self, mock_request, sample_view_response):
-        """Uses correct API endpoint."""
-        mock_request.return_value = sample_view_response
-
-        with BilibiliClient() as client:
-            client.get_video_view("BV1test")
-
-        url = mock_request.call_args[0][0]
-        assert "/x/web-interface/view" in url
-
-    @patch.object(BilibiliClient, "_request_with_retry")
-    def test_passes_bvid_param(self, mock_request, sample_view_response):
-        """Passes bvid as query parameter."""
-        mock_request.return_value = sample_view_response
-
-        with BilibiliClient() as client:
-            client.get_video_view("BV1param")
-
-        params = mock_request.call_args[0][1]
-        assert params["bvid"] == "BV1param"
+        url, params = mock_request.call_args[0]
+        assert check(result, url, params, sample_view_response)
 
 
 class TestGetPlayurl:
     """Tests for get_playurl method."""
 
+    @pytest.mark.parametrize(
+        ("call_kwargs", "check"),
+        [
+            pytest.param(
+                {},
+                lambda result, url, params, response: result == response,
+                id="returns_response",
+            ),
+            pytest.param(
+                {},
+                lambda result, url, params, response: "/x/player/playurl" in url,
+                id="uses_correct_endpoint",
+            ),
+            pytest.param(
+                {"qn": 80, "fnval": 32},
+                lambda result, url, params, response: params
+                == {"bvid": "BV1test", "cid": 12345, "qn": 80, "fnval": 32},
+                id="passes_all_params",
+            ),
+            pytest.param(
+                {},
+                lambda result, url, params, response: params["qn"] == 64
+                and params["fnval"] == 16,
+                id="default_quality_params",
+            ),
+        ],
+    )
     @patch.object(BilibiliClient, "_request_with_retry")
-    def test_success(self, mock_request, sample_playurl_response):
-        """Returns response on success."""
+    def test_get_playurl(
+        self, mock_request, sample_playurl_response, call_kwargs, check
+    ):
+        """Requests the playurl endpoint and returns its response."""
         mock_request.return_value = sample_playurl_response
 
         with BilibiliClient() as client:
-            result = client.get_playurl("BV1test", 12345)
+            result = client.get_playurl("BV1test", 12345, **call_kwargs)
 
-        assert result == sample_playurl_response
+        mock_request.assert_called_once()
+        url, params = mock_request.call_args[0]
+        assert check(result, url, params, sample_playurl_response)
 
-    @patch.object(BilibiliClient, "_request_with_retry")
-    def test_uses_correct_endpoint(self, mock_request, sample_playurl_response):
-        """Uses correct API endpoint."""
-        mock_request.return_value = sample_playurl_response
 
-        with BilibiliClient() as client:
-            client.get_playurl("BV1test", 12345)
+@pytest.fixture
+def stub_http_client(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the lazily-built httpx.Client with a mock.
 
-        url = mock_request.call_args[0][0]
-        assert "/x/player/playurl" in url
+    Retry tests only drive client.get(), so skip constructing a real
+    httpx.Client (transport, timeouts, headers) for each test.
+    """
+    fake = MagicMock()
+    monkeypatch.setattr(BilibiliClient, "_get_client", lambda self: fake)
+    return fake
 
-    @patch.object(BilibiliClient, "_request_with_retry")
-    def test_passes_all_params(self, mock_request, sample_playurl_response):
-        """Passes all query parameters."""
-        mock_request.return_value = sample_playurl_response
 
-        with BilibiliClient() as client:
-            client.get_playurl("BV1test", 12345, qn=80, fnval=32)
+def _stub_response(
+    payload: dict | None = None, status_code: int = 200, text: str = ""
+) -> SimpleNamespace:
+    """Build a minimal stand-in for httpx.Response.
 
-        params = mock_request.call_args[0][1]
-        assert params["bvid"] == "BV1test"
-        assert params["cid"] == 12345
-        assert params["qn"] == 80
-        assert params["fnval"] == 32
+    Status codes >= 400 make raise_for_status() raise HTTPStatusError.
+    """
+    response = SimpleNamespace(status_code=status_code, text=text, json=lambda: payload)
 
-    @patch.object(BilibiliClient, "_request_with_retry")
-    def test_default_quality_params(self, mock_request, sample_playurl_response):
-        """Uses default quality parameters."""
-        mock_request.return_value = sample_playurl_response
-
-        with BilibiliClient() as client:
-            client.get_playurl("BV1test", 12345)
+    def raise_for_status() -> None:
+        if status_code >= 400:
+            raise httpx.HTTPStatusError(
+                f"{status_code} Error",
+                request=httpx.Request("GET", "http://test.com"),
+                response=response,
+            )
 
-        params = mock_request.call_args[0][1]
-        assert params["qn"] == 64
-        assert params["fnval"] == 16
+    response.raise_for_status = raise_for_status
+    return response
 
 
 class TestRequestWithRetry:
     """Tests for _request_with_retry method."""
 
-    def test_success_on_first_try(self, sample_view_response):
+    def test_success_on_first_try(self, stub_http_client, sample_view_response):
         """Returns response on successful first attempt."""
-        with BilibiliClient() as client:
-            mock_response = MagicMock()
-            mock_response.json.return_value = sample_view_response
-            mock_response.raise_for_status.return_value = None
+        stub_http_client.get.return_value = _stub_response(sample_view_response)
 
-            with patch.object(client._get_client(), "get", return_value=mock_response):
-                result = client._request_with_retry("http://test.com", {})
+        with BilibiliClient() as client:
+            result = client._request_with_retry("http://test.com", {})
 
         assert result == sample_view_response
 
-    def test_api_error_code_raises(self):
+    def test_api_error_code_raises(self, stub_http_client):
         """API error code raises BilibiliApiError."""
-        with BilibiliClient() as client:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"code": -400, "message": "Invalid request"}
-            mock_response.raise_for_status.return_value = None
+        stub_http_client.get.return_value = _stub_response(
+            {"code": -400, "message": "Invalid request"}
+        )
 
-            with patch.object(client._get_client(), "get", return_value=mock_response):
-                with pytest.raises(BilibiliApiError) as exc_info:
-                    client._request_with_retry("http://test.com", {})
+        with BilibiliClient() as client:
+            with pytest.raises(BilibiliApiError) as exc_info:
+                client._request_with_retry("http://test.com", {})
 
-            assert "-400" in str(exc_info.value) or "Invalid request" in str(exc_info.value)
+        assert "-400" in str(exc_info.value) or "Invalid request" in str(exc_info.value)
 
-    def test_http_error_retries(self):
+    def test_http_error_retries(self, stub_http_client):
         """HTTP errors trigger retries."""
-        with BilibiliClient(retries=3) as client:
-            http_client = client._get_client()
+        # Fail twice, succeed on third
+        fail_response = _stub_response(status_code=500, text="Server error")
+        success_response = _stub_response({"code": 0, "data": {}})
 
-            # Fail twice, succeed on third
-            fail_response = MagicMock()
-            fail_response.status_code = 500
-            fail_response.text = "Server error"
-            fail_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "500 Error", request=MagicMock(), response=fail_response
-            )
-
-            success_response = MagicMock()
-            success_response.json.return_value = {"code": 0, "data": {}}
-            success_response.raise_for_status.return_value = None
+        stub_http_client.get.side_effect = [
+            fail_response,
+            fail_response,
+            success_response,
+        ]
 
-            with patch.object(
-                http_client, "get", side_effect=[fail_response, fail_response, success_response]
-            ):
-                result = client._request_with_retry("http://test.com", {})
+        with BilibiliClient(retries=3) as client:
+            result = client._request_with_retry("http://test.com", {})
 
-            assert result["code"] == 0
+        assert result["code"] == 0
+        assert stub_http_client.get.call_count == 3
 
-    def test_all_retries_exhausted_raises(self):
+    def test_all_retries_exhausted_raises(self, stub_http_client):
         """Raises after all retries exhausted."""
-        with BilibiliClient(retries=2) as client:
-            http_client = client._get_client()
+        fail_response = _stub_response(status_code=500, text="Server error")
+        stub_http_client.get.return_value = fail_response
 
-            fail_response = MagicMock()
-            fail_response.status_code = 500
-            fail_response.text = "Server error"
-            fail_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "500 Error", request=MagicMock(), response=fail_response
-            )
+        with BilibiliClient(retries=2) as client:
+            with pytest.raises(BilibiliApiError):
+                client._request_with_retry("http://test.com", {})
 
-            with patch.object(http_client, "get", return_value=fail_response):
-                with pytest.raises(BilibiliApiError):
-                    client._request_with_retry("http://test.com", {})
+        assert stub_http_client.get.call_count == 2
 
-    def test_network_error_retries(self):
+    def test_network_error_retries(self, stub_http_client):
         """Network errors trigger retries."""
-        with BilibiliClient(retries=2) as client:
-            http_client = client._get_client()
+        success_response = _stub_response({"code": 0, "data": {}})
 
-            success_response = MagicMock()
-            success_response.json.return_value = {"code": 0, "data": {}}
-            success_response.raise_for_status.return_value = None
+        stub_http_client.get.side_effect = [
+            httpx.ConnectError("Connection failed"),
+            success_response,
+        ]
 
-            with patch.object(
-                http_client,
-                "get",
-                side_effect=[httpx.ConnectError("Connection failed"), success_response],
-            ):
-                result = client._request_with_retry("http://test.com", {})
+        with BilibiliClient(retries=2) as client:
+            result = client._request_with_retry("http://test.com", {})
 
-            assert result["code"] == 0
+        assert result["code"] == 0
 
 
 class TestClientConfiguration:
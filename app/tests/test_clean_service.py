@@ -29,6 +29,12 @@ class TestListAssets:
         assets = list_assets(nonexistent)
         assert assets == []
 
+    def test_file_instead_of_directory(self, tmp_path: Path):
+        """Returns empty list when the path is a regular file."""
+        not_a_dir = tmp_path / "assets"
+        not_a_dir.touch()
+        assert list_assets(not_a_dir) == []
+
     def test_multiple_assets(self, tmp_assets_dir: Path):
         """Returns all asset directories."""
         (tmp_assets_dir / "BV1asset1").mkdir()
@@ -90,6 +96,15 @@ class TestValidatePathSafety:
             validate_path_safety(traversal_path, tmp_data_dir)
         assert "outside" in str(exc_info.value).lower()
 
+    def test_sibling_with_shared_prefix_rejected(self, tmp_data_dir: Path):
+        """A sibling whose name merely starts with data_dir's name is outside."""
+        sibling = tmp_data_dir.parent / f"{tmp_data_dir.name}_other" / "target"
+        sibling.mkdir(parents=True)
+
+        with pytest.raises(ValueError) as exc_info:
+            validate_path_safety(sibling, tmp_data_dir)
+        assert "outside" in str(exc_info.value).lower()
+
     def test_nested_valid_path(self, tmp_assets_dir: Path, tmp_data_dir: Path):
         """Nested path within data_dir passes validation."""
         nested = tmp_assets_dir / "asset" / "nested" / "deep"
@@ -111,18 +126,15 @@ class TestCleanAsset:
         assert result.deleted_count == 1
         assert str(asset_dir) in result.deleted_paths
 
-    def test_deletes_db_records(self, sample_asset, tmp_assets_dir: Path, tmp_db_path: Path):
+    def test_deletes_db_records(
+        self, sample_asset, tmp_assets_dir: Path, tmp_db_path: Path, seed_assets
+    ):
         """Deletes asset records from database."""
         asset_id, asset_dir = sample_asset
 
         # Initialize DB and add records
         init_db(tmp_db_path)
-        with get_connection(tmp_db_path) as conn:
-            conn.execute(
-                "INSERT INTO assets (asset_id, source_url) VALUES (?, ?)",
-                (asset_id, f"https://bilibili.com/video/{asset_id}"),
-            )
-            conn.commit()
+        seed_assets(tmp_db_path, [asset_id])
 
         result = clean_asset(asset_id, tmp_assets_dir, tmp_db_path)
 
@@ -139,6 +151,37 @@ class TestCleanAsset:
         # No error if directory doesn't exist and no DB records
         assert result.deleted_count == 1  # Considered "deleted" even if nothing to delete
 
+    def test_nonexistent_asset_skips_write_transaction(
+        self, tmp_assets_dir: Path, tmp_db_path: Path, monkeypatch
+    ):
+        """No directory and no DB rows: no delete transaction is opened."""
+        init_db(tmp_db_path)
+
+        def _fail(*_args):
+            raise AssertionError("nothing to delete")
+
+        monkeypatch.setattr(clean_service, "_delete_asset_rows", _fail)
+
+        result = clean_asset("BV_nonexistent", tmp_assets_dir, tmp_db_path)
+
+        assert result.deleted_count == 1
+        assert result.errors == []
+
+    def test_db_only_asset_still_deleted(
+        self, tmp_assets_dir: Path, tmp_db_path: Path, seed_assets
+    ):
+        """DB rows are deleted even when the asset directory is already gone."""
+        asset_id = "BV1dbonly"
+        init_db(tmp_db_path)
+        seed_assets(tmp_db_path, [asset_id])
+
+        result = clean_asset(asset_id, tmp_assets_dir, tmp_db_path)
+
+        assert result.deleted_count == 1
+        with get_connection(tmp_db_path) as conn:
+            cursor = conn.execute("SELECT COUNT(*) FROM assets")
+            assert cursor.fetchone()[0] == 0
+
     def test_rejects_path_traversal_asset_id(
         self, tmp_assets_dir: Path, tmp_db_path: Path, tmp_data_dir: Path
     ):
@@ -155,6 +198,24 @@ class TestCleanAsset:
         assert sibling_dir.exists()
         assert sentinel.exists()
 
+    def test_does_not_follow_symlinks(
+        self, sample_asset, tmp_assets_dir: Path, tmp_db_path: Path, tmp_path: Path
+    ):
+        """Symlinks inside the asset are removed without touching their targets."""
+        asset_id, asset_dir = sample_asset
+        outside_dir = tmp_path / "outside"
+        outside_dir.mkdir()
+        outside_file = outside_dir / "keep.txt"
+        outside_file.write_text("keep", encoding="utf-8")
+        (asset_dir / "linked_dir").symlink_to(outside_dir, target_is_directory=True)
+        (asset_dir / "linked_file").symlink_to(outside_file)
+
+        result = clean_asset(asset_id, tmp_assets_dir, tmp_db_path)
+
+        assert result.deleted_count == 1
+        assert not asset_dir.exists()
+        assert outside_file.read_text(encoding="utf-8") == "keep"
+
     def test_deletes_related_records(self, sample_asset, tmp_assets_dir: Path, tmp_db_path: Path):
         """Deletes all related records (versions, segments, etc.)."""
         asset_id, asset_dir = sample_asset
@@ -227,6 +288,32 @@ class TestCleanAsset:
             )
             assert cursor.fetchone()[0] == 0
 
+    def test_db_error_rolls_back_all_deletes(
+        self, sample_asset, tmp_assets_dir: Path, tmp_db_path: Path
+    ):
+        """A failing delete leaves earlier deletes in the transaction undone."""
+        asset_id, _asset_dir = sample_asset
+
+        init_db(tmp_db_path)
+        with get_connection(tmp_db_path) as conn:
+            conn.execute(
+                "INSERT INTO chunks (chunk_id, asset_id, version_id, type, text) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ("chunk1", asset_id, "v1", "transcript", "hello"),
+            )
+            # chunks is deleted before segments, so this fails mid-transaction
+            conn.execute("DROP TABLE segments")
+            conn.commit()
+
+        result = clean_asset(asset_id, tmp_assets_dir, tmp_db_path)
+
+        assert any("Database error" in error for error in result.errors)
+        with get_connection(tmp_db_path) as conn:
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM chunks WHERE asset_id = ?", (asset_id,)
+            )
+            assert cursor.fetchone()[0] == 1
+
 
 class TestCleanAllAssets:
     """Tests for clean_all_assets function."""
@@ -245,6 +332,63 @@ class TestCleanAllAssets:
         assert len(result.deleted_paths) == 3
         assert not list(tmp_assets_dir.iterdir())
 
+    def test_parallel_removal_keeps_input_order(
+        self, tmp_assets_dir: Path, tmp_db_path: Path
+    ):
+        """Removes many assets concurrently and reports paths in input order."""
+        asset_ids = [f"BV{i:02d}test" for i in range(12)]
+        for asset_id in asset_ids:
+            nested = tmp_assets_dir / asset_id / "frames_passA"
+            nested.mkdir(parents=True)
+            (nested / "frame_000001.png").touch()
+
+        result = clean_all_assets(tmp_assets_dir, tmp_db_path, asset_ids=asset_ids)
+
+        assert result.errors == []
+        assert result.deleted_count == 12
+        assert result.deleted_paths == [
+            str(tmp_assets_dir / asset_id) for asset_id in asset_ids
+        ]
+        assert not list(tmp_assets_dir.iterdir())
+
+    def test_does_not_fsync_removed_directories(
+        self, tmp_assets_dir: Path, tmp_db_path: Path, monkeypatch
+    ):
+        """Bulk removal leaves flushing to the filesystem; no per-dir fsync."""
+        for i in range(3):
+            (tmp_assets_dir / f"BV{i}test").mkdir()
+
+        def _fail(*_args):
+            raise AssertionError("clean_all_assets should not force a sync")
+
+        monkeypatch.setattr(clean_service.os, "fsync", _fail)
+        monkeypatch.setattr(clean_service.os, "sync", _fail)
+
+        result = clean_all_assets(tmp_assets_dir, tmp_db_path)
+
+        assert result.deleted_count == 3
+        assert result.errors == []
+
+    def test_deletes_db_records_for_all_assets(
+        self, tmp_assets_dir: Path, tmp_db_path: Path, seed_assets
+    ):
+        """Deletes records for every asset and skips unsafe IDs."""
+        asset_ids = ["BV1first", "BV2second"]
+        init_db(tmp_db_path)
+        seed_assets(tmp_db_path, asset_ids)
+        for asset_id in asset_ids:
+            (tmp_assets_dir / asset_id).mkdir()
+
+        result = clean_all_assets(
+            tmp_assets_dir, tmp_db_path, asset_ids=[*asset_ids, "../escape"]
+        )
+
+        assert result.deleted_count == 2
+        assert len(result.errors) == 1
+        with get_connection(tmp_db_path) as conn:
+            cursor = conn.execute("SELECT COUNT(*) FROM assets")
+            assert cursor.fetchone()[0] == 0
+
     def test_empty_directory(self, tmp_assets_dir: Path, tmp_db_path: Path):
         """Handles empty directory."""
         result = clean_all_assets(tmp_assets_dir, tmp_db_path)
@@ -303,3 +447,7 @@ class TestCleanResult:
         assert result.deleted_count == 2
         assert len(result.deleted_paths) == 2
         assert len(result.errors) == 1
+
+    def test_has_no_instance_dict(self):
+        """CleanResult is slotted, so instances carry no __dict__."""
+        assert not hasattr(CleanResult(), "__dict__")
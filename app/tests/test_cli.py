@@ -31,10 +31,6 @@ class TestDoctorCommand:
         # Use temp directory for data
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
 
-        # Clear global settings cache
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
-
         result = runner.invoke(app, ["doctor"])
 
         assert result.exit_code == 0
@@ -48,9 +44,6 @@ class TestDoctorCommand:
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
 
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
-
         result = runner.invoke(app, ["doctor"])
 
         assert result.exit_code == 1
@@ -68,9 +61,6 @@ class TestDoctorCommand:
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
 
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
-
         result = runner.invoke(app, ["doctor"])
 
         mock_init_db.assert_called_once()
@@ -87,8 +77,6 @@ class TestDoctorCommand:
         mock_check_db.return_value = True
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         result = runner.invoke(app, ["doctor"])
 
@@ -107,8 +95,6 @@ class TestDoctorCommand:
         mock_check_db.return_value = True
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         # Mock Path.exists to return False for Windows paths
         with patch("bili_assetizer.cli.Path.exists", return_value=False):
@@ -131,8 +117,6 @@ class TestDoctorCommand:
         mock_check_db.return_value = True
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         # Mock Windows platform and common path exists
         with patch("bili_assetizer.cli.sys.platform", "win32"):
@@ -158,8 +142,6 @@ class TestIngestCommand:
         )
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         result = runner.invoke(app, ["ingest", "https://bilibili.com/video/BV1test"])
 
@@ -178,8 +160,6 @@ class TestIngestCommand:
         )
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         result = runner.invoke(app, ["ingest", "BV1cached"])
 
@@ -197,8 +177,6 @@ class TestIngestCommand:
         )
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         result = runner.invoke(app, ["ingest", "BV1fail"])
 
@@ -216,8 +194,6 @@ class TestIngestCommand:
         )
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         runner.invoke(app, ["ingest", "BV1force", "--force"])
 
@@ -236,8 +212,6 @@ class TestCleanCommand:
         mock_clean.return_value = MagicMock(deleted_count=2, deleted_paths=[], errors=[])
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         result = runner.invoke(app, ["clean", "--all", "--yes"])
 
@@ -252,8 +226,6 @@ class TestCleanCommand:
         mock_clean.return_value = MagicMock(deleted_count=1, deleted_paths=[], errors=[])
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         # Answer "y" to confirmation
         result = runner.invoke(app, ["clean", "--all"], input="y\n")
@@ -266,8 +238,6 @@ class TestCleanCommand:
         mock_list.return_value = ["BV1test"]
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         result = runner.invoke(app, ["clean", "--all"], input="n\n")
 
@@ -283,8 +253,6 @@ class TestCleanCommand:
         (assets_dir / "BV1specific").mkdir()
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         result = runner.invoke(app, ["clean", "--asset", "BV1specific", "--yes"])
 
@@ -298,8 +266,6 @@ class TestCleanCommand:
         (assets_dir / "BV1test").mkdir()
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         result = runner.invoke(app, ["clean", "--all", "--asset", "BV1test", "--yes"])
 
@@ -312,8 +278,6 @@ class TestCleanCommand:
         mock_list.return_value = []
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         result = runner.invoke(app, ["clean", "--all"])
 
@@ -325,8 +289,6 @@ class TestCleanCommand:
         assets_dir.mkdir()
 
         monkeypatch.setenv("DATA_DIR", str(tmp_path))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         result = runner.invoke(app, ["clean", "--asset", "BV_nonexistent", "--yes"])
 
@@ -362,8 +324,6 @@ class TestShowCommand:
         asset_id, _asset_dir = sample_asset
 
         monkeypatch.setenv("DATA_DIR", str(tmp_data_dir))
-        import bili_assetizer.core.config as config_module
-        config_module._settings = None
 
         result = runner.invoke(app, ["show", asset_id])
 
@@ -1,5 +1,6 @@
 """Tests for configuration management."""
 
+import dataclasses
 import pytest
 from pathlib import Path
 
@@ -35,6 +36,12 @@ class TestSettings:
         assert settings.db_path == Path("/tmp/test/bili_assetizer.db")
         assert settings.assets_dir == Path("/tmp/test/assets")
 
+    def test_settings_are_frozen(self):
+        """Settings cannot be mutated after construction."""
+        settings = Settings()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            settings.data_dir = Path("/elsewhere")
+
 
 class TestLoadSettings:
     """Tests for load_settings function."""
@@ -84,3 +91,18 @@ class TestLoadSettings:
         assert settings.ai_model_text == "gpt-4-turbo"
         assert settings.ai_model_vision == "gpt-4-vision"
         assert settings.ai_model_embed == "text-embedding-ada-002"
+
+    def test_load_settings_is_cached(self, monkeypatch):
+        """Repeated calls with an unchanged environment share one instance."""
+        monkeypatch.setenv("DATA_DIR", "/cached/path")
+        assert load_settings() is load_settings()
+
+    def test_load_settings_tracks_env_changes(self, monkeypatch):
+        """Changing a relevant env var invalidates the cached settings."""
+        monkeypatch.setenv("DATA_DIR", "/first/path")
+        first = load_settings()
+        monkeypatch.setenv("DATA_DIR", "/second/path")
+        second = load_settings()
+        assert first.data_dir == Path("/first/path")
+        assert second.data_dir == Path("/second/path")
+        assert second.db_path == Path("/second/path/bili_assetizer.db")
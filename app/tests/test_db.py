@@ -2,9 +2,16 @@
 
 import sqlite3
 import pytest
+from contextlib import closing
 from pathlib import Path
 
-from bili_assetizer.core.db import init_db, check_db, get_connection
+from bili_assetizer.core.db import (
+    _init_db_on,
+    check_db,
+    get_connection,
+    init_db,
+    schema_columns,
+)
 
 
 class TestInitDb:
@@ -25,8 +32,8 @@ class TestInitDb:
 
     def test_creates_assets_table(self, tmp_db_path: Path):
         """init_db creates assets table."""
-        init_db(tmp_db_path)
-        with sqlite3.connect(tmp_db_path) as conn:
+        with closing(sqlite3.connect(tmp_db_path)) as conn:
+            _init_db_on(conn)
             cursor = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='assets'"
             )
@@ -34,7 +41,6 @@ class TestInitDb:
 
     def test_creates_all_expected_tables(self, tmp_db_path: Path):
         """init_db creates all expected tables."""
-        init_db(tmp_db_path)
         expected_tables = [
             "assets",
             "asset_versions",
@@ -45,7 +51,8 @@ class TestInitDb:
             "generations",
         ]
 
-        with sqlite3.connect(tmp_db_path) as conn:
+        with closing(sqlite3.connect(tmp_db_path)) as conn:
+            _init_db_on(conn)
             cursor = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table'"
             )
@@ -56,15 +63,15 @@ class TestInitDb:
 
     def test_creates_indexes(self, tmp_db_path: Path):
         """init_db creates indexes."""
-        init_db(tmp_db_path)
         expected_indexes = [
-            "idx_segments_asset",
-            "idx_frames_asset",
-            "idx_chunks_asset",
+            "idx_segments_asset_ver",
+            "idx_frames_asset_ver",
+            "idx_chunks_asset_ver",
             "idx_asset_versions_asset",
         ]
 
-        with sqlite3.connect(tmp_db_path) as conn:
+        with closing(sqlite3.connect(tmp_db_path)) as conn:
+            _init_db_on(conn)
             cursor = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='index'"
             )
@@ -73,12 +80,35 @@ class TestInitDb:
         for index in expected_indexes:
             assert index in actual_indexes, f"Index {index} not found"
 
+    def test_replaces_single_column_indexes(self, tmp_db_path: Path):
+        """init_db drops the superseded single-column asset indexes."""
+        init_db(tmp_db_path)
+        with closing(sqlite3.connect(tmp_db_path)) as conn:
+            conn.execute("CREATE INDEX idx_segments_asset ON segments(asset_id)")
+            conn.commit()
+
+        init_db(tmp_db_path)
+
+        with closing(sqlite3.connect(tmp_db_path)) as conn:
+            cursor = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND name=?",
+                ("idx_segments_asset",),
+            )
+            assert cursor.fetchone() is None
+
     def test_idempotent(self, tmp_db_path: Path):
         """init_db is idempotent (can be called multiple times)."""
         init_db(tmp_db_path)
         init_db(tmp_db_path)  # Should not raise
         assert tmp_db_path.exists()
 
+    def test_enables_wal_journal_mode(self, tmp_db_path: Path):
+        """init_db switches the database to WAL, which persists across opens."""
+        init_db(tmp_db_path)
+        with sqlite3.connect(tmp_db_path) as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
 
 class TestCheckDb:
     """Tests for check_db function."""
@@ -94,9 +124,9 @@ class TestCheckDb:
 
     def test_returns_false_for_empty_db(self, tmp_db_path: Path):
         """check_db returns False for empty database (no tables)."""
-        # Create empty database
+        # A zero-byte file is a valid empty SQLite database
         tmp_db_path.parent.mkdir(parents=True, exist_ok=True)
-        sqlite3.connect(tmp_db_path).close()
+        tmp_db_path.touch()
         assert check_db(tmp_db_path) is False
 
     def test_returns_false_for_invalid_db(self, tmp_db_path: Path):
@@ -121,6 +151,12 @@ class TestGetConnection:
         with get_connection(initialized_db) as conn:
             assert conn.row_factory == sqlite3.Row
 
+    def test_connection_uses_normal_sync(self, initialized_db: Path):
+        """get_connection applies the per-connection PRAGMAs."""
+        with get_connection(initialized_db) as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
     def test_connection_is_closed_after_context(self, initialized_db: Path):
         """Connection is closed after context manager exits."""
         with get_connection(initialized_db) as conn:
@@ -151,65 +187,41 @@ class TestGetConnection:
 class TestSchemaVerification:
     """Tests to verify schema structure."""
 
-    def test_assets_table_columns(self, initialized_db: Path):
+    def test_assets_table_columns(self):
         """assets table has expected columns."""
-        with get_connection(initialized_db) as conn:
-            cursor = conn.execute("PRAGMA table_info(assets)")
-            columns = {row["name"] for row in cursor.fetchall()}
-
         expected = {"asset_id", "source_url", "created_at", "updated_at", "latest_version_id"}
-        assert expected == columns
+        assert expected == schema_columns()["assets"]
 
-    def test_asset_versions_table_columns(self, initialized_db: Path):
+    def test_asset_versions_table_columns(self):
         """asset_versions table has expected columns."""
-        with get_connection(initialized_db) as conn:
-            cursor = conn.execute("PRAGMA table_info(asset_versions)")
-            columns = {row["name"] for row in cursor.fetchall()}
-
         expected = {"version_id", "asset_id", "fingerprint", "status", "error", "created_at"}
-        assert expected == columns
+        assert expected == schema_columns()["asset_versions"]
 
-    def test_segments_table_columns(self, initialized_db: Path):
+    def test_segments_table_columns(self):
         """segments table has expected columns."""
-        with get_connection(initialized_db) as conn:
-            cursor = conn.execute("PRAGMA table_info(segments)")
-            columns = {row["name"] for row in cursor.fetchall()}
-
         expected = {"segment_id", "asset_id", "version_id", "start_ms", "end_ms", "text", "source"}
-        assert expected == columns
+        assert expected == schema_columns()["segments"]
 
-    def test_frames_table_columns(self, initialized_db: Path):
+    def test_frames_table_columns(self):
         """frames table has expected columns."""
-        with get_connection(initialized_db) as conn:
-            cursor = conn.execute("PRAGMA table_info(frames)")
-            columns = {row["name"] for row in cursor.fetchall()}
-
         expected = {"frame_id", "asset_id", "version_id", "timestamp_ms", "path", "caption"}
-        assert expected == columns
+        assert expected == schema_columns()["frames"]
 
-    def test_chunks_table_columns(self, initialized_db: Path):
+    def test_chunks_table_columns(self):
         """chunks table has expected columns."""
-        with get_connection(initialized_db) as conn:
-            cursor = conn.execute("PRAGMA table_info(chunks)")
-            columns = {row["name"] for row in cursor.fetchall()}
-
         expected = {"chunk_id", "asset_id", "version_id", "type", "text", "evidence_json"}
-        assert expected == columns
+        assert expected == schema_columns()["chunks"]
 
-    def test_embeddings_table_columns(self, initialized_db: Path):
+    def test_embeddings_table_columns(self):
         """embeddings table has expected columns."""
-        with get_connection(initialized_db) as conn:
-            cursor = conn.execute("PRAGMA table_info(embeddings)")
-            columns = {row["name"] for row in cursor.fetchall()}
-
         expected = {"chunk_id", "vector_json", "model"}
-        assert expected == columns
+        assert expected == schema_columns()["embeddings"]
 
-    def test_generations_table_columns(self, initialized_db: Path):
+    def test_generations_table_columns(self):
         """generations table has expected columns."""
-        with get_connection(initialized_db) as conn:
-            cursor = conn.execute("PRAGMA table_info(generations)")
-            columns = {row["name"] for row in cursor.fetchall()}
-
         expected = {"gen_id", "asset_ids_json", "mode", "prompt", "output_path", "cited_evidence_json", "created_at"}
-        assert expected == columns
+        assert expected == schema_columns()["generations"]
+
+    def test_schema_columns_computed_once(self):
+        """schema_columns returns the same cached mapping on every call."""
+        assert schema_columns() is schema_columns()
@@ -3,30 +3,17 @@
 from pathlib import Path
 
 from bili_assetizer.core.evidence_service import gather_evidence
-from bili_assetizer.core.index_service import index_asset
-from bili_assetizer.core.models import StageStatus
 
 
-def test_gather_evidence_builds_pack(
-    sample_asset_with_transcript: Path, tmp_db_path: Path
-) -> None:
+def test_gather_evidence_builds_pack(indexed_transcript_asset: tuple[Path, Path]) -> None:
     """Evidence pack includes transcript and OCR items."""
-    asset_id = sample_asset_with_transcript.name
-    assets_dir = sample_asset_with_transcript.parent
-
-    index_result = index_asset(
-        asset_id=asset_id,
-        assets_dir=assets_dir,
-        db_path=tmp_db_path,
-        force=False,
-    )
-    assert index_result.status == StageStatus.COMPLETED
+    asset_dir, db_path = indexed_transcript_asset
 
     pack = gather_evidence(
-        asset_id=asset_id,
+        asset_id=asset_dir.name,
         query="Python",
-        assets_dir=assets_dir,
-        db_path=tmp_db_path,
+        assets_dir=asset_dir.parent,
+        db_path=db_path,
         top_k=8,
     )
 
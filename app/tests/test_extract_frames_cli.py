@@ -1,24 +1,47 @@
 """Tests for extract-frames CLI command."""
 
+from dataclasses import replace
 from unittest.mock import patch, MagicMock
 
+import typer
 from typer.testing import CliRunner
 
-from bili_assetizer.cli import app
+from bili_assetizer.cli import app, extract_frames_cmd
 from bili_assetizer.core.models import StageStatus, ExtractFramesResult
 
 runner = CliRunner()
 
+_BASE = ExtractFramesResult(
+    asset_id="BV1vCzDBYEEa",
+    status=StageStatus.COMPLETED,
+    frame_count=10,
+    frames_file="frames_passA.jsonl",
+)
+
+
+def _run_extract_frames(asset_id: str = "BV1vCzDBYEEa", **overrides) -> int:
+    """Call the extract-frames callback directly, bypassing Click parsing.
+
+    Returns the exit code (0 unless the command raised typer.Exit).
+    """
+    kwargs = {
+        "interval_sec": 3.0,
+        "max_frames": None,
+        "scene_thresh": None,
+        "force": False,
+        **overrides,
+    }
+    try:
+        extract_frames_cmd(asset_id, **kwargs)
+    except typer.Exit as exc:
+        return exc.exit_code
+    return 0
+
 
 @patch("bili_assetizer.cli.extract_frames")
 def test_cli_extract_frames_success(mock_extract: MagicMock):
     """Test extract-frames command with successful extraction."""
-    mock_extract.return_value = ExtractFramesResult(
-        asset_id="BV1vCzDBYEEa",
-        status=StageStatus.COMPLETED,
-        frame_count=10,
-        frames_file="frames_passA.jsonl",
-    )
+    mock_extract.return_value = _BASE
 
     result = runner.invoke(app, ["extract-frames", "BV1vCzDBYEEa"])
 
@@ -32,12 +55,7 @@ def test_cli_extract_frames_success(mock_extract: MagicMock):
 @patch("bili_assetizer.cli.extract_frames")
 def test_cli_extract_frames_with_options(mock_extract: MagicMock):
     """Test extract-frames command with custom options."""
-    mock_extract.return_value = ExtractFramesResult(
-        asset_id="BV1vCzDBYEEa",
-        status=StageStatus.COMPLETED,
-        frame_count=5,
-        frames_file="frames_passA.jsonl",
-    )
+    mock_extract.return_value = replace(_BASE, frame_count=5)
 
     result = runner.invoke(
         app,
@@ -46,6 +64,8 @@ def test_cli_extract_frames_with_options(mock_extract: MagicMock):
             "BV1vCzDBYEEa",
             "--interval-sec", "5.0",
             "--max-frames", "20",
+            "--scene-thresh", "0.30",
+            "--force",
         ]
     )
 
@@ -57,22 +77,20 @@ def test_cli_extract_frames_with_options(mock_extract: MagicMock):
     call_args = mock_extract.call_args
     assert call_args.kwargs["interval_sec"] == 5.0
     assert call_args.kwargs["max_frames"] == 20
+    assert call_args.kwargs["scene_thresh"] == 0.30
+    assert call_args.kwargs["force"] is True
 
 
 @patch("bili_assetizer.cli.extract_frames")
-def test_cli_extract_frames_force_flag(mock_extract: MagicMock):
+def test_cli_extract_frames_force_flag(mock_extract: MagicMock, capsys):
     """Test extract-frames command with --force flag."""
-    mock_extract.return_value = ExtractFramesResult(
-        asset_id="BV1vCzDBYEEa",
-        status=StageStatus.COMPLETED,
-        frame_count=8,
-        frames_file="frames_passA.jsonl",
-    )
+    mock_extract.return_value = replace(_BASE, frame_count=8)
 
-    result = runner.invoke(app, ["extract-frames", "BV1vCzDBYEEa", "--force"])
+    exit_code = _run_extract_frames(force=True)
+    stdout = capsys.readouterr().out
 
-    assert result.exit_code == 0
-    assert "COMPLETED" in result.stdout
+    assert exit_code == 0
+    assert "COMPLETED" in stdout
 
     # Verify force flag was passed
     call_args = mock_extract.call_args
@@ -80,72 +98,70 @@ def test_cli_extract_frames_force_flag(mock_extract: MagicMock):
 
 
 @patch("bili_assetizer.cli.extract_frames")
-def test_cli_extract_frames_missing_source(mock_extract: MagicMock):
+def test_cli_extract_frames_missing_source(mock_extract: MagicMock, capsys):
     """Test extract-frames command fails when source is missing."""
-    mock_extract.return_value = ExtractFramesResult(
-        asset_id="BV1vCzDBYEEa",
+    mock_extract.return_value = replace(
+        _BASE,
         status=StageStatus.FAILED,
         errors=["Source video not materialized. Run extract-source first."],
+        frame_count=0,
+        frames_file=None,
     )
 
-    result = runner.invoke(app, ["extract-frames", "BV1vCzDBYEEa"])
+    exit_code = _run_extract_frames()
+    stdout = capsys.readouterr().out
 
-    assert result.exit_code == 1
-    assert "FAILED" in result.stdout
-    assert "Source video not materialized" in result.stdout
+    assert exit_code == 1
+    assert "FAILED" in stdout
+    assert "Source video not materialized" in stdout
 
 
 @patch("bili_assetizer.cli.extract_frames")
-def test_cli_extract_frames_invalid_asset(mock_extract: MagicMock):
+def test_cli_extract_frames_invalid_asset(mock_extract: MagicMock, capsys):
     """Test extract-frames command fails when asset not found."""
-    mock_extract.return_value = ExtractFramesResult(
+    mock_extract.return_value = replace(
+        _BASE,
         asset_id="BV_INVALID",
         status=StageStatus.FAILED,
         errors=["Asset not found: BV_INVALID"],
+        frame_count=0,
+        frames_file=None,
     )
 
-    result = runner.invoke(app, ["extract-frames", "BV_INVALID"])
+    exit_code = _run_extract_frames("BV_INVALID")
+    stdout = capsys.readouterr().out
 
-    assert result.exit_code == 1
-    assert "FAILED" in result.stdout
-    assert "Asset not found" in result.stdout
+    assert exit_code == 1
+    assert "FAILED" in stdout
+    assert "Asset not found" in stdout
 
 
 @patch("bili_assetizer.cli.extract_frames")
-def test_cli_extract_frames_idempotent_message(mock_extract: MagicMock):
+def test_cli_extract_frames_idempotent_message(mock_extract: MagicMock, capsys):
     """Test extract-frames command shows cached message on idempotent call."""
-    mock_extract.return_value = ExtractFramesResult(
-        asset_id="BV1vCzDBYEEa",
-        status=StageStatus.COMPLETED,
-        frame_count=10,
-        frames_file="frames_passA.jsonl",
+    mock_extract.return_value = replace(
+        _BASE,
         errors=["Frames already extracted (use --force to re-extract)"],
     )
 
-    result = runner.invoke(app, ["extract-frames", "BV1vCzDBYEEa"])
+    exit_code = _run_extract_frames()
+    stdout = capsys.readouterr().out
 
-    assert result.exit_code == 0
-    assert "COMPLETED" in result.stdout
-    assert "already extracted" in result.stdout
+    assert exit_code == 0
+    assert "COMPLETED" in stdout
+    assert "already extracted" in stdout
 
 
 @patch("bili_assetizer.cli.extract_frames")
-def test_cli_extract_frames_with_scene_detection(mock_extract: MagicMock):
+def test_cli_extract_frames_with_scene_detection(mock_extract: MagicMock, capsys):
     """Test extract-frames command with scene detection threshold."""
-    mock_extract.return_value = ExtractFramesResult(
-        asset_id="BV1vCzDBYEEa",
-        status=StageStatus.COMPLETED,
-        frame_count=15,
-        frames_file="frames_passA.jsonl",
-    )
+    mock_extract.return_value = replace(_BASE, frame_count=15)
 
-    result = runner.invoke(
-        app,
-        ["extract-frames", "BV1vCzDBYEEa", "--scene-thresh", "0.30"]
-    )
+    exit_code = _run_extract_frames(scene_thresh=0.30)
+    stdout = capsys.readouterr().out
 
-    assert result.exit_code == 0
-    assert "COMPLETED" in result.stdout
+    assert exit_code == 0
+    assert "COMPLETED" in stdout
 
     # Verify scene_thresh was passed
     call_args = mock_extract.call_args
@@ -153,17 +169,19 @@ def test_cli_extract_frames_with_scene_detection(mock_extract: MagicMock):
 
 
 @patch("bili_assetizer.cli.extract_frames")
-def test_cli_extract_frames_zero_frames(mock_extract: MagicMock):
+def test_cli_extract_frames_zero_frames(mock_extract: MagicMock, capsys):
     """Test extract-frames command displays zero frames correctly."""
-    mock_extract.return_value = ExtractFramesResult(
-        asset_id="BV1vCzDBYEEa",
+    mock_extract.return_value = replace(
+        _BASE,
         status=StageStatus.FAILED,
         frame_count=0,
         errors=["No frames found after extraction"],
+        frames_file=None,
     )
 
-    result = runner.invoke(app, ["extract-frames", "BV1vCzDBYEEa"])
+    exit_code = _run_extract_frames()
+    stdout = capsys.readouterr().out
 
-    assert result.exit_code == 1
-    assert "FAILED" in result.stdout
-    assert "No frames found" in result.stdout
+    assert exit_code == 1
+    assert "FAILED" in stdout
+    assert "No frames found" in stdout
@@ -1,13 +1,87 @@
 """Tests for extract_frames_service."""
 
+import functools
+import io
 import json
 from pathlib import Path
+from typing import Callable, NamedTuple
 from unittest.mock import MagicMock, patch
 
 import pytest
+from PIL import Image
+
+from bili_assetizer.core import extract_frames_service
+from bili_assetizer.core.extract_frames_service import (
+    _deduplicate_frames,
+    _compute_frame_hash,
+    _extract_frames_ffmpeg,
+    _get_video_duration,
+    _read_png_frames,
+    extract_frames,
+)
+from bili_assetizer.core.manifest_utils import load_manifest
+from bili_assetizer.core.models import (
+    AssetStatus,
+    ExtractFramesResult,
+    Manifest,
+    StageStatus,
+)
+
+
+class ExtractMocks(NamedTuple):
+    """Mocks standing in for the ffprobe and ffmpeg steps."""
+
+    duration: MagicMock
+    ffmpeg: MagicMock
+
+
+@pytest.fixture
+def mock_extract_deps(monkeypatch: pytest.MonkeyPatch) -> ExtractMocks:
+    """Replace the subprocess-backed steps of extract_frames with mocks.
+
+    Defaults describe a 10 s video whose extraction yields no frames; tests
+    set return_value on the mocks they care about.
+    """
+    mocks = ExtractMocks(
+        duration=MagicMock(return_value=(10.0, [])),
+        ffmpeg=MagicMock(return_value=([], [])),
+    )
+    monkeypatch.setattr(extract_frames_service, "_get_video_duration", mocks.duration)
+    monkeypatch.setattr(extract_frames_service, "_extract_frames_ffmpeg", mocks.ffmpeg)
+    return mocks
+
+
+# Unique uniform-mode frame rows as _extract_frames_ffmpeg would return them.
+_FRAME_TEMPLATES = [
+    {
+        "frame_id": f"KF_{i:06d}",
+        "ts_ms": None,
+        "path": f"frames_passA/frame_{i:06d}.png",
+        "hash": f"hash_{i}",
+        "source": "uniform",
+        "is_duplicate": False,
+        "duplicate_of": None,
+    }
+    for i in range(1, 11)
+]
 
-from bili_assetizer.core.extract_frames_service import extract_frames
-from bili_assetizer.core.models import AssetStatus, Manifest, StageStatus
+
+def _make_frame(i: int, **overrides) -> dict:
+    """Return a copy of frame row i (1-based) with the given fields replaced."""
+    return {**_FRAME_TEMPLATES[i - 1], **overrides}
+
+
+@pytest.fixture
+def extract_fn(
+    mock_extract_deps: ExtractMocks, sample_asset_with_source: Path
+) -> Callable[..., ExtractFramesResult]:
+    """extract_frames bound to the mocked sample asset; pass only params."""
+    mock_extract_deps.ffmpeg.return_value = ([_make_frame(1)], [])
+    return functools.partial(
+        extract_frames,
+        asset_id=sample_asset_with_source.name,
+        assets_dir=sample_asset_with_source.parent,
+    )
 
 
 def test_extract_frames_asset_not_found(tmp_assets_dir: Path):
@@ -19,7 +93,7 @@ def test_extract_frames_asset_not_found(tmp_assets_dir: Path):
 
     assert result.status == StageStatus.FAILED
     assert result.frame_count == 0
-    assert any("Asset not found" in err for err in result.errors)
+    assert "Asset not found" in "\n".join(result.errors)
 
 
 def test_extract_frames_missing_source(sample_asset_with_provenance: Path):
@@ -33,402 +107,206 @@ def test_extract_frames_missing_source(sample_asset_with_provenance: Path):
     )
 
     assert result.status == StageStatus.FAILED
-    assert any("Source video not materialized" in err for err in result.errors)
-
-
+    assert "Source video not materialized" in "\n".join(result.errors)
+
+
+@pytest.mark.parametrize(
+    "sample_asset_with_provenance",
+    [
+        {
+            "source": {
+                "status": "pending",
+                "video_path": "source/video.mp4",
+                "updated_at": "2024-01-01T00:00:00+00:00",
+                "errors": [],
+            }
+        }
+    ],
+    indirect=True,
+)
 def test_extract_frames_invalid_source_status(sample_asset_with_provenance: Path):
     """Test extract_frames fails when source status is not COMPLETED."""
     asset_dir = sample_asset_with_provenance
     asset_id = asset_dir.name
 
-    # Add source stage with wrong status
-    manifest_path = asset_dir / "manifest.json"
-    with open(manifest_path, "r") as f:
-        manifest_data = json.load(f)
-
-    manifest_data["stages"] = {
-        "source": {
-            "status": "pending",
-            "video_path": "source/video.mp4",
-            "updated_at": "2024-01-01T00:00:00+00:00",
-            "errors": [],
-        }
-    }
-
-    with open(manifest_path, "w") as f:
-        json.dump(manifest_data, f)
-
     result = extract_frames(
         asset_id=asset_id,
         assets_dir=asset_dir.parent,
     )
 
     assert result.status == StageStatus.FAILED
-    assert any("status must be COMPLETED" in err for err in result.errors)
+    assert "status must be COMPLETED" in "\n".join(result.errors)
+
+
+@pytest.mark.parametrize(
+    ("make_path", "message"),
+    [
+        (lambda path: path.unlink(), "Source video file not found"),
+        (lambda path: (path.unlink(), path.mkdir()), "Source video path is not a file"),
+    ],
+)
+def test_extract_frames_source_video_path_checks(
+    sample_asset_with_source: Path, make_path, message: str
+):
+    """A missing video and a directory in its place are reported distinctly."""
+    asset_dir = sample_asset_with_source
+    make_path(asset_dir / "source" / "video.mp4")
 
+    result = extract_frames(asset_id=asset_dir.name, assets_dir=asset_dir.parent)
 
-@patch("bili_assetizer.core.extract_frames_service._get_video_duration")
-@patch("bili_assetizer.core.extract_frames_service._extract_frames_ffmpeg")
-@patch("bili_assetizer.core.extract_frames_service._deduplicate_frames")
-def test_extract_frames_uniform_success(
-    mock_dedupe: MagicMock,
-    mock_ffmpeg: MagicMock,
-    mock_duration: MagicMock,
+    assert result.status == StageStatus.FAILED
+    assert message in "\n".join(result.errors)
+
+
+@pytest.mark.parametrize(
+    ("extract_kwargs", "mock_frame_count", "expected_count"),
+    [
+        ({"interval_sec": 2.0}, 5, 5),
+        ({"max_frames": 3}, 3, 3),
+    ],
+    ids=["uniform", "max_frames"],
+)
+def test_extract_frames_success(
+    mock_extract_deps: ExtractMocks,
     sample_asset_with_source: Path,
+    extract_kwargs: dict,
+    mock_frame_count: int,
+    expected_count: int,
 ):
-    """Test basic uniform frame extraction works."""
+    """Test uniform frame extraction honours interval_sec and max_frames."""
+    mock_ffmpeg = mock_extract_deps.ffmpeg
     asset_dir = sample_asset_with_source
-    asset_id = asset_dir.name
 
-    # Mock successful operations
-    mock_duration.return_value = (10.0, [])  # 10 second video
-    mock_ffmpeg.return_value = []  # No errors
-
-    # Mock 5 unique frames extracted (returns tuple: frames, errors)
-    mock_dedupe.return_value = (
-        [
-            {
-                "frame_id": f"KF_{i:06d}",
-                "ts_ms": None,
-                "path": f"frames_passA/frame_{i:06d}.png",
-                "hash": f"hash_{i}",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            }
-            for i in range(1, 6)
-        ],
-        [],  # No deletion errors
+    # Mock unique frames extracted (returns tuple: frames, errors)
+    mock_ffmpeg.return_value = (
+        [_make_frame(i) for i in range(1, mock_frame_count + 1)],
+        [],  # No write errors
     )
 
     result = extract_frames(
-        asset_id=asset_id,
+        asset_id=asset_dir.name,
         assets_dir=asset_dir.parent,
-        interval_sec=2.0,
+        **extract_kwargs,
     )
 
     assert result.status == StageStatus.COMPLETED
-    assert result.frame_count == 5
+    assert result.frame_count == expected_count
     assert result.frames_file == "frames_passA.jsonl"
     assert not result.errors
+    mock_ffmpeg.assert_called_once()
+    params = mock_ffmpeg.call_args.kwargs["params"]
+    assert extract_kwargs.items() <= params.items()
 
     # Verify manifest updated
-    manifest_path = asset_dir / "manifest.json"
-    with open(manifest_path, "r") as f:
-        manifest_data = json.load(f)
-
-    assert "frames" in manifest_data["stages"]
+    manifest_data = json.loads((asset_dir / "manifest.json").read_bytes())
     frames_stage = manifest_data["stages"]["frames"]
     assert frames_stage["status"] == "completed"
-    assert frames_stage["frame_count"] == 5
-    assert frames_stage["params"]["interval_sec"] == 2.0
-
-
-@patch("bili_assetizer.core.extract_frames_service._get_video_duration")
-@patch("bili_assetizer.core.extract_frames_service._extract_frames_ffmpeg")
-@patch("bili_assetizer.core.extract_frames_service._deduplicate_frames")
-def test_extract_frames_with_max_frames(
-    mock_dedupe: MagicMock,
-    mock_ffmpeg: MagicMock,
-    mock_duration: MagicMock,
-    sample_asset_with_source: Path,
-):
-    """Test max_frames cap is respected."""
-    asset_dir = sample_asset_with_source
-    asset_id = asset_dir.name
-
-    # Mock successful operations
-    mock_duration.return_value = (20.0, [])
-    mock_ffmpeg.return_value = []
-
-    # Mock 10 unique frames extracted (returns tuple: frames, errors)
-    mock_dedupe.return_value = (
-        [
-            {
-                "frame_id": f"KF_{i:06d}",
-                "ts_ms": None,
-                "path": f"frames_passA/frame_{i:06d}.png",
-                "hash": f"hash_{i}",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            }
-            for i in range(1, 11)
-        ],
-        [],  # No deletion errors
-    )
-
-    result = extract_frames(
-        asset_id=asset_id,
-        assets_dir=asset_dir.parent,
-        max_frames=3,
-    )
-
-    assert result.status == StageStatus.COMPLETED
-    assert result.frame_count == 3  # Capped at max_frames
+    assert frames_stage["frame_count"] == expected_count
+    assert extract_kwargs.items() <= frames_stage["params"].items()
 
 
-@patch("bili_assetizer.core.extract_frames_service._get_video_duration")
-@patch("bili_assetizer.core.extract_frames_service._extract_frames_ffmpeg")
-@patch("bili_assetizer.core.extract_frames_service._deduplicate_frames")
 def test_extract_frames_idempotent(
-    mock_dedupe: MagicMock,
-    mock_ffmpeg: MagicMock,
-    mock_duration: MagicMock,
-    sample_asset_with_source: Path,
+    mock_extract_deps: ExtractMocks, extract_fn: Callable[..., ExtractFramesResult]
 ):
     """Test running extract_frames twice returns cached result."""
-    asset_dir = sample_asset_with_source
-    asset_id = asset_dir.name
-
-    # Mock successful operations
-    mock_duration.return_value = (10.0, [])
-    mock_ffmpeg.return_value = []
-    mock_dedupe.return_value = (
-        [
-            {
-                "frame_id": "KF_000001",
-                "ts_ms": None,
-                "path": "frames_passA/frame_000001.png",
-                "hash": "hash_1",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            }
-        ],
-        [],
-    )
-
-    # First extraction
-    result1 = extract_frames(
-        asset_id=asset_id,
-        assets_dir=asset_dir.parent,
-        interval_sec=3.0,
-    )
+    result1 = extract_fn(interval_sec=3.0)
 
     assert result1.status == StageStatus.COMPLETED
     assert result1.frame_count == 1
 
     # Second extraction without force (should return cached)
-    mock_duration.reset_mock()
-    mock_ffmpeg.reset_mock()
-    mock_dedupe.reset_mock()
-
-    result2 = extract_frames(
-        asset_id=asset_id,
-        assets_dir=asset_dir.parent,
-        interval_sec=3.0,
-    )
+    for mock in mock_extract_deps:
+        mock.reset_mock()
+
+    with (
+        patch(
+            "bili_assetizer.core.extract_frames_service.load_manifest",
+            wraps=load_manifest,
+        ) as spy_load,
+        patch("bili_assetizer.core.extract_frames_service.save_manifest") as spy_save,
+        patch("bili_assetizer.core.extract_frames_service.subprocess.run") as spy_run,
+    ):
+        result2 = extract_fn(interval_sec=3.0)
 
     assert result2.status == StageStatus.COMPLETED
     assert result2.frame_count == 1
-    assert any("already extracted" in err for err in result2.errors)
+    assert "already extracted" in "\n".join(result2.errors)
+
+    # The cached path reads the manifest once, writes nothing, spawns nothing
+    spy_load.assert_called_once()
+    spy_save.assert_not_called()
+    spy_run.assert_not_called()
 
     # Verify ffmpeg was not called again
-    mock_duration.assert_not_called()
-    mock_ffmpeg.assert_not_called()
-    mock_dedupe.assert_not_called()
+    for mock in mock_extract_deps:
+        mock.assert_not_called()
 
 
-@patch("bili_assetizer.core.extract_frames_service._get_video_duration")
-@patch("bili_assetizer.core.extract_frames_service._extract_frames_ffmpeg")
-@patch("bili_assetizer.core.extract_frames_service._deduplicate_frames")
 def test_extract_frames_force_overwrites(
-    mock_dedupe: MagicMock,
-    mock_ffmpeg: MagicMock,
-    mock_duration: MagicMock,
-    sample_asset_with_source: Path,
+    mock_extract_deps: ExtractMocks, extract_fn: Callable[..., ExtractFramesResult]
 ):
     """Test force flag re-extracts frames."""
-    asset_dir = sample_asset_with_source
-    asset_id = asset_dir.name
-
-    # Mock successful operations
-    mock_duration.return_value = (10.0, [])
-    mock_ffmpeg.return_value = []
-    mock_dedupe.return_value = (
-        [
-            {
-                "frame_id": "KF_000001",
-                "ts_ms": None,
-                "path": "frames_passA/frame_000001.png",
-                "hash": "hash_1",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            }
-        ],
-        [],
-    )
-
-    # First extraction
-    result1 = extract_frames(
-        asset_id=asset_id,
-        assets_dir=asset_dir.parent,
-    )
+    result1 = extract_fn()
 
     assert result1.status == StageStatus.COMPLETED
 
     # Second extraction with force
-    mock_duration.reset_mock()
-    mock_ffmpeg.reset_mock()
-    mock_dedupe.reset_mock()
+    for mock in mock_extract_deps:
+        mock.reset_mock()
 
-    mock_duration.return_value = (10.0, [])
-    mock_ffmpeg.return_value = []
-    mock_dedupe.return_value = (
-        [
-            {
-                "frame_id": "KF_000001",
-                "ts_ms": None,
-                "path": "frames_passA/frame_000001.png",
-                "hash": "hash_1",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            }
-        ],
-        [],
-    )
-
-    result2 = extract_frames(
-        asset_id=asset_id,
-        assets_dir=asset_dir.parent,
-        force=True,
-    )
+    result2 = extract_fn(force=True)
 
     assert result2.status == StageStatus.COMPLETED
-    assert not any("already extracted" in err for err in result2.errors)
+    assert "already extracted" not in "\n".join(result2.errors)
 
     # Verify ffmpeg was called again
-    mock_duration.assert_called_once()
-    mock_ffmpeg.assert_called_once()
-    mock_dedupe.assert_called_once()
+    for mock in mock_extract_deps:
+        mock.assert_called_once()
 
 
-@patch("bili_assetizer.core.extract_frames_service._get_video_duration")
-@patch("bili_assetizer.core.extract_frames_service._extract_frames_ffmpeg")
-@patch("bili_assetizer.core.extract_frames_service._deduplicate_frames")
 def test_extract_frames_params_changed(
-    mock_dedupe: MagicMock,
-    mock_ffmpeg: MagicMock,
-    mock_duration: MagicMock,
-    sample_asset_with_source: Path,
+    mock_extract_deps: ExtractMocks, extract_fn: Callable[..., ExtractFramesResult]
 ):
     """Test changing params triggers re-extraction."""
-    asset_dir = sample_asset_with_source
-    asset_id = asset_dir.name
-
-    # Mock successful operations
-    mock_duration.return_value = (10.0, [])
-    mock_ffmpeg.return_value = []
-    mock_dedupe.return_value = (
-        [
-            {
-                "frame_id": "KF_000001",
-                "ts_ms": None,
-                "path": "frames_passA/frame_000001.png",
-                "hash": "hash_1",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            }
-        ],
-        [],
-    )
-
-    # First extraction with interval_sec=3.0
-    result1 = extract_frames(
-        asset_id=asset_id,
-        assets_dir=asset_dir.parent,
-        interval_sec=3.0,
-    )
+    result1 = extract_fn(interval_sec=3.0)
 
     assert result1.status == StageStatus.COMPLETED
 
     # Second extraction with different interval_sec (should re-extract)
-    mock_duration.reset_mock()
-    mock_ffmpeg.reset_mock()
-    mock_dedupe.reset_mock()
-
-    mock_duration.return_value = (10.0, [])
-    mock_ffmpeg.return_value = []
-    mock_dedupe.return_value = (
-        [
-            {
-                "frame_id": "KF_000001",
-                "ts_ms": None,
-                "path": "frames_passA/frame_000001.png",
-                "hash": "hash_1",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            }
-        ],
-        [],
-    )
+    for mock in mock_extract_deps:
+        mock.reset_mock()
 
-    result2 = extract_frames(
-        asset_id=asset_id,
-        assets_dir=asset_dir.parent,
-        interval_sec=5.0,  # Changed
-    )
+    result2 = extract_fn(interval_sec=5.0)  # Changed
 
     assert result2.status == StageStatus.COMPLETED
-    assert not any("already extracted" in err for err in result2.errors)
+    assert "already extracted" not in "\n".join(result2.errors)
 
     # Verify ffmpeg was called again
-    mock_duration.assert_called_once()
-    mock_ffmpeg.assert_called_once()
+    mock_extract_deps.duration.assert_called_once()
+    mock_extract_deps.ffmpeg.assert_called_once()
 
 
-@patch("bili_assetizer.core.extract_frames_service._get_video_duration")
-@patch("bili_assetizer.core.extract_frames_service._extract_frames_ffmpeg")
-@patch("bili_assetizer.core.extract_frames_service._deduplicate_frames")
 def test_extract_frames_deduplication(
-    mock_dedupe: MagicMock,
-    mock_ffmpeg: MagicMock,
-    mock_duration: MagicMock,
+    mock_extract_deps: ExtractMocks,
     sample_asset_with_source: Path,
 ):
     """Test duplicate frames are handled correctly."""
+    mock_ffmpeg = mock_extract_deps.ffmpeg
     asset_dir = sample_asset_with_source
     asset_id = asset_dir.name
 
-    # Mock successful operations
-    mock_duration.return_value = (10.0, [])
-    mock_ffmpeg.return_value = []
-
     # Mock 3 frames: 2 unique, 1 duplicate
-    mock_dedupe.return_value = (
+    mock_ffmpeg.return_value = (
         [
-            {
-                "frame_id": "KF_000001",
-                "ts_ms": None,
-                "path": "frames_passA/frame_000001.png",
-                "hash": "hash_1",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            },
-            {
-                "frame_id": "KF_000002",
-                "ts_ms": None,
-                "path": None,  # Deleted
-                "hash": "hash_1",  # Same hash as frame 1
-                "source": "uniform",
-                "is_duplicate": True,
-                "duplicate_of": "KF_000001",
-            },
-            {
-                "frame_id": "KF_000003",
-                "ts_ms": None,
-                "path": "frames_passA/frame_000003.png",
-                "hash": "hash_2",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            },
+            _make_frame(1),
+            _make_frame(
+                2,
+                path=None,  # Deleted
+                hash="hash_1",  # Same hash as frame 1
+                is_duplicate=True,
+                duplicate_of="KF_000001",
+            ),
+            _make_frame(3, hash="hash_2"),
         ],
         [],
     )
@@ -440,23 +318,20 @@ def test_extract_frames_deduplication(
 
     assert result.status == StageStatus.COMPLETED
     assert result.frame_count == 2  # Only unique frames counted
+    mock_ffmpeg.assert_called_once()
 
     # Verify JSONL includes all frames (including duplicates)
     jsonl_path = asset_dir / "frames_passA.jsonl"
-    assert jsonl_path.exists()
-
-    with open(jsonl_path, "r") as f:
-        lines = f.readlines()
+    # Every row ends with a newline, so this counts rows without decoding
+    assert jsonl_path.read_bytes().count(b"\n") == 3
 
-    assert len(lines) == 3  # All frames including duplicates
 
-
-@patch("bili_assetizer.core.extract_frames_service._get_video_duration")
 def test_extract_frames_ffprobe_failure(
-    mock_duration: MagicMock,
+    mock_extract_deps: ExtractMocks,
     sample_asset_with_source: Path,
 ):
     """Test extract_frames fails when ffprobe fails."""
+    mock_duration = mock_extract_deps.duration
     asset_dir = sample_asset_with_source
     asset_id = asset_dir.name
 
@@ -469,25 +344,20 @@ def test_extract_frames_ffprobe_failure(
     )
 
     assert result.status == StageStatus.FAILED
-    assert any("ffprobe" in err for err in result.errors)
+    assert "ffprobe" in "\n".join(result.errors)
 
 
-@patch("bili_assetizer.core.extract_frames_service._get_video_duration")
-@patch("bili_assetizer.core.extract_frames_service._extract_frames_ffmpeg")
 def test_extract_frames_ffmpeg_failure(
-    mock_ffmpeg: MagicMock,
-    mock_duration: MagicMock,
+    mock_extract_deps: ExtractMocks,
     sample_asset_with_source: Path,
 ):
     """Test extract_frames fails when ffmpeg fails."""
+    mock_ffmpeg = mock_extract_deps.ffmpeg
     asset_dir = sample_asset_with_source
     asset_id = asset_dir.name
 
-    # Mock successful duration check
-    mock_duration.return_value = (10.0, [])
-
     # Mock ffmpeg failure
-    mock_ffmpeg.return_value = ["Frame extraction failed: error"]
+    mock_ffmpeg.return_value = ([], ["Frame extraction failed: error"])
 
     result = extract_frames(
         asset_id=asset_id,
@@ -495,43 +365,29 @@ def test_extract_frames_ffmpeg_failure(
     )
 
     assert result.status == StageStatus.FAILED
-    assert any("Frame extraction failed" in err for err in result.errors)
+    assert "Frame extraction failed" in "\n".join(result.errors)
 
 
-@patch("bili_assetizer.core.extract_frames_service._get_video_duration")
-@patch("bili_assetizer.core.extract_frames_service._extract_frames_ffmpeg")
-@patch("bili_assetizer.core.extract_frames_service._deduplicate_frames")
 def test_extract_frames_no_frames_found(
-    mock_dedupe: MagicMock,
-    mock_ffmpeg: MagicMock,
-    mock_duration: MagicMock,
+    mock_extract_deps: ExtractMocks,
     sample_asset_with_source: Path,
 ):
     """Test extract_frames fails when no frames are found."""
     asset_dir = sample_asset_with_source
     asset_id = asset_dir.name
 
-    # Mock successful operations but no frames
-    mock_duration.return_value = (10.0, [])
-    mock_ffmpeg.return_value = []
-    mock_dedupe.return_value = ([], [])  # No frames, no errors
-
+    # The default mocks succeed but ffmpeg yields no frames and no errors
     result = extract_frames(
         asset_id=asset_id,
         assets_dir=asset_dir.parent,
     )
 
     assert result.status == StageStatus.FAILED
-    assert any("No frames found" in err for err in result.errors)
+    assert "No frames found" in "\n".join(result.errors)
 
 
-@patch("bili_assetizer.core.extract_frames_service._get_video_duration")
-@patch("bili_assetizer.core.extract_frames_service._extract_frames_ffmpeg")
-@patch("bili_assetizer.core.extract_frames_service._deduplicate_frames")
 def test_deduplicate_preserves_timestamps(
-    mock_dedupe: MagicMock,
-    mock_ffmpeg: MagicMock,
-    mock_duration: MagicMock,
+    mock_extract_deps: ExtractMocks,
     sample_asset_with_source: Path,
 ):
     """Test that timestamps are computed from original filename, not reassigned frame_id.
@@ -539,54 +395,29 @@ def test_deduplicate_preserves_timestamps(
     Bug: If frame_000003.png (at 6.0s) becomes KF_000002 after dedup,
     its ts_ms should still be 6000, not 3000.
     """
+    mock_duration, mock_ffmpeg = mock_extract_deps.duration, mock_extract_deps.ffmpeg
     asset_dir = sample_asset_with_source
     asset_id = asset_dir.name
 
-    # Mock successful operations
     mock_duration.return_value = (12.0, [])
-    mock_ffmpeg.return_value = []
 
     # Simulate: frame_000001.png (0s), frame_000002.png (3s, duplicate of 1),
     # frame_000003.png (6s, unique), frame_000004.png (9s, unique)
     # After dedup: KF_000001 (ts=0), KF_000002 (ts=3000, dup), KF_000003 (ts=6000), KF_000004 (ts=9000)
-    mock_dedupe.return_value = (
+    mock_ffmpeg.return_value = (
         [
-            {
-                "frame_id": "KF_000001",
-                "ts_ms": 0,  # frame_000001.png at interval 3.0s
-                "path": "frames_passA/frame_000001.png",
-                "hash": "hash_1",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            },
-            {
-                "frame_id": "KF_000002",
-                "ts_ms": 3000,  # frame_000002.png - duplicate but still has correct ts
-                "path": None,
-                "hash": "hash_1",  # Same hash as frame 1
-                "source": "uniform",
-                "is_duplicate": True,
-                "duplicate_of": "KF_000001",
-            },
-            {
-                "frame_id": "KF_000003",
-                "ts_ms": 6000,  # frame_000003.png - should be 6000, not 3000
-                "path": "frames_passA/frame_000003.png",
-                "hash": "hash_2",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            },
-            {
-                "frame_id": "KF_000004",
-                "ts_ms": 9000,  # frame_000004.png
-                "path": "frames_passA/frame_000004.png",
-                "hash": "hash_3",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            },
+            _make_frame(1, ts_ms=0),  # frame_000001.png at interval 3.0s
+            _make_frame(
+                2,
+                ts_ms=3000,  # frame_000002.png - duplicate but still has correct ts
+                path=None,
+                hash="hash_1",  # Same hash as frame 1
+                is_duplicate=True,
+                duplicate_of="KF_000001",
+            ),
+            # frame_000003.png - should be 6000, not 3000
+            _make_frame(3, ts_ms=6000, hash="hash_2"),
+            _make_frame(4, ts_ms=9000, hash="hash_3"),  # frame_000004.png
         ],
         [],  # No deletion errors
     )
@@ -604,96 +435,264 @@ def test_deduplicate_preserves_timestamps(
     jsonl_path = asset_dir / "frames_passA.jsonl"
     assert jsonl_path.exists()
 
-    with open(jsonl_path, "r") as f:
-        lines = [json.loads(line) for line in f]
+    lines = list(map(json.loads, jsonl_path.read_bytes().splitlines()))
 
     # Check KF_000003 has ts_ms=6000, not ts_ms=3000
     kf_003 = next(f for f in lines if f["frame_id"] == "KF_000003")
     assert kf_003["ts_ms"] == 6000, f"Expected 6000, got {kf_003['ts_ms']}"
 
 
-@patch("bili_assetizer.core.extract_frames_service._get_video_duration")
-@patch("bili_assetizer.core.extract_frames_service._extract_frames_ffmpeg")
-@patch("bili_assetizer.core.extract_frames_service._deduplicate_frames")
-def test_max_frames_keeps_earliest_by_timestamp(
-    mock_dedupe: MagicMock,
-    mock_ffmpeg: MagicMock,
-    mock_duration: MagicMock,
-    sample_asset_with_source: Path,
+def _png(color: tuple[int, int, int]) -> bytes:
+    """Encode a tiny solid-colour PNG."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+_POPEN = "bili_assetizer.core.extract_frames_service.subprocess.Popen"
+
+
+def _fake_ffmpeg(output: bytes, returncode: int = 0, error_output: bytes = b""):
+    """Build a subprocess.Popen stand-in that streams stdout from memory.
+
+    Returns (popen_mock, procs); procs collects each fake process created.
+    """
+    procs: list[MagicMock] = []
+
+    def popen(cmd, stdout=None, stderr=None):
+        stderr.write(error_output)
+        proc = MagicMock()
+        proc.stdout = io.BytesIO(output)
+        proc.wait.return_value = returncode
+        procs.append(proc)
+        return proc
+
+    return MagicMock(side_effect=popen), procs
+
+
+def test_extract_frames_ffmpeg_single_invocation(tmp_path: Path):
+    """All frames come out of one ffmpeg process piping PNGs to stdout."""
+    images = [_png((255, 0, 0)), _png((0, 255, 0))]
+    mock_popen, procs = _fake_ffmpeg(b"".join(images))
+    frames_dir = tmp_path / "frames_passA"
+    frames_dir.mkdir()
+
+    with patch(_POPEN, mock_popen):
+        frames, errors = _extract_frames_ffmpeg(
+            video_path=tmp_path / "video.mp4",
+            params={"interval_sec": 2.0, "max_frames": None, "scene_thresh": None},
+            frames_dir=frames_dir,
+        )
+
+    assert errors == []
+    assert [f["hash"] for f in frames] == [_compute_frame_hash(d) for d in images]
+    assert [f["ts_ms"] for f in frames] == [0, 2000]
+    mock_popen.assert_called_once()
+    cmd = mock_popen.call_args.args[0]
+    assert cmd[0] == "ffmpeg"
+    assert cmd[-5:] == ["-f", "image2pipe", "-vcodec", "png", "-"]
+    assert "fps=1/2.0" in cmd[cmd.index("-vf") + 1]
+    procs[0].kill.assert_not_called()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["frames_passA"]
+
+
+def test_extract_frames_ffmpeg_stops_at_max_distinct_frames(tmp_path: Path):
+    """ffmpeg is killed once max_frames distinct frames have been read."""
+    red, green, blue = _png((255, 0, 0)), _png((0, 255, 0)), _png((0, 0, 255))
+    mock_popen, procs = _fake_ffmpeg(b"".join([red, red, green, blue, red]))
+
+    with patch(_POPEN, mock_popen):
+        frames, errors = _extract_frames_ffmpeg(
+            video_path=tmp_path / "video.mp4",
+            params={"interval_sec": 3.0, "max_frames": 2, "scene_thresh": None},
+            frames_dir=tmp_path,
+        )
+
+    assert errors == []
+    assert [f["frame_id"] for f in frames] == ["KF_000001", "KF_000002", "KF_000003"]
+    assert [f["is_duplicate"] for f in frames] == [False, True, False]
+    procs[0].kill.assert_called_once()
+
+
+def test_extract_frames_stops_at_max_frames_unique(
+    monkeypatch: pytest.MonkeyPatch, sample_asset_with_source: Path
 ):
-    """Test that max_frames keeps earliest frames by timestamp, not by frame_id."""
+    """Written files and the JSONL both end at the max_frames-th unique frame."""
     asset_dir = sample_asset_with_source
-    asset_id = asset_dir.name
+    palette = [_png((i * 40, 0, 0)) for i in range(5)]
+    stream = [palette[0], palette[1], palette[1], palette[2], palette[3], palette[4]]
+    mock_popen, _ = _fake_ffmpeg(b"".join(stream))
+    monkeypatch.setattr(
+        extract_frames_service,
+        "_get_video_duration",
+        MagicMock(return_value=(20.0, [])),
+    )
 
-    mock_duration.return_value = (20.0, [])
-    mock_ffmpeg.return_value = []
+    with patch(_POPEN, mock_popen):
+        result = extract_frames(
+            asset_id=asset_dir.name,
+            assets_dir=asset_dir.parent,
+            interval_sec=3.0,
+            max_frames=3,
+        )
 
-    # Create 5 frames with timestamps
-    mock_dedupe.return_value = (
-        [
-            {
-                "frame_id": "KF_000001",
-                "ts_ms": 0,
-                "path": "frames_passA/frame_000001.png",
-                "hash": "h1",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            },
-            {
-                "frame_id": "KF_000002",
-                "ts_ms": 3000,
-                "path": "frames_passA/frame_000002.png",
-                "hash": "h2",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            },
-            {
-                "frame_id": "KF_000003",
-                "ts_ms": 6000,
-                "path": "frames_passA/frame_000003.png",
-                "hash": "h3",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            },
-            {
-                "frame_id": "KF_000004",
-                "ts_ms": 9000,
-                "path": "frames_passA/frame_000004.png",
-                "hash": "h4",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            },
-            {
-                "frame_id": "KF_000005",
-                "ts_ms": 12000,
-                "path": "frames_passA/frame_000005.png",
-                "hash": "h5",
-                "source": "uniform",
-                "is_duplicate": False,
-                "duplicate_of": None,
-            },
-        ],
-        [],
+    assert result.status == StageStatus.COMPLETED
+    assert result.frame_count == 3
+    assert sorted(p.name for p in (asset_dir / "frames_passA").iterdir()) == [
+        "frame_000001.png",
+        "frame_000002.png",
+        "frame_000004.png",
+    ]
+    jsonl = asset_dir / "frames_passA.jsonl"
+    lines = list(map(json.loads, jsonl.read_bytes().splitlines()))
+    assert [f["frame_id"] for f in lines] == [
+        "KF_000001",
+        "KF_000002",
+        "KF_000003",
+        "KF_000004",
+    ]
+    assert sum(not f["is_duplicate"] for f in lines) == 3
+
+
+def test_extract_frames_ffmpeg_reports_stderr_on_failure(tmp_path: Path):
+    """A non-zero exit surfaces ffmpeg's stderr and discards partial frames."""
+    mock_popen, _ = _fake_ffmpeg(
+        _png((255, 0, 0)), returncode=1, error_output=b"moov atom not found"
     )
 
-    result = extract_frames(
-        asset_id=asset_id,
-        assets_dir=asset_dir.parent,
-        interval_sec=3.0,
-        max_frames=3,
+    with patch(_POPEN, mock_popen):
+        frames, errors = _extract_frames_ffmpeg(
+            video_path=tmp_path / "video.mp4",
+            params={"interval_sec": 3.0, "max_frames": None, "scene_thresh": None},
+            frames_dir=tmp_path,
+        )
+
+    assert frames == []
+    assert errors == ["Frame extraction failed: moov atom not found"]
+
+
+def test_extract_frames_ffmpeg_timeout_mid_frame(tmp_path: Path):
+    """A timeout kill that cuts a frame short is reported as a timeout."""
+    truncated = _png((255, 0, 0)) + _png((0, 0, 255))[:-4]
+    mock_popen, _ = _fake_ffmpeg(truncated, returncode=-9)
+
+    def fire_timer(interval, function):
+        # Run the kill callback straight away, as if 600 s had elapsed
+        timer = MagicMock()
+        timer.start.side_effect = function
+        return timer
+
+    with (
+        patch(_POPEN, mock_popen),
+        patch(
+            "bili_assetizer.core.extract_frames_service.threading.Timer",
+            side_effect=fire_timer,
+        ),
+    ):
+        frames, errors = _extract_frames_ffmpeg(
+            video_path=tmp_path / "video.mp4",
+            params={"interval_sec": 3.0, "max_frames": None, "scene_thresh": None},
+            frames_dir=tmp_path,
+        )
+
+    assert frames == []
+    assert errors == ["ffmpeg timed out during frame extraction"]
+
+
+def test_extract_frames_ffmpeg_crash_mid_frame_reports_stderr(tmp_path: Path):
+    """An ffmpeg crash that truncates its output surfaces ffmpeg's stderr."""
+    truncated = _png((255, 0, 0))[:-4]
+    mock_popen, _ = _fake_ffmpeg(
+        truncated, returncode=1, error_output=b"Conversion failed!"
     )
 
-    assert result.status == StageStatus.COMPLETED
-    assert result.frame_count == 3
+    with patch(_POPEN, mock_popen):
+        frames, errors = _extract_frames_ffmpeg(
+            video_path=tmp_path / "video.mp4",
+            params={"interval_sec": 3.0, "max_frames": None, "scene_thresh": None},
+            frames_dir=tmp_path,
+        )
 
-    # Verify the kept frames are the earliest by timestamp
-    jsonl_path = asset_dir / "frames_passA.jsonl"
-    with open(jsonl_path, "r") as f:
-        lines = [json.loads(line) for line in f]
+    assert frames == []
+    assert errors == ["Frame extraction failed: Conversion failed!"]
+
+
+def test_extract_frames_ffmpeg_truncated_stream_after_clean_exit(tmp_path: Path):
+    """A cut-off stream from an ffmpeg that exited 0 is reported as such."""
+    mock_popen, _ = _fake_ffmpeg(_png((255, 0, 0))[:-4])
+
+    with patch(_POPEN, mock_popen):
+        frames, errors = _extract_frames_ffmpeg(
+            video_path=tmp_path / "video.mp4",
+            params={"interval_sec": 3.0, "max_frames": None, "scene_thresh": None},
+            frames_dir=tmp_path,
+        )
+
+    assert frames == []
+    assert errors == ["Frame extraction failed: truncated PNG stream"]
+
+
+def test_read_png_frames_rejects_truncated_output():
+    """A cut-off PNG stream is reported instead of yielding a partial frame."""
+    data = _png((255, 0, 0)) + _png((0, 0, 255))[:-4]
+
+    with pytest.raises(ValueError, match="truncated"):
+        list(_read_png_frames(io.BytesIO(data)))
+
+
+def test_deduplicate_frames_writes_only_unique(tmp_path: Path):
+    """Duplicates are recorded but never written; timestamps follow stream order."""
+    red, blue = _png((255, 0, 0)), _png((0, 0, 255))
+    frames_dir = tmp_path / "frames_passA"
+    frames_dir.mkdir()
+
+    frames, errors = _deduplicate_frames(
+        [red, red, blue], frames_dir, interval_sec=3.0
+    )
+
+    assert errors == []
+    assert [f["ts_ms"] for f in frames] == [0, 3000, 6000]
+    assert all(len(f["hash"]) == 32 for f in frames)
+    assert frames[1]["is_duplicate"] and frames[1]["duplicate_of"] == "KF_000001"
+    assert sorted(p.name for p in frames_dir.iterdir()) == [
+        "frame_000001.png",
+        "frame_000003.png",
+    ]
+    assert (frames_dir / "frame_000003.png").read_bytes() == blue
+
+
+@patch("bili_assetizer.core.extract_frames_service.subprocess.run")
+def test_video_duration_probed_once_per_file_version(
+    mock_run: MagicMock, tmp_path: Path
+):
+    """ffprobe runs once for an unchanged video and again after it is rewritten."""
+    video_path = tmp_path / "video.mp4"
+    video_path.write_bytes(b"v1")
+    mock_run.return_value = MagicMock(stdout="12.5\n")
+
+    assert _get_video_duration(video_path) == (12.5, [])
+    assert _get_video_duration(video_path) == (12.5, [])
+    assert mock_run.call_count == 1
+
+    video_path.write_bytes(b"v2-longer")
+    assert _get_video_duration(video_path) == (12.5, [])
+    assert mock_run.call_count == 2
+
+
+def test_deduplicate_frames_streams_until_max_unique(tmp_path: Path):
+    """Frames are consumed lazily and reading stops at the unique-frame cap."""
+    palette = [_png((i, 0, 0)) for i in range(10)]
+    images = iter([palette[i % 3] for i in range(100)])
+
+    frames, errors = _deduplicate_frames(
+        images, tmp_path, interval_sec=1.0, max_unique=3
+    )
 
-    kept_frame_ids = {f["frame_id"] for f in lines if not f["is_duplicate"]}
-    assert kept_frame_ids == {"KF_000001", "KF_000002", "KF_000003"}
+    assert errors == []
+    assert len(frames) == 3
+    assert len(list(images)) == 97
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "frame_000001.png",
+        "frame_000002.png",
+        "frame_000003.png",
+    ]
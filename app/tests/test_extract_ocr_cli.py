@@ -2,13 +2,19 @@
 
 import json
 from pathlib import Path
-from unittest.mock import patch
-from typer.testing import CliRunner
+from typing import NamedTuple
+from unittest.mock import MagicMock
 
-from bili_assetizer.cli import app
-from bili_assetizer.core.models import AssetStatus, Manifest
+import pytest
+import typer
+from typer.testing import CliRunner, Result
 
-runner = CliRunner()
+from bili_assetizer import cli
+from bili_assetizer.cli import app, extract_ocr_cmd
+from bili_assetizer.core import extract_ocr_service
+
+# Plain output only: assertions match substrings, never styling
+runner = CliRunner(env={"NO_COLOR": "1", "TERM": "dumb"})
 
 TSV_SAMPLE = (
     "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\t"
@@ -19,64 +25,97 @@ TSV_SAMPLE = (
 )
 
 
-class TestExtractOcrCli:
-    """Tests for extract-ocr CLI command."""
+def _extract_ocr(*args: str) -> Result:
+    """Invoke extract-ocr, letting unexpected exceptions propagate."""
+    return runner.invoke(app, ["extract-ocr", *args], catch_exceptions=False)
 
-    def test_success_shows_frame_count(self, sample_asset_with_select: Path):
-        """Successful OCR should show frame count."""
-        asset_dir = sample_asset_with_select
-        asset_id = asset_dir.name
-        assets_dir = asset_dir.parent
 
-        with patch("bili_assetizer.cli.get_settings") as mock_settings:
-            mock_settings.return_value.assets_dir = assets_dir
+def _run_extract_ocr(asset_id: str, **overrides) -> int:
+    """Call the extract-ocr callback directly, bypassing Click parsing.
+
+    Returns the exit code (0 unless the command raised typer.Exit).
+    """
+    kwargs = {
+        "lang": "eng+chi_sim",
+        "psm": 6,
+        "tesseract_cmd": None,
+        "force": False,
+        "workers": None,
+        **overrides,
+    }
+    try:
+        extract_ocr_cmd(asset_id, **kwargs)
+    except typer.Exit as exc:
+        return exc.exit_code
+    return 0
 
-            with patch("bili_assetizer.core.extract_ocr_service._find_tesseract") as mock_find:
-                mock_find.return_value = ("/path/tesseract", [])
 
-                with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
-                    mock_validate.return_value = []
+def _read_ocr_params(asset_dir: Path) -> dict:
+    """Return the params recorded for the ocr stage in asset_dir's manifest."""
+    manifest = json.loads((asset_dir / "manifest.json").read_bytes())
+    return manifest["stages"]["ocr"]["params"]
 
-                    with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                        mock_run.return_value = (TSV_SAMPLE, None)
 
-                        result = runner.invoke(app, ["extract-ocr", asset_id])
+class OcrMocks(NamedTuple):
+    """Mocks standing in for settings and the tesseract helpers."""
+
+    settings: MagicMock
+    find: MagicMock
+    validate: MagicMock
+    run: MagicMock
+    run_batch: MagicMock
+
+
+class TestExtractOcrCli:
+    """Tests for extract-ocr CLI command."""
+
+    @pytest.fixture(autouse=True)
+    def ocr_mocks(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_assets_dir: Path
+    ) -> OcrMocks:
+        """Point the CLI at tmp_assets_dir and fake a working tesseract.
+
+        Tests override return_value on the mocks they care about.
+        """
+        mocks = OcrMocks(
+            settings=MagicMock(),
+            find=MagicMock(return_value=("/path/tesseract", [])),
+            validate=MagicMock(return_value=[]),
+            run=MagicMock(return_value=(TSV_SAMPLE, None)),
+            run_batch=MagicMock(
+                side_effect=lambda image_paths, *args: (
+                    [TSV_SAMPLE] * len(image_paths),
+                    None,
+                )
+            ),
+        )
+        mocks.settings.return_value.assets_dir = tmp_assets_dir
+        monkeypatch.setattr(cli, "get_settings", mocks.settings)
+        monkeypatch.setattr(extract_ocr_service, "_find_tesseract", mocks.find)
+        monkeypatch.setattr(
+            extract_ocr_service, "_validate_tesseract_language", mocks.validate
+        )
+        monkeypatch.setattr(extract_ocr_service, "_run_tesseract", mocks.run)
+        monkeypatch.setattr(
+            extract_ocr_service, "_run_tesseract_batch", mocks.run_batch
+        )
+        return mocks
+
+    def test_success_shows_frame_count(self, sample_asset_with_select: Path):
+        """Successful OCR should show frame count."""
+        asset_id = sample_asset_with_select.name
+
+        result = _extract_ocr(asset_id)
 
         assert result.exit_code == 0
         assert "COMPLETED" in result.output
         assert "Frames processed:" in result.output
 
-    def test_missing_select_shows_error(self, tmp_assets_dir: Path):
+    def test_missing_select_shows_error(self, sample_asset_without_select: Path):
         """Missing select stage should show error and exit 1."""
-        # Create asset with timeline but no select
-        asset_id = "BV1noselect"
-        asset_dir = tmp_assets_dir / asset_id
-        asset_dir.mkdir()
-
-        manifest = Manifest(
-            asset_id=asset_id,
-            source_url=f"https://www.bilibili.com/video/{asset_id}",
-            status=AssetStatus.INGESTED,
-            fingerprint="test",
-            stages={
-                "timeline": {
-                    "status": "completed",
-                    "bucket_count": 3,
-                    "timeline_file": "timeline.json",
-                    "scores_file": "frame_scores.jsonl",
-                    "params": {"bucket_sec": 15},
-                    "updated_at": "2023-01-01T00:00:00Z",
-                    "errors": [],
-                }
-            },
-        )
-        with open(asset_dir / "manifest.json", "w") as f:
-            json.dump(manifest.to_dict(), f)
+        asset_id = sample_asset_without_select.name
 
-        with patch("bili_assetizer.cli.get_settings") as mock_settings:
-            mock_settings.return_value.assets_dir = tmp_assets_dir
-
-            result = runner.invoke(app, ["extract-ocr", asset_id])
+        result = _extract_ocr(asset_id)
 
         assert result.exit_code == 1
         assert "FAILED" in result.output
@@ -86,139 +125,79 @@ class TestExtractOcrCli:
         """--lang option should be passed to service."""
         asset_dir = sample_asset_with_select
         asset_id = asset_dir.name
-        assets_dir = asset_dir.parent
-
-        with patch("bili_assetizer.cli.get_settings") as mock_settings:
-            mock_settings.return_value.assets_dir = assets_dir
-
-            with patch("bili_assetizer.core.extract_ocr_service._find_tesseract") as mock_find:
-                mock_find.return_value = ("/path/tesseract", [])
-
-                with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
-                    mock_validate.return_value = []
 
-                    with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                        mock_run.return_value = (TSV_SAMPLE, None)
-
-                        result = runner.invoke(app, ["extract-ocr", asset_id, "--lang", "eng"])
+        result = _extract_ocr(asset_id, "--lang", "eng")
 
         assert result.exit_code == 0
 
         # Verify lang was used
-        with open(asset_dir / "manifest.json") as f:
-            manifest = json.load(f)
-        assert manifest["stages"]["ocr"]["params"]["lang"] == "eng"
-        assert manifest["stages"]["ocr"]["params"]["tsv"] is True
+        params = _read_ocr_params(asset_dir)
+        assert params["lang"] == "eng"
+        assert params["tsv"] is True
 
     def test_psm_option(self, sample_asset_with_select: Path):
         """--psm option should be passed to service."""
         asset_dir = sample_asset_with_select
         asset_id = asset_dir.name
-        assets_dir = asset_dir.parent
-
-        with patch("bili_assetizer.cli.get_settings") as mock_settings:
-            mock_settings.return_value.assets_dir = assets_dir
-
-            with patch("bili_assetizer.core.extract_ocr_service._find_tesseract") as mock_find:
-                mock_find.return_value = ("/path/tesseract", [])
 
-                with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
-                    mock_validate.return_value = []
-
-                    with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                        mock_run.return_value = (TSV_SAMPLE, None)
-
-                        result = runner.invoke(app, ["extract-ocr", asset_id, "--psm", "11"])
+        result = _extract_ocr(asset_id, "--psm", "11")
 
         assert result.exit_code == 0
 
         # Verify psm was used
-        with open(asset_dir / "manifest.json") as f:
-            manifest = json.load(f)
-        assert manifest["stages"]["ocr"]["params"]["psm"] == 11
-        assert manifest["stages"]["ocr"]["params"]["tsv"] is True
+        params = _read_ocr_params(asset_dir)
+        assert params["psm"] == 11
+        assert params["tsv"] is True
 
-    def test_force_option(self, sample_asset_with_select: Path):
+    def test_force_option(
+        self, sample_asset_with_select: Path, capsys: pytest.CaptureFixture[str]
+    ):
         """--force option should trigger re-run."""
-        asset_dir = sample_asset_with_select
-        asset_id = asset_dir.name
-        assets_dir = asset_dir.parent
-
-        with patch("bili_assetizer.cli.get_settings") as mock_settings:
-            mock_settings.return_value.assets_dir = assets_dir
-
-            with patch("bili_assetizer.core.extract_ocr_service._find_tesseract") as mock_find:
-                mock_find.return_value = ("/path/tesseract", [])
-
-                with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
-                    mock_validate.return_value = []
+        asset_id = sample_asset_with_select.name
 
-                    with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                        mock_run.return_value = (TSV_SAMPLE, None)
+        # First OCR
+        assert _run_extract_ocr(asset_id) == 0
 
-                        # First OCR
-                        result1 = runner.invoke(app, ["extract-ocr", asset_id])
-                        assert result1.exit_code == 0
+        # Second OCR without force (should show cached)
+        assert _run_extract_ocr(asset_id) == 0
+        assert "already done" in capsys.readouterr().out
 
-                        # Second OCR without force (should show cached)
-                        result2 = runner.invoke(app, ["extract-ocr", asset_id])
-                        assert result2.exit_code == 0
-                        assert "already done" in result2.output
-
-                        # Third OCR with force (should re-run)
-                        result3 = runner.invoke(app, ["extract-ocr", asset_id, "--force"])
-                        assert result3.exit_code == 0
-                        assert "already done" not in result3.output
+        # Third OCR with force through the CLI (should re-run)
+        result = _extract_ocr(asset_id, "--force")
+        assert result.exit_code == 0
+        assert "already done" not in result.output
 
     def test_shows_output_file(self, sample_asset_with_select: Path):
         """Should show output file path."""
-        asset_dir = sample_asset_with_select
-        asset_id = asset_dir.name
-        assets_dir = asset_dir.parent
-
-        with patch("bili_assetizer.cli.get_settings") as mock_settings:
-            mock_settings.return_value.assets_dir = assets_dir
-
-            with patch("bili_assetizer.core.extract_ocr_service._find_tesseract") as mock_find:
-                mock_find.return_value = ("/path/tesseract", [])
-
-                with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
-                    mock_validate.return_value = []
+        asset_id = sample_asset_with_select.name
 
-                    with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                        mock_run.return_value = (TSV_SAMPLE, None)
-
-                        result = runner.invoke(app, ["extract-ocr", asset_id])
+        result = _extract_ocr(asset_id)
 
         assert result.exit_code == 0
         assert "Output: frames_ocr.jsonl" in result.output
         assert "Structured: frames_ocr_structured.jsonl" in result.output
 
-    def test_asset_not_found(self, tmp_assets_dir: Path):
+    def test_asset_not_found(self):
         """Non-existent asset should fail with error."""
-        with patch("bili_assetizer.cli.get_settings") as mock_settings:
-            mock_settings.return_value.assets_dir = tmp_assets_dir
-
-            result = runner.invoke(app, ["extract-ocr", "nonexistent"])
+        result = _extract_ocr("nonexistent")
 
         assert result.exit_code == 1
         assert "Asset not found" in result.output
 
-    def test_tesseract_not_found_shows_install_message(self, sample_asset_with_select: Path):
+    def test_tesseract_not_found_shows_install_message(
+        self, ocr_mocks: OcrMocks, sample_asset_with_select: Path
+    ):
         """Should show helpful install message when tesseract not found."""
-        asset_dir = sample_asset_with_select
-        asset_id = asset_dir.name
-        assets_dir = asset_dir.parent
-
-        with patch("bili_assetizer.cli.get_settings") as mock_settings:
-            mock_settings.return_value.assets_dir = assets_dir
-
-            with patch("bili_assetizer.core.extract_ocr_service._find_tesseract") as mock_find:
-                mock_find.return_value = (None, [
-                    "Tesseract not found. Install from https://github.com/tesseract-ocr/tesseract"
-                ])
+        asset_id = sample_asset_with_select.name
+        ocr_mocks.find.return_value = (
+            None,
+            [
+                "Tesseract not found. Install from "
+                "https://github.com/tesseract-ocr/tesseract"
+            ],
+        )
 
-                result = runner.invoke(app, ["extract-ocr", asset_id])
+        result = _extract_ocr(asset_id)
 
         assert result.exit_code == 1
         assert "Tesseract not found" in result.output
@@ -226,27 +205,12 @@ class TestExtractOcrCli:
 
     def test_short_options(self, sample_asset_with_select: Path):
         """Short options -l and -f should work."""
-        asset_dir = sample_asset_with_select
-        asset_id = asset_dir.name
-        assets_dir = asset_dir.parent
-
-        with patch("bili_assetizer.cli.get_settings") as mock_settings:
-            mock_settings.return_value.assets_dir = assets_dir
-
-            with patch("bili_assetizer.core.extract_ocr_service._find_tesseract") as mock_find:
-                mock_find.return_value = ("/path/tesseract", [])
+        asset_id = sample_asset_with_select.name
 
-                with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
-                    mock_validate.return_value = []
+        # First run
+        assert _run_extract_ocr(asset_id, lang="eng") == 0
 
-                    with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                        mock_run.return_value = (TSV_SAMPLE, None)
-
-                        # First run
-                        result1 = runner.invoke(app, ["extract-ocr", asset_id, "-l", "eng"])
-                        assert result1.exit_code == 0
-
-                        # Force with -f
-                        result2 = runner.invoke(app, ["extract-ocr", asset_id, "-l", "eng", "-f"])
-                        assert result2.exit_code == 0
-                        assert "already done" not in result2.output
+        # Force with -f
+        result = _extract_ocr(asset_id, "-l", "eng", "-f")
+        assert result.exit_code == 0
+        assert "already done" not in result.output
@@ -1,6 +1,7 @@
 """Tests for extract_ocr_service."""
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,8 +10,11 @@ from bili_assetizer.core.extract_ocr_service import (
     _find_tesseract,
     _normalize_text,
     _parse_tsv,
+    _ocr_images,
     _validate_tesseract_language,
     _run_tesseract,
+    _run_tesseract_batch,
+    _split_tsv_pages,
 )
 from bili_assetizer.core.models import AssetStatus, Manifest, StageStatus
 
@@ -23,6 +27,11 @@ TSV_SAMPLE = (
 )
 
 
+def _batch_tsv(image_paths, *args):
+    """Stand-in for _run_tesseract_batch: TSV_SAMPLE for every image."""
+    return [TSV_SAMPLE] * len(image_paths), None
+
+
 class TestFindTesseract:
     """Tests for _find_tesseract function."""
 
@@ -162,6 +171,143 @@ class TestRunTesseract:
             assert "timeout" in error.lower()
 
 
+class TestRunTesseractBatch:
+    """Tests for batched tesseract runs over a list file."""
+
+    TWO_PAGE_TSV = (
+        "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\t"
+        "height\tconf\ttext\n"
+        "1\t1\t0\t0\t0\t0\t0\t0\t320\t240\t-1\t\n"
+        "5\t1\t1\t1\t1\t1\t10\t20\t50\t40\t95.5\tHello\n"
+        "1\t2\t0\t0\t0\t0\t0\t0\t320\t240\t-1\t\n"
+        "5\t2\t1\t1\t1\t1\t70\t20\t60\t40\t96.2\tWorld\n"
+    )
+
+    def test_splits_pages_in_input_order(self, tmp_path: Path):
+        """Each image gets its own page-1 TSV and the list file is removed."""
+        image_paths = [tmp_path / "a.png", tmp_path / "b.png"]
+        listed = []
+
+        def fake_run(cmd, **kwargs):
+            listed.append(Path(cmd[1]).read_text(encoding="utf-8"))
+            return MagicMock(returncode=0, stdout=self.TWO_PAGE_TSV, stderr="")
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            pages, error = _run_tesseract_batch(
+                image_paths, "/path/tesseract", "eng", 6
+            )
+
+        assert error is None
+        assert listed == ["".join(f"{path.resolve()}\n" for path in image_paths)]
+        assert not Path(mock_run.call_args.args[0][1]).exists()
+        assert [_parse_tsv(page)[0][0]["text"] for page in pages] == ["Hello", "World"]
+        words = [word for page in pages for word in _parse_tsv(page)[0]]
+        assert [word["page_num"] for word in words] == [1, 1]
+
+    def test_missing_page_is_error(self, tmp_path: Path):
+        """Output with fewer pages than images must not be misattributed."""
+        image_paths = [tmp_path / "a.png", tmp_path / "b.png", tmp_path / "c.png"]
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout=self.TWO_PAGE_TSV, stderr=""
+            )
+            pages, error = _run_tesseract_batch(
+                image_paths, "/path/tesseract", "eng", 6
+            )
+
+        assert pages == []
+        assert "3 pages" in error
+
+    def test_split_rejects_out_of_range_page(self):
+        """A page number beyond the batch invalidates the split."""
+        assert _split_tsv_pages(self.TWO_PAGE_TSV, 1) is None
+
+    def test_failed_batch_retried_per_image(self, tmp_path: Path):
+        """A failed batch falls back to one tesseract run per image."""
+        image_paths = [tmp_path / "a.png", tmp_path / "b.png"]
+
+        with (
+            patch(
+                "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+                return_value=([], "Tesseract TSV batch error"),
+            ) as mock_batch,
+            patch(
+                "bili_assetizer.core.extract_ocr_service._run_tesseract",
+                return_value=(TSV_SAMPLE, None),
+            ) as mock_single,
+        ):
+            outputs = _ocr_images(image_paths, "/path/tesseract", "eng", 6)
+
+        mock_batch.assert_called_once()
+        assert mock_single.call_count == 2
+        assert outputs == {path: (TSV_SAMPLE, None) for path in image_paths}
+
+    def test_images_batched_in_one_call(self, tmp_path: Path):
+        """All images up to the batch size share one tesseract process."""
+        image_paths = [tmp_path / f"{i}.png" for i in range(3)]
+
+        with (
+            patch(
+                "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+                side_effect=_batch_tsv,
+            ) as mock_batch,
+            patch(
+                "bili_assetizer.core.extract_ocr_service._run_tesseract"
+            ) as mock_single,
+        ):
+            outputs = _ocr_images(image_paths, "/path/tesseract", "eng", 6)
+
+        mock_batch.assert_called_once()
+        mock_single.assert_not_called()
+        assert outputs == {path: (TSV_SAMPLE, None) for path in image_paths}
+
+    def test_images_split_across_workers(self, tmp_path: Path):
+        """Batches are sized so each worker gets a share of the images."""
+        image_paths = [tmp_path / f"{i}.png" for i in range(20)]
+
+        with patch(
+            "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+            side_effect=_batch_tsv,
+        ) as mock_batch:
+            outputs = _ocr_images(image_paths, "/path/tesseract", "eng", 6, workers=2)
+
+        assert mock_batch.call_count == 2
+        batch_sizes = sorted(len(c.args[0]) for c in mock_batch.call_args_list)
+        assert batch_sizes == [10, 10]
+        assert outputs == {path: (TSV_SAMPLE, None) for path in image_paths}
+
+    def test_parallel_workers_limit_openmp_threads(self, tmp_path: Path):
+        """Each parallel tesseract process is held to one OpenMP thread."""
+        image_paths = [tmp_path / f"{i}.png" for i in range(20)]
+
+        with patch(
+            "bili_assetizer.core.extract_ocr_service.subprocess.run",
+            return_value=MagicMock(returncode=0, stdout=TSV_SAMPLE, stderr=""),
+        ) as mock_run:
+            _ocr_images(image_paths, "/path/tesseract", "eng", 6, workers=2)
+
+        assert mock_run.call_count > 1
+        for call in mock_run.call_args_list:
+            env = call.kwargs["env"]
+            assert env["OMP_THREAD_LIMIT"] == "1"
+            assert env["PATH"] == os.environ["PATH"]
+
+    def test_single_worker_uses_one_batch(self, tmp_path: Path):
+        """A single worker keeps all images in one tesseract process."""
+        image_paths = [tmp_path / f"{i}.png" for i in range(20)]
+
+        with patch(
+            "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+            side_effect=_batch_tsv,
+        ) as mock_batch:
+            _ocr_images(image_paths, "/path/tesseract", "eng", 6, workers=1)
+
+        mock_batch.assert_called_once()
+        # A lone process keeps tesseract's own OpenMP threading
+        assert mock_batch.call_args.args[4] is None
+
+
 class TestParseTsv:
     """Tests for TSV parsing."""
 
@@ -279,36 +425,13 @@ class TestExtractOcr:
         assert result.status == StageStatus.FAILED
         assert "Asset not found" in result.errors[0]
 
-    def test_select_stage_missing(self, tmp_assets_dir: Path):
+    def test_select_stage_missing(self, sample_asset_without_select: Path):
         """Should fail when select stage is missing."""
-        # Create asset with timeline but no select
-        asset_id = "BV1noselect"
-        asset_dir = tmp_assets_dir / asset_id
-        asset_dir.mkdir()
-
-        manifest = Manifest(
-            asset_id=asset_id,
-            source_url=f"https://www.bilibili.com/video/{asset_id}",
-            status=AssetStatus.INGESTED,
-            fingerprint="test",
-            stages={
-                "timeline": {
-                    "status": "completed",
-                    "bucket_count": 3,
-                    "timeline_file": "timeline.json",
-                    "scores_file": "frame_scores.jsonl",
-                    "params": {"bucket_sec": 15},
-                    "updated_at": "2023-01-01T00:00:00Z",
-                    "errors": [],
-                }
-            },
-        )
-        with open(asset_dir / "manifest.json", "w") as f:
-            json.dump(manifest.to_dict(), f)
+        asset_dir = sample_asset_without_select
 
         result = extract_ocr(
-            asset_id=asset_id,
-            assets_dir=tmp_assets_dir,
+            asset_id=asset_dir.name,
+            assets_dir=asset_dir.parent,
         )
 
         assert result.status == StageStatus.FAILED
@@ -398,8 +521,10 @@ class TestExtractOcr:
             with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
                 mock_validate.return_value = []
 
-                with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                    mock_run.return_value = (TSV_SAMPLE, None)
+                with patch(
+                    "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+                    side_effect=_batch_tsv,
+                ):
 
                     result = extract_ocr(
                         asset_id=asset_id,
@@ -445,8 +570,10 @@ class TestExtractOcr:
             with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
                 mock_validate.return_value = []
 
-                with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                    mock_run.return_value = (TSV_SAMPLE, None)
+                with patch(
+                    "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+                    side_effect=_batch_tsv,
+                ):
 
                     # First OCR
                     result1 = extract_ocr(asset_id=asset_id, assets_dir=assets_dir)
@@ -470,8 +597,10 @@ class TestExtractOcr:
             with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
                 mock_validate.return_value = []
 
-                with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                    mock_run.return_value = (TSV_SAMPLE, None)
+                with patch(
+                    "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+                    side_effect=_batch_tsv,
+                ):
 
                     # First OCR with default params
                     result1 = extract_ocr(asset_id=asset_id, assets_dir=assets_dir, lang="eng")
@@ -494,8 +623,10 @@ class TestExtractOcr:
             with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
                 mock_validate.return_value = []
 
-                with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                    mock_run.return_value = (TSV_SAMPLE, None)
+                with patch(
+                    "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+                    side_effect=_batch_tsv,
+                ):
 
                     # First OCR
                     result1 = extract_ocr(asset_id=asset_id, assets_dir=assets_dir)
@@ -518,8 +649,10 @@ class TestExtractOcr:
             with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
                 mock_validate.return_value = []
 
-                with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                    mock_run.return_value = (TSV_SAMPLE, None)
+                with patch(
+                    "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+                    side_effect=_batch_tsv,
+                ):
 
                     extract_ocr(asset_id=asset_id, assets_dir=assets_dir)
 
@@ -549,8 +682,10 @@ class TestExtractOcr:
             with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
                 mock_validate.return_value = []
 
-                with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                    mock_run.return_value = (TSV_SAMPLE, None)
+                with patch(
+                    "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+                    side_effect=_batch_tsv,
+                ):
 
                     extract_ocr(asset_id=asset_id, assets_dir=assets_dir)
 
@@ -589,7 +724,17 @@ class TestExtractOcr:
             with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
                 mock_validate.return_value = []
 
-                with patch("bili_assetizer.core.extract_ocr_service._run_tesseract", side_effect=mock_run_tesseract):
+                # A failed batch is retried image by image
+                with (
+                    patch(
+                        "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+                        return_value=([], "Tesseract TSV batch error"),
+                    ),
+                    patch(
+                        "bili_assetizer.core.extract_ocr_service._run_tesseract",
+                        side_effect=mock_run_tesseract,
+                    ),
+                ):
                     result = extract_ocr(asset_id=asset_id, assets_dir=assets_dir)
 
         # Should still complete successfully
@@ -636,6 +781,17 @@ class TestPsmValidation:
         assert result.status == StageStatus.FAILED
         assert "PSM must be 0-13" in result.errors[0]
 
+    def test_invalid_workers_rejected(self, tmp_assets_dir: Path):
+        """Should fail early when fewer than one OCR worker is requested."""
+        result = extract_ocr(
+            asset_id="any_asset",
+            assets_dir=tmp_assets_dir,
+            workers=0,
+        )
+
+        assert result.status == StageStatus.FAILED
+        assert "OCR workers must be at least 1" in result.errors[0]
+
     def test_valid_psm_accepted(self, sample_asset_with_select: Path):
         """Should accept valid PSM values."""
         asset_dir = sample_asset_with_select
@@ -648,8 +804,10 @@ class TestPsmValidation:
             with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
                 mock_validate.return_value = []
 
-                with patch("bili_assetizer.core.extract_ocr_service._run_tesseract") as mock_run:
-                    mock_run.return_value = (TSV_SAMPLE, None)
+                with patch(
+                    "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+                    side_effect=_batch_tsv,
+                ):
 
                     # Test valid PSM values
                     for psm in [0, 6, 13]:
@@ -684,7 +842,17 @@ class TestOcrFailureThreshold:
             with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
                 mock_validate.return_value = []
 
-                with patch("bili_assetizer.core.extract_ocr_service._run_tesseract", side_effect=mock_run_tesseract):
+                # A failed batch is retried image by image
+                with (
+                    patch(
+                        "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+                        return_value=([], "Tesseract TSV batch error"),
+                    ),
+                    patch(
+                        "bili_assetizer.core.extract_ocr_service._run_tesseract",
+                        side_effect=mock_run_tesseract,
+                    ),
+                ):
                     result = extract_ocr(asset_id=asset_id, assets_dir=assets_dir)
 
         # Should fail because 100% error rate > 50% threshold
@@ -712,7 +880,17 @@ class TestOcrFailureThreshold:
             with patch("bili_assetizer.core.extract_ocr_service._validate_tesseract_language") as mock_validate:
                 mock_validate.return_value = []
 
-                with patch("bili_assetizer.core.extract_ocr_service._run_tesseract", side_effect=mock_run_tesseract):
+                # A failed batch is retried image by image
+                with (
+                    patch(
+                        "bili_assetizer.core.extract_ocr_service._run_tesseract_batch",
+                        return_value=([], "Tesseract TSV batch error"),
+                    ),
+                    patch(
+                        "bili_assetizer.core.extract_ocr_service._run_tesseract",
+                        side_effect=mock_run_tesseract,
+                    ),
+                ):
                     result = extract_ocr(asset_id=asset_id, assets_dir=assets_dir)
 
         # Should succeed because 33% error rate < 50% threshold
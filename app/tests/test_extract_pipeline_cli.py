@@ -49,6 +49,8 @@ def test_cli_extract_pipeline_success(mock_extract: MagicMock):
             "eng",
             "--psm",
             "7",
+            "--ocr-workers",
+            "2",
             "--transcript-provider",
             "tencent",
             "--transcript-format",
@@ -71,6 +73,7 @@ def test_cli_extract_pipeline_success(mock_extract: MagicMock):
     assert options.top_buckets == 5
     assert options.ocr_lang == "eng"
     assert options.ocr_psm == 7
+    assert options.ocr_workers == 2
     assert options.transcript_provider == "tencent"
     assert options.transcript_format == 1
     assert options.until_stage == "frames"
@@ -1,7 +1,9 @@
 """Tests for extract_select_service."""
 
 import json
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -459,3 +461,39 @@ class TestExtractSelect:
             assert "src_path" in frame
             assert "dst_path" in frame
             assert "bucket_index" in frame
+
+    def test_selected_frames_match_source(self, sample_asset_with_timeline: Path):
+        """Selected frames should have the same content as their source frames."""
+        asset_dir = sample_asset_with_timeline
+
+        extract_select(asset_id=asset_dir.name, assets_dir=asset_dir.parent)
+
+        with open(asset_dir / "selected.json") as f:
+            selected = json.load(f)
+
+        for frame in selected["frames"]:
+            src = asset_dir / frame["src_path"]
+            dst = asset_dir / frame["dst_path"]
+            assert dst.read_bytes() == src.read_bytes()
+
+    def test_falls_back_to_copy_when_link_fails(
+        self, sample_asset_with_timeline: Path
+    ):
+        """Should copy frames when hardlinking is not supported."""
+        asset_dir = sample_asset_with_timeline
+
+        with patch(
+            "bili_assetizer.core.extract_select_service.os.link",
+            side_effect=OSError("cross-device link"),
+        ):
+            result = extract_select(
+                asset_id=asset_dir.name, assets_dir=asset_dir.parent
+            )
+
+        assert result.status == StageStatus.COMPLETED
+        selected_files = list((asset_dir / "frames_selected").glob("*.png"))
+        assert len(selected_files) == result.frame_count
+        for path in selected_files:
+            src = asset_dir / "frames_passA" / path.name
+            assert not os.path.samefile(src, path)
+            assert path.read_bytes() == src.read_bytes()
@@ -3,6 +3,7 @@
 import json
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from bili_assetizer.core.index_service import index_asset
 from bili_assetizer.core.db import get_connection, init_evidence_schema
@@ -96,6 +97,24 @@ def test_successful_index(
         assert fts_count >= 5
 
 
+def test_index_refreshes_planner_stats(
+    sample_asset_with_transcript: Path, tmp_db_path: Path
+) -> None:
+    """Indexing records sqlite_stat1 rows for the evidence table."""
+    index_asset(
+        asset_id=sample_asset_with_transcript.name,
+        assets_dir=sample_asset_with_transcript.parent,
+        db_path=tmp_db_path,
+        force=False,
+    )
+
+    with get_connection(tmp_db_path) as conn:
+        cursor = conn.execute(
+            "SELECT COUNT(*) AS cnt FROM sqlite_stat1 WHERE tbl = 'evidence'"
+        )
+        assert cursor.fetchone()["cnt"] > 0
+
+
 def test_index_chinese_content(
     sample_asset_with_chinese_transcript: Path, tmp_db_path: Path
 ) -> None:
@@ -209,6 +228,28 @@ def test_manifest_updated(sample_asset_with_transcript: Path, tmp_db_path: Path)
     assert index_stage["ocr_count"] == 2
 
 
+def test_manifest_intact_when_update_fails(
+    sample_asset_with_transcript: Path, tmp_db_path: Path
+) -> None:
+    """A failed manifest write leaves the previous manifest.json untouched."""
+    manifest_path = sample_asset_with_transcript / "manifest.json"
+    original = manifest_path.read_bytes()
+
+    with patch(
+        "bili_assetizer.core.manifest_utils.Path.replace",
+        side_effect=OSError("disk full"),
+    ):
+        result = index_asset(
+            asset_id=sample_asset_with_transcript.name,
+            assets_dir=sample_asset_with_transcript.parent,
+            db_path=tmp_db_path,
+        )
+
+    assert "Failed to update manifest: disk full" in result.errors
+    assert manifest_path.read_bytes() == original
+    assert list(sample_asset_with_transcript.glob("*.tmp")) == []
+
+
 def test_empty_transcript_file(tmp_assets_dir: Path, tmp_db_path: Path) -> None:
     """Test handling of empty transcript file."""
     from datetime import datetime, timezone
@@ -208,6 +208,24 @@ class TestSaveManifest:
         assert loaded.status == original.status
         assert loaded.fingerprint == original.fingerprint
 
+    def test_replaces_file_atomically(self, tmp_path: Path):
+        """An existing manifest is swapped by rename, leaving no temp files."""
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text("{}", encoding="utf-8")
+        old_inode = manifest_path.stat().st_ino
+
+        save_manifest(
+            tmp_path,
+            Manifest(
+                asset_id="BV1atomic",
+                source_url="https://bilibili.com/video/BV1atomic",
+                status=AssetStatus.INGESTED,
+            ),
+        )
+
+        assert manifest_path.stat().st_ino != old_inode
+        assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
+
 
 class TestIngestVideo:
     """Tests for ingest_video function."""
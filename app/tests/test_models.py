@@ -1,5 +1,6 @@
 """Tests for data models."""
 
+import json
 import pytest
 from datetime import datetime, timezone
 
@@ -209,6 +210,28 @@ class TestManifest:
         assert result.fingerprint == original.fingerprint
         assert len(result.errors) == 1
 
+    def test_to_json_matches_to_dict(self):
+        """to_json encodes the same data as to_dict."""
+        manifest = Manifest(
+            asset_id="BV1json",
+            source_url="https://www.bilibili.com/video/BV1json",
+            status=AssetStatus.INGESTED,
+            stages={"source": {"status": "completed", "errors": ["视频缺失"]}},
+        )
+        text = manifest.to_json()
+        assert json.loads(text) == manifest.to_dict()
+        assert "视频缺失" in text
+        assert "\n" in text
+
+    def test_to_json_compact(self):
+        """to_json with indent=None produces single-line output."""
+        manifest = Manifest(
+            asset_id="BV1json",
+            source_url="https://www.bilibili.com/video/BV1json",
+            status=AssetStatus.PENDING,
+        )
+        assert "\n" not in manifest.to_json(indent=None)
+
 
 class TestOwnerInfo:
     """Tests for OwnerInfo dataclass."""
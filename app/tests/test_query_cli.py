@@ -14,24 +14,15 @@ from bili_assetizer.core.index_service import index_asset
 runner = CliRunner()
 
 
-def test_query_command_success(
-    sample_asset_with_transcript: Path, tmp_db_path: Path
-) -> None:
+def test_query_command_success(indexed_transcript_asset: tuple[Path, Path]) -> None:
     """Test successful query command."""
-    asset_id = sample_asset_with_transcript.name
-    assets_dir = sample_asset_with_transcript.parent
-
-    # Index first
-    index_asset(
-        asset_id=asset_id,
-        assets_dir=assets_dir,
-        db_path=tmp_db_path,
-        force=False,
-    )
+    asset_dir, db_path = indexed_transcript_asset
+    asset_id = asset_dir.name
+    assets_dir = asset_dir.parent
 
     with patch("bili_assetizer.cli.get_settings") as mock_settings:
         mock_settings.return_value.assets_dir = assets_dir
-        mock_settings.return_value.db_path = tmp_db_path
+        mock_settings.return_value.db_path = db_path
 
         result = runner.invoke(app, ["query", asset_id, "--q", "Python"])
 
@@ -40,24 +31,15 @@ def test_query_command_success(
         assert "Found:" in result.output
 
 
-def test_query_command_no_results(
-    sample_asset_with_transcript: Path, tmp_db_path: Path
-) -> None:
+def test_query_command_no_results(indexed_transcript_asset: tuple[Path, Path]) -> None:
     """Test query command with no results."""
-    asset_id = sample_asset_with_transcript.name
-    assets_dir = sample_asset_with_transcript.parent
-
-    # Index first
-    index_asset(
-        asset_id=asset_id,
-        assets_dir=assets_dir,
-        db_path=tmp_db_path,
-        force=False,
-    )
+    asset_dir, db_path = indexed_transcript_asset
+    asset_id = asset_dir.name
+    assets_dir = asset_dir.parent
 
     with patch("bili_assetizer.cli.get_settings") as mock_settings:
         mock_settings.return_value.assets_dir = assets_dir
-        mock_settings.return_value.db_path = tmp_db_path
+        mock_settings.return_value.db_path = db_path
 
         result = runner.invoke(
             app, ["query", asset_id, "--q", "quantum entanglement"]
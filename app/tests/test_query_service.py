@@ -55,25 +55,16 @@ def test_no_evidence_schema(tmp_db_path: Path) -> None:
     assert any("not initialized" in e.lower() for e in result.errors)
 
 
-def test_no_results(sample_asset_with_transcript: Path, tmp_db_path: Path) -> None:
+def test_no_results(indexed_transcript_asset: tuple[Path, Path]) -> None:
     """Test querying for content that doesn't exist."""
-    asset_id = sample_asset_with_transcript.name
-    assets_dir = sample_asset_with_transcript.parent
-
-    # Index the asset first
-    index_result = index_asset(
-        asset_id=asset_id,
-        assets_dir=assets_dir,
-        db_path=tmp_db_path,
-        force=False,
-    )
-    assert index_result.status == StageStatus.COMPLETED
+    asset_dir, db_path = indexed_transcript_asset
+    asset_id = asset_dir.name
 
     # Query for non-existent content
     result = query_asset(
         asset_id=asset_id,
         query="quantum physics relativity",
-        db_path=tmp_db_path,
+        db_path=db_path,
         top_k=8,
     )
 
@@ -82,27 +73,16 @@ def test_no_results(sample_asset_with_transcript: Path, tmp_db_path: Path) -> No
     assert len(result.errors) == 0
 
 
-def test_finds_matching_content(
-    sample_asset_with_transcript: Path, tmp_db_path: Path
-) -> None:
+def test_finds_matching_content(indexed_transcript_asset: tuple[Path, Path]) -> None:
     """Test that query finds matching content with snippets."""
-    asset_id = sample_asset_with_transcript.name
-    assets_dir = sample_asset_with_transcript.parent
-
-    # Index the asset first
-    index_result = index_asset(
-        asset_id=asset_id,
-        assets_dir=assets_dir,
-        db_path=tmp_db_path,
-        force=False,
-    )
-    assert index_result.status == StageStatus.COMPLETED
+    asset_dir, db_path = indexed_transcript_asset
+    asset_id = asset_dir.name
 
     # Query for "Python" which appears in transcript
     result = query_asset(
         asset_id=asset_id,
         query="Python",
-        db_path=tmp_db_path,
+        db_path=db_path,
         top_k=8,
     )
 